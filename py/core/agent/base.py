@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from abc import ABCMeta
 from typing import AsyncGenerator, Generator, Optional
 
@@ -44,6 +45,34 @@ class R2RAgent(Agent, metaclass=CombinedMeta):
     def _reset(self):
         self._completed = False
         self.conversation = Conversation()
+        self._iterations = 0
+        self._start_time = time.monotonic()
+
+    def _remaining_time(self) -> Optional[float]:
+        if self.config.max_duration_seconds is None:
+            return None
+        return self.config.max_duration_seconds - (
+            time.monotonic() - self._start_time
+        )
+
+    def _tools_enabled(self) -> bool:
+        """
+        Tools are withdrawn once the iteration or wall-clock budget is spent,
+        which forces the model to answer with what it has gathered so far.
+        """
+        if self._iterations >= self.config.max_iterations - 1:
+            return False
+        remaining = self._remaining_time()
+        return remaining is None or remaining > 0
+
+    def _tool_timeout(self) -> Optional[float]:
+        remaining = self._remaining_time()
+        if remaining is None:
+            return self.config.tool_timeout_seconds
+        remaining = max(remaining, 0.0)
+        if self.config.tool_timeout_seconds is None:
+            return remaining
+        return min(self.config.tool_timeout_seconds, remaining)
 
     @syncable
     async def arun(
@@ -61,9 +90,15 @@ class R2RAgent(Agent, metaclass=CombinedMeta):
             for message in messages:
                 await self.conversation.add_message(message)
 
-        while not self._completed:
+        while (
+            not self._completed
+            and self._iterations < self.config.max_iterations
+        ):
             messages_list = await self.conversation.get_messages()
-            generation_config = self.get_generation_config(messages_list[-1])
+            generation_config = self.get_generation_config(
+                messages_list[-1], tools_enabled=self._tools_enabled()
+            )
+            self._iterations += 1
             response = await self.llm_provider.aget_completion(
                 messages_list,
                 generation_config,
@@ -93,20 +128,27 @@ class R2RAgent(Agent, metaclass=CombinedMeta):
         if not self._completed:
             message = response.choices[0].message
             if message.function_call:
-                await self.handle_function_or_tool_call(
-                    message.function_call.name,
-                    message.function_call.arguments,
+                await self.handle_tool_calls(
+                    [
+                        (
+                            message.function_call.name,
+                            message.function_call.arguments,
+                        )
+                    ],
                     *args,
+                    timeout=self._tool_timeout(),
                     **kwargs,
                 )
             elif message.tool_calls:
-                for tool_call in message.tool_calls:
-                    await self.handle_function_or_tool_call(
-                        tool_call.function.name,
-                        tool_call.function.arguments,
-                        *args,
-                        **kwargs,
-                    )
+                await self.handle_tool_calls(
+                    [
+                        (tool_call.function.name, tool_call.function.arguments)
+                        for tool_call in message.tool_calls
+                    ],
+                    *args,
+                    timeout=self._tool_timeout(),
+                    **kwargs,
+                )
             else:
                 await self.conversation.add_message(
                     Message(role="assistant", content=message.content)
@@ -129,12 +171,18 @@ class R2RStreamingAgent(R2RAgent):
             for message in messages:
                 await self.conversation.add_message(message)
 
-        while not self._completed:
+        while (
+            not self._completed
+            and self._iterations < self.config.max_iterations
+        ):
             messages_list = await self.conversation.get_messages()
 
             generation_config = self.get_generation_config(
-                messages_list[-1], stream=True
+                messages_list[-1],
+                stream=True,
+                tools_enabled=self._tools_enabled(),
             )
+            self._iterations += 1
             stream = self.llm_provider.aget_completion_stream(
                 messages_list,
                 generation_config,
@@ -160,6 +208,9 @@ class R2RStreamingAgent(R2RAgent):
         function_name = None
         function_arguments = ""
         content_buffer = ""
+        # Tool call deltas arrive in fragments keyed by index; they are
+        # accumulated and executed together once the turn is finished.
+        pending_tool_calls: dict[int, dict[str, str]] = {}
 
         async for chunk in stream:
             delta = chunk.choices[0].delta
@@ -168,28 +219,20 @@ class R2RStreamingAgent(R2RAgent):
                     if not tool_call.function:
                         logger.info("Tool function not found in tool call.")
                         continue
-                    name = tool_call.function.name
-                    if not name:
-                        logger.info("Tool name not found in tool call.")
-                        continue
-                    arguments = tool_call.function.arguments
-                    if not arguments:
-                        logger.info("Tool arguments not found in tool call.")
-                        continue
-
-                    results = await self.handle_function_or_tool_call(
-                        name,
-                        arguments,
-                        # FIXME: tool_call.id,
-                        *args,
-                        **kwargs,
+                    pending = pending_tool_calls.setdefault(
+                        tool_call.index, {"name": "", "arguments": ""}
                     )
-
-                    yield "<tool_call>"
-                    yield f"<name>{name}</name>"
-                    yield f"<arguments>{arguments}</arguments>"
-                    yield f"<results>{results.llm_formatted_result}</results>"
-                    yield "</tool_call>"
+                    if tool_call.function.name:
+                        pending["name"] = tool_call.function.name
+                    if tool_call.function.arguments:
+                        pending["arguments"] += tool_call.function.arguments
+
+            if chunk.choices[0].finish_reason == "tool_calls":
+                async for tool_chunk in self._run_pending_tool_calls(
+                    pending_tool_calls, *args, **kwargs
+                ):
+                    yield tool_chunk
+                pending_tool_calls = {}
 
             if delta.function_call:
                 if delta.function_call.name:
@@ -210,8 +253,11 @@ class R2RStreamingAgent(R2RAgent):
                 yield "<function_call>"
                 yield f"<name>{function_name}</name>"
                 yield f"<arguments>{function_arguments}</arguments>"
-                tool_result = await self.handle_function_or_tool_call(
-                    function_name, function_arguments, *args, **kwargs
+                (tool_result,) = await self.handle_tool_calls(
+                    [(function_name, function_arguments)],
+                    *args,
+                    timeout=self._tool_timeout(),
+                    **kwargs,
                 )
                 if tool_result.stream_result:
                     yield f"<results>{tool_result.stream_result}</results>"
@@ -231,6 +277,13 @@ class R2RStreamingAgent(R2RAgent):
                 self._completed = True
                 yield "</completion>"
 
+        # Some providers end the stream without a `tool_calls` finish reason
+        if pending_tool_calls:
+            async for tool_chunk in self._run_pending_tool_calls(
+                pending_tool_calls, *args, **kwargs
+            ):
+                yield tool_chunk
+
         # Handle any remaining content after the stream ends
         if content_buffer and not self._completed:
             await self.conversation.add_message(
@@ -238,3 +291,27 @@ class R2RStreamingAgent(R2RAgent):
             )
             self._completed = True
             yield "</completion>"
+
+    async def _run_pending_tool_calls(
+        self,
+        pending_tool_calls: dict[int, dict[str, str]],
+        *args,
+        **kwargs,
+    ) -> AsyncGenerator[str, None]:
+        tool_calls = [
+            (pending["name"], pending["arguments"] or "{}")
+            for _, pending in sorted(pending_tool_calls.items())
+            if pending["name"]
+        ]
+        tool_results = await self.handle_tool_calls(
+            tool_calls,
+            *args,
+            timeout=self._tool_timeout(),
+            **kwargs,
+        )
+        for (name, arguments), results in zip(tool_calls, tool_results):
+            yield "<tool_call>"
+            yield f"<name>{name}</name>"
+            yield f"<arguments>{arguments}</arguments>"
+            yield f"<results>{results.llm_formatted_result}</results>"
+            yield "</tool_call>"
@@ -2,6 +2,7 @@ from typing import Union
 
 from core.agent import R2RAgent, R2RStreamingAgent
 from core.base import (
+    ContextBuilder,
     format_search_results_for_llm,
     format_search_results_for_stream,
 )
@@ -22,10 +23,20 @@ from core.providers import (  # PostgresDatabaseProvider,
 
 
 class RAGAgentMixin:
+    # Provided by the agent class this is mixed into
+    config: AgentConfig
+    llm_provider: CompletionProvider
+    _tools: list[Tool]
+
     def __init__(self, search_pipeline: SearchPipeline, *args, **kwargs):
         self.search_pipeline = search_pipeline
         super().__init__(*args, **kwargs)
 
+    def _reset(self) -> None:
+        super()._reset()  # type: ignore
+        # How the context of each search was assembled during this run
+        self.context_reports: list[dict] = []
+
     def _register_tools(self):
         if not self.config.tool_names:
             return
@@ -42,7 +53,7 @@ class RAGAgentMixin:
             name="web_search",
             description="Search for information on the web.",
             results_function=self._web_search,
-            llm_format_function=RAGAgentMixin.format_search_results_for_llm,
+            llm_format_function=self.format_search_results_for_llm_budgeted,
             stream_function=RAGAgentMixin.format_search_results_for_stream,
             parameters={
                 "type": "object",
@@ -81,7 +92,7 @@ class RAGAgentMixin:
             name="local_search",
             description="Search your local knowledgebase using the R2R AI system",
             results_function=self._local_search,
-            llm_format_function=RAGAgentMixin.format_search_results_for_llm,
+            llm_format_function=self.format_search_results_for_llm_budgeted,
             stream_function=RAGAgentMixin.format_search_results_for_stream,
             parameters={
                 "type": "object",
@@ -121,6 +132,22 @@ class RAGAgentMixin:
     ) -> str:
         return format_search_results_for_llm(results)
 
+    def format_search_results_for_llm_budgeted(
+        self,
+        results: AggregateSearchResult,
+    ) -> str:
+        context_builder = ContextBuilder(
+            token_counter=lambda text: self.llm_provider.count_tokens(
+                text, self.config.generation_config.model
+            ),
+            max_tokens=self.llm_provider.config.context_token_budget,
+            style="agent",
+        )
+        context_builder.add_results("", results)
+        result = context_builder.build()
+        self.context_reports.append(result.as_dict())
+        return result.context
+
 
 class R2RRAGAgent(RAGAgentMixin, R2RAgent):
     def __init__(
@@ -127,6 +127,9 @@ __all__ = [
     "to_async_generator",
     "format_search_results_for_llm",
     "format_search_results_for_stream",
+    "ContextBuilder",
+    "ContextBuildResult",
+    "estimate_tokens",
     "validate_uuid",
     # ID generation
     "generate_id",
@@ -71,6 +71,7 @@ from shared.abstractions.user import Token, TokenData, User
 from shared.abstractions.vector import (
     IndexArgsHNSW,
     IndexArgsIVFFlat,
+    IndexBuildSettings,
     IndexConfig,
     IndexMeasure,
     IndexMethod,
@@ -160,6 +161,7 @@ __all__ = [
     "IndexMethod",
     "VectorTableName",
     "IndexArgsHNSW",
+    "IndexBuildSettings",
     "IndexArgsIVFFlat",
     "VectorQuantizationSettings",
     "VectorQuantizationType",
@@ -59,6 +59,13 @@ class AgentConfig(BaseModel):
     tool_names: list[str] = ["search"]
     generation_config: GenerationConfig = GenerationConfig()
     stream: bool = False
+    max_iterations: int = 10
+    max_duration_seconds: Optional[float] = 300.0
+    tool_concurrency_limit: int = 4
+    tool_timeout_seconds: Optional[float] = 60.0
+    history_token_budget: Optional[int] = 8_192
+    summarize_history: bool = False
+    history_summary_prompt: str = "conversation_summary"
 
     @classmethod
     def create(cls: Type["AgentConfig"], **kwargs: Any) -> "AgentConfig":
@@ -142,9 +149,12 @@ class Agent(ABC):
             return f"Error: Tool {tool_name} not found."
 
     def get_generation_config(
-        self, last_message: dict, stream: bool = False
+        self,
+        last_message: dict,
+        stream: bool = False,
+        tools_enabled: bool = True,
     ) -> GenerationConfig:
-        if (
+        if not tools_enabled or (
             last_message["role"] in ["tool", "function"]
             and last_message["content"] != ""
         ):
@@ -217,24 +227,9 @@ class Agent(ABC):
             )
         )
 
-        if tool := next(
-            (t for t in self.tools if t.name == function_name), None
-        ):
-            merged_kwargs = {**kwargs, **json.loads(function_arguments)}
-            raw_result = await tool.results_function(*args, **merged_kwargs)
-            llm_formatted_result = tool.llm_format_function(raw_result)
-            tool_result = ToolResult(
-                raw_result=raw_result,
-                llm_formatted_result=llm_formatted_result,
-            )
-            if tool.stream_function:
-                tool_result.stream_result = tool.stream_function(raw_result)
-        else:
-            error_message = f"The requested tool '{function_name}' is not available. Available tools: {', '.join(t.name for t in self.tools)}"
-            tool_result = ToolResult(
-                raw_result=error_message,
-                llm_formatted_result=error_message,
-            )
+        tool_result = await self.execute_tool_call(
+            function_name, function_arguments, *args, **kwargs
+        )
 
         await self.conversation.add_message(
             Message(
@@ -245,3 +240,98 @@ class Agent(ABC):
         )
 
         return tool_result
+
+    async def execute_tool_call(
+        self,
+        function_name: str,
+        function_arguments: str,
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> ToolResult:
+        """Runs a single tool call, bounded by the configured tool timeout."""
+        tool = next((t for t in self.tools if t.name == function_name), None)
+        if not tool:
+            error_message = f"The requested tool '{function_name}' is not available. Available tools: {', '.join(t.name for t in self.tools)}"
+            return ToolResult(
+                raw_result=error_message,
+                llm_formatted_result=error_message,
+            )
+
+        if timeout is None:
+            timeout = self.config.tool_timeout_seconds
+        merged_kwargs = {**kwargs, **json.loads(function_arguments)}
+        try:
+            raw_result = await asyncio.wait_for(
+                tool.results_function(*args, **merged_kwargs),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Tool '{function_name}' timed out after {timeout} seconds."
+            )
+            error_message = f"The tool '{function_name}' did not respond within {timeout} seconds."
+            return ToolResult(
+                raw_result=error_message,
+                llm_formatted_result=error_message,
+            )
+
+        tool_result = ToolResult(
+            raw_result=raw_result,
+            llm_formatted_result=tool.llm_format_function(raw_result),
+        )
+        if tool.stream_function:
+            tool_result.stream_result = tool.stream_function(raw_result)
+        return tool_result
+
+    async def handle_tool_calls(
+        self,
+        tool_calls: list[tuple[str, str]],
+        *args,
+        timeout: Optional[float] = None,
+        **kwargs,
+    ) -> list[ToolResult]:
+        """
+        Executes the `(name, arguments)` tool calls requested in one
+        assistant turn concurrently, at most `tool_concurrency_limit` at a
+        time, and records them in the conversation in their original order.
+        """
+        semaphore = asyncio.Semaphore(
+            max(1, self.config.tool_concurrency_limit)
+        )
+
+        async def _run(function_name: str, function_arguments: str):
+            async with semaphore:
+                return await self.execute_tool_call(
+                    function_name,
+                    function_arguments,
+                    *args,
+                    timeout=timeout,
+                    **kwargs,
+                )
+
+        tool_results = await asyncio.gather(
+            *(_run(name, arguments) for name, arguments in tool_calls)
+        )
+
+        for (function_name, function_arguments), tool_result in zip(
+            tool_calls, tool_results
+        ):
+            await self.conversation.add_message(
+                Message(
+                    role="assistant",
+                    function_call={
+                        "name": function_name,
+                        "arguments": function_arguments,
+                    },
+                )
+            )
+            await self.conversation.add_message(
+                Message(
+                    role="function",
+                    content=str(tool_result.llm_formatted_result),
+                    name=function_name,
+                )
+            )
+
+        return list(tool_results)
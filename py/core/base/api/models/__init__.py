@@ -11,8 +11,10 @@ from shared.api.models.base import (
     WrappedGenericMessageResponse,
 )
 from shared.api.models.ingestion.responses import (
+    BulkIngestionResponse,
     IngestionResponse,
     UpdateResponse,
+    WrappedBulkIngestionResponse,
     WrappedIngestionResponse,
     WrappedListVectorIndicesResponse,
     WrappedMetadataUpdateResponse,
@@ -86,6 +88,8 @@ __all__ = [
     # Ingestion Responses
     "IngestionResponse",
     "WrappedIngestionResponse",
+    "BulkIngestionResponse",
+    "WrappedBulkIngestionResponse",
     "WrappedUpdateResponse",
     "WrappedMetadataUpdateResponse",
     "WrappedListVectorIndicesResponse",
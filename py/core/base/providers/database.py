@@ -105,6 +105,13 @@ class Handler(ABC):
     def create_tables(self):
         pass
 
+    async def initialize(self) -> None:
+        """
+        Load any state the handler needs at startup. Unlike `create_tables`,
+        this runs on every start, even when the schema is already current.
+        """
+        pass
+
 
 class PostgresConfigurationSettings(BaseModel):
     """
@@ -167,6 +174,16 @@ class DatabaseConfig(ProviderConfig):
     collection_summary_system_prompt: str = "default_system"
     collection_summary_task_prompt: str = "default_collection_summary"
     enable_fts: bool = False
+    # Default text search configuration for chunks and full-text queries
+    text_search_language: str = "english"
+    # "gin", or "rum" to read full-text matches in rank order
+    full_text_index: str = "gin"
+    # Chunk metadata keys to index for range filters, mapped to "number" or
+    # "timestamp"
+    metadata_indexes: dict[str, str] = {}
+    # Days a cached parser output, such as a vision model's description of
+    # a PDF page, is kept after it was last used
+    parse_cache_retention_days: int = 30
 
     # KG settings
     batch_size: Optional[int] = 1
@@ -4,9 +4,9 @@ import random
 import time
 from abc import abstractmethod
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Awaitable, Callable, Optional
 
-from litellm import AuthenticationError
+from litellm import AuthenticationError, ContextWindowExceededError
 
 from core.base.abstractions import VectorQuantizationSettings
 
@@ -26,7 +26,14 @@ class EmbeddingConfig(ProviderConfig):
     base_dimension: int
     rerank_model: Optional[str] = None
     rerank_url: Optional[str] = None
+    rerank_batch_size: int = 32
+    rerank_concurrency_limit: int = 8
+    rerank_timeout: float = 10.0
+    rerank_cache_size: int = 4096
     batch_size: int = 1
+    # Seconds to hold small embedding requests so that concurrent callers
+    # can share a provider call of up to `batch_size` texts, 0 to disable
+    batch_window: float = 0.01
     prefixes: Optional[dict[str, str]] = None
     add_title_as_prefix: bool = True
     concurrent_request_limit: int = 256
@@ -50,6 +57,119 @@ class EmbeddingConfig(ProviderConfig):
         return ["litellm", "openai", "ollama"]
 
 
+class EmbeddingMicroBatcher:
+    """
+    Coalesces embedding requests from concurrent callers into full batches.
+
+    Requests are held for at most `window` seconds, or until `batch_size`
+    texts are pending, then sent as a single call and each caller gets its
+    own slice of the vectors back. If a combined call fails because of its
+    input, e.g. a text over the model's context length, each request is
+    retried on its own so that one bad input only fails its caller. Any
+    other error is passed to every caller in the batch.
+    """
+
+    # Provider error messages that point at the input rather than the call
+    INPUT_ERROR_MARKERS = (
+        "context length",
+        "context window",
+        "too long",
+        "too large",
+        "too many tokens",
+        "maximum input",
+    )
+
+    def __init__(
+        self,
+        execute: Callable[[dict[str, Any]], Awaitable[list[list[float]]]],
+        batch_size: int,
+        window: float,
+    ):
+        self.execute = execute
+        self.batch_size = batch_size
+        self.window = window
+        self._pending: dict[
+            tuple[Any, Any], list[tuple[list[str], asyncio.Future]]
+        ] = {}
+        self._pending_counts: dict[tuple[Any, Any], int] = {}
+        self._timers: dict[tuple[Any, Any], asyncio.TimerHandle] = {}
+        self._running: set[asyncio.Task] = set()
+
+    async def embed(
+        self, texts: list[str], stage: Any, purpose: Any
+    ) -> list[list[float]]:
+        key = (stage, purpose)
+        if (
+            self._pending_counts.get(key, 0) + len(texts) > self.batch_size
+            and key in self._pending
+        ):
+            self._flush(key)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append((texts, future))
+        self._pending_counts[key] = self._pending_counts.get(key, 0) + len(
+            texts
+        )
+
+        if self._pending_counts[key] >= self.batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        return await future
+
+    def _flush(self, key: tuple[Any, Any]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        self._pending_counts.pop(key, None)
+        requests = self._pending.pop(key, [])
+        if requests:
+            task = asyncio.create_task(self._run(key, requests))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(
+        self,
+        key: tuple[Any, Any],
+        requests: list[tuple[list[str], asyncio.Future]],
+    ) -> None:
+        stage, purpose = key
+        try:
+            vectors = await self.execute(
+                {
+                    "texts": [text for texts, _ in requests for text in texts],
+                    "stage": stage,
+                    "purpose": purpose,
+                }
+            )
+        except Exception as e:
+            if len(requests) > 1 and self._is_input_error(e):
+                await asyncio.gather(
+                    *(self._run(key, [request]) for request in requests)
+                )
+                return
+            for _, future in requests:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for texts, future in requests:
+            if not future.done():
+                future.set_result(vectors[offset : offset + len(texts)])
+            offset += len(texts)
+
+    @classmethod
+    def _is_input_error(cls, error: Exception) -> bool:
+        if isinstance(error, ContextWindowExceededError):
+            return True
+        if isinstance(error, AuthenticationError):
+            return False
+        message = str(error).lower()
+        return any(marker in message for marker in cls.INPUT_ERROR_MARKERS)
+
+
 class EmbeddingProvider(Provider):
     class PipeStage(Enum):
         BASE = 1
@@ -66,8 +186,29 @@ class EmbeddingProvider(Provider):
         self.config: EmbeddingConfig = config
         self.semaphore = asyncio.Semaphore(config.concurrent_request_limit)
         self.current_requests = 0
+        self.batcher: Optional[EmbeddingMicroBatcher] = None
+        if config.batch_size > 1 and config.batch_window > 0:
+            self.batcher = EmbeddingMicroBatcher(
+                self._execute_with_retries_async,
+                batch_size=config.batch_size,
+                window=config.batch_window,
+            )
 
     async def _execute_with_backoff_async(self, task: dict[str, Any]):
+        # Small requests without per-call options are pooled with those of
+        # other callers; anything else goes straight to the provider.
+        if (
+            self.batcher is not None
+            and "texts" in task
+            and not task.get("kwargs")
+            and len(task["texts"]) < self.config.batch_size
+        ):
+            return await self.batcher.embed(
+                task["texts"], task.get("stage"), task.get("purpose")
+            )
+        return await self._execute_with_retries_async(task)
+
+    async def _execute_with_retries_async(self, task: dict[str, Any]):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
@@ -164,6 +305,10 @@ class EmbeddingProvider(Provider):
         }
         return self._execute_with_backoff_sync(task)
 
+    async def close(self) -> None:
+        """Release the connections held by the provider on shutdown."""
+        pass
+
     @abstractmethod
     def rerank(
         self,
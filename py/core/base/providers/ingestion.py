@@ -1,11 +1,12 @@
 import logging
 from abc import ABC
 from enum import Enum
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
 from pydantic import BaseModel, Field
 
 from core.base.abstractions import ChunkEnrichmentSettings
+from core.base.parsers.base_parser import AsyncParser
 
 from .base import AppConfig, Provider, ProviderConfig
 from .llm import CompletionProvider
@@ -28,12 +29,16 @@ class IngestionConfig(ProviderConfig):
         "vision_img_model": "openai/gpt-4o",
         "vision_pdf_prompt_name": "vision_pdf",
         "vision_pdf_model": "openai/gpt-4o",
+        "vision_pdf_max_concurrency": 8,
+        "vision_pdf_text_layer_min_chars": 500,
         "skip_document_summary": False,
         "document_summary_system_prompt": "default_system",
         "document_summary_task_prompt": "default_summary",
         "chunks_for_document_summary": 128,
         "document_summary_model": "openai/gpt-4o-mini",
         "parser_overrides": {},
+        "deduplicate_files": False,
+        "max_archive_size": 1024**3,
         "extra_fields": {},
     }
 
@@ -72,6 +77,16 @@ class IngestionConfig(ProviderConfig):
     vision_pdf_model: str = Field(
         default_factory=lambda: IngestionConfig._defaults["vision_pdf_model"]
     )
+    vision_pdf_max_concurrency: int = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "vision_pdf_max_concurrency"
+        ]
+    )
+    vision_pdf_text_layer_min_chars: int = Field(
+        default_factory=lambda: IngestionConfig._defaults[
+            "vision_pdf_text_layer_min_chars"
+        ]
+    )
     skip_document_summary: bool = Field(
         default_factory=lambda: IngestionConfig._defaults[
             "skip_document_summary"
@@ -100,6 +115,12 @@ class IngestionConfig(ProviderConfig):
     parser_overrides: dict[str, str] = Field(
         default_factory=lambda: IngestionConfig._defaults["parser_overrides"]
     )
+    deduplicate_files: bool = Field(
+        default_factory=lambda: IngestionConfig._defaults["deduplicate_files"]
+    )
+    max_archive_size: int = Field(
+        default_factory=lambda: IngestionConfig._defaults["max_archive_size"]
+    )
 
     @classmethod
     def set_default(cls, **kwargs):
@@ -164,12 +185,16 @@ class IngestionConfig(ProviderConfig):
             "vision_img_model": "openai/gpt-4o",
             "vision_pdf_prompt_name": "vision_pdf",
             "vision_pdf_model": "openai/gpt-4o",
+            "vision_pdf_max_concurrency": 8,
+            "vision_pdf_text_layer_min_chars": 500,
             "skip_document_summary": False,
             "document_summary_system_prompt": "default_system",
             "document_summary_task_prompt": "default_summary",
             "chunks_for_document_summary": 128,
             "document_summary_model": "openai/gpt-4o-mini",
             "parser_overrides": {},
+            "deduplicate_files": False,
+            "max_archive_size": 1024**3,
         }
 
 
@@ -189,6 +214,23 @@ class IngestionProvider(Provider, ABC):
         self.config: IngestionConfig = config
         self.llm_provider = llm_provider
         self.database_provider: "PostgresDatabaseProvider" = database_provider
+        self.parser_classes: dict[Any, Callable[..., AsyncParser]] = {}
+        self.parsers: dict[Any, AsyncParser] = {}
+
+    def get_parser(self, name: Any) -> AsyncParser:
+        """
+        Return the parser registered under `name`, creating it on first use.
+
+        Parsers import their optional dependencies when created, so only the
+        document types that are actually ingested pay for them.
+        """
+        if name not in self.parsers:
+            self.parsers[name] = self.parser_classes[name](
+                config=self.config,
+                database_provider=self.database_provider,
+                llm_provider=self.llm_provider,
+            )
+        return self.parsers[name]
 
 
 class ChunkingStrategy(str, Enum):
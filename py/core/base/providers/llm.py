@@ -1,4 +1,5 @@
 import asyncio
+import inspect
 import logging
 import random
 import time
@@ -6,13 +7,14 @@ from abc import abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, AsyncGenerator, Generator, Optional
 
-from litellm import AuthenticationError
+from litellm import AuthenticationError, token_counter
 
 from core.base.abstractions import (
     GenerationConfig,
     LLMChatCompletion,
     LLMChatCompletionChunk,
 )
+from core.base.utils import estimate_tokens
 
 from .base import Provider, ProviderConfig
 
@@ -26,6 +28,7 @@ class CompletionConfig(ProviderConfig):
     max_retries: int = 8
     initial_backoff: float = 1.0
     max_backoff: float = 64.0
+    context_token_budget: Optional[int] = 16_384
 
     def validate_config(self) -> None:
         if not self.provider:
@@ -77,14 +80,27 @@ class CompletionProvider(Provider):
         retries = 0
         backoff = self.config.initial_backoff
         while retries < self.config.max_retries:
+            started = False
             try:
                 async with self.semaphore:
-                    async for chunk in await self._execute_task(task):
-                        yield chunk
+                    stream = await self._execute_task(task)
+                    try:
+                        async for chunk in stream:
+                            started = True
+                            yield chunk
+                    finally:
+                        # Runs on completion, on error and when the consumer
+                        # goes away, so the connection and the semaphore slot
+                        # are released as soon as the stream is abandoned.
+                        await self._close_stream(stream)
                 return  # Successful completion of the stream
             except AuthenticationError as e:
                 raise
             except Exception as e:
+                if started:
+                    # Chunks that were already delivered cannot be retracted,
+                    # so only failures before the first chunk are retried.
+                    raise
                 logger.warning(
                     f"Streaming request failed (attempt {retries + 1}): {str(e)}"
                 )
@@ -94,6 +110,22 @@ class CompletionProvider(Provider):
                 await asyncio.sleep(random.uniform(0, backoff))
                 backoff = min(backoff * 2, self.config.max_backoff)
 
+    @staticmethod
+    async def _close_stream(stream: Any) -> None:
+        for target in (stream, getattr(stream, "completion_stream", None)):
+            close = getattr(target, "aclose", None) or getattr(
+                target, "close", None
+            )
+            if close is None:
+                continue
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"Failed to close completion stream: {e}")
+            return
+
     def _execute_with_backoff_sync(self, task: dict[str, Any]):
         retries = 0
         backoff = self.config.initial_backoff
@@ -129,6 +161,17 @@ class CompletionProvider(Provider):
                 time.sleep(random.uniform(0, backoff))
                 backoff = min(backoff * 2, self.config.max_backoff)
 
+    def count_tokens(self, text: str, model: Optional[str] = None) -> int:
+        """Counts the tokens in `text` using the tokenizer of `model`."""
+        model = model or self.config.generation_config.model
+        try:
+            return token_counter(model=model, text=text)
+        except Exception as e:
+            logger.debug(
+                f"Falling back to estimated token count for {model}: {e}"
+            )
+            return estimate_tokens(text)
+
     @abstractmethod
     async def _execute_task(self, task: dict[str, Any]):
         pass
@@ -165,8 +208,12 @@ class CompletionProvider(Provider):
             "generation_config": generation_config,
             "kwargs": kwargs,
         }
-        async for chunk in self._execute_with_backoff_async_stream(task):
-            yield LLMChatCompletionChunk(**chunk.dict())
+        stream = self._execute_with_backoff_async_stream(task)
+        try:
+            async for chunk in stream:
+                yield LLMChatCompletionChunk(**chunk.dict())
+        finally:
+            await stream.aclose()
 
     def get_completion_stream(
         self,
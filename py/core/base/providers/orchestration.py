@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from enum import Enum
-from typing import Any
+from typing import Any, Optional
 
 from .base import Provider, ProviderConfig
 
@@ -17,10 +17,28 @@ class OrchestrationConfig(ProviderConfig):
     ingestion_concurrency_limit: int = 16
     kg_concurrency_limit: int = 4
 
+    # Simple orchestration only: queue workflows in Postgres and run them in
+    # background workers, rather than inside the request that started them
+    job_queue: bool = False
+    job_queue_workers: int = 8
+    job_poll_interval: float = 1.0
+    # A job whose worker stops renewing its lease for this long is retried
+    job_visibility_timeout: float = 300.0
+    job_max_attempts: int = 3
+    job_retry_backoff: float = 10.0
+    job_user_concurrency_limit: Optional[int] = 4
+    # Per-workflow overrides of the ingestion and kg concurrency limits
+    job_concurrency_limits: dict[str, int] = {}
+
     def validate_config(self) -> None:
         if self.provider not in self.supported_providers:
             raise ValueError(f"Provider {self.provider} is not supported.")
 
+    @property
+    def runs_in_background(self) -> bool:
+        """Whether `run_workflow` returns before the workflow has run."""
+        return self.provider != "simple" or self.job_queue
+
     @property
     def supported_providers(self) -> list[str]:
         return ["hatchet", "simple"]
@@ -36,6 +54,9 @@ class OrchestrationProvider(Provider):
     async def start_worker(self):
         pass
 
+    async def stop_worker(self):
+        pass
+
     @abstractmethod
     def get_worker(self, name: str, max_runs: int) -> Any:
         pass
@@ -1,9 +1,12 @@
 from shared.utils import (
+    ContextBuilder,
+    ContextBuildResult,
     RecursiveCharacterTextSplitter,
     TextSplitter,
     _decorate_vector_type,
     _get_str_estimation_output,
     decrement_version,
+    estimate_tokens,
     format_search_results_for_llm,
     format_search_results_for_stream,
     generate_default_prompt_id,
@@ -22,6 +25,9 @@ from shared.utils import (
 __all__ = [
     "format_search_results_for_stream",
     "format_search_results_for_llm",
+    "ContextBuilder",
+    "ContextBuildResult",
+    "estimate_tokens",
     "generate_id",
     "generate_default_user_collection_id",
     "increment_version",
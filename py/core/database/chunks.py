@@ -1,4 +1,6 @@
+import asyncio
 import copy
+import hashlib
 import json
 import logging
 import time
@@ -6,6 +8,7 @@ import uuid
 from typing import Any, Optional, TypedDict
 from uuid import UUID
 
+import asyncpg
 import numpy as np
 
 from core.base import (
@@ -13,8 +16,10 @@ from core.base import (
     Handler,
     IndexArgsHNSW,
     IndexArgsIVFFlat,
+    IndexBuildSettings,
     IndexMeasure,
     IndexMethod,
+    KGEnrichmentStatus,
     R2RException,
     SearchSettings,
     VectorEntry,
@@ -82,6 +87,19 @@ class HybridSearchIntermediateResult(TypedDict):
 
 class PostgresChunksHandler(Handler):
     TABLE_NAME = VectorTableName.CHUNKS
+    FTS_TERMS_TABLE_NAME = "chunks_fts_terms"
+    FTS_CORPUS_TABLE_NAME = "chunks_fts_corpus"
+
+    # BM25 term frequency saturation and length normalization
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+    # With a RUM index, this many candidates per requested result are read in
+    # rank order before BM25 re-scoring
+    FULL_TEXT_CANDIDATE_MULTIPLIER = 4
+    # Term statistics are refreshed in the background once the table size
+    # drifts by more than this fraction, checked at most once per interval
+    FULL_TEXT_STATS_DRIFT = 0.2
+    FULL_TEXT_STATS_CHECK_INTERVAL = 60.0
 
     COLUMN_VARS = [
         "id",
@@ -89,6 +107,15 @@ class PostgresChunksHandler(Handler):
         "owner_id",
         "collection_ids",
     ]
+    # Declarable metadata index types, mapped to the SQL function that
+    # extracts the indexed value and the type filter values are cast to
+    METADATA_INDEX_TYPES = {
+        "number": ("metadata_number", "double precision"),
+        "timestamp": ("metadata_timestamp", "timestamptz"),
+    }
+    # `$in` filters on metadata with up to this many values become an OR of
+    # containment checks, each of which can use the metadata GIN index
+    METADATA_IN_CONTAINMENT_LIMIT = 64
 
     def __init__(
         self,
@@ -96,10 +123,24 @@ class PostgresChunksHandler(Handler):
         connection_manager: PostgresConnectionManager,
         dimension: int,
         quantization_type: VectorQuantizationType,
+        text_search_language: str = "english",
+        full_text_index: str = "gin",
+        metadata_indexes: Optional[dict[str, str]] = None,
     ):
         super().__init__(project_name, connection_manager)
         self.dimension = dimension
         self.quantization_type = quantization_type
+        self.text_search_language = text_search_language
+        self.full_text_index = full_text_index
+        self.metadata_indexes = metadata_indexes or {}
+        for key, index_type in self.metadata_indexes.items():
+            if index_type not in self.METADATA_INDEX_TYPES:
+                raise ValueError(
+                    f"Unsupported index type '{index_type}' for metadata key '{key}', expected one of {list(self.METADATA_INDEX_TYPES)}."
+                )
+        self.text_search_languages: set[str] = set()
+        self._fts_stats_checked_at = float("-inf")
+        self._fts_stats_task: Optional[asyncio.Task] = None
 
     async def create_tables(self):
         # Check for old table name first
@@ -138,15 +179,146 @@ class PostgresChunksHandler(Handler):
             {binary_col}
             text TEXT,
             metadata JSONB,
-            fts tsvector GENERATED ALWAYS AS (to_tsvector('english', text)) STORED
+            fts_language regconfig NOT NULL DEFAULT '{self.text_search_language}'::regconfig,
+            fts tsvector GENERATED ALWAYS AS (to_tsvector(fts_language, text)) STORED,
+            content_hash TEXT GENERATED ALWAYS AS (md5(text)) STORED
         );
         CREATE INDEX IF NOT EXISTS idx_vectors_document_id ON {self._get_table_name(PostgresChunksHandler.TABLE_NAME)} (document_id);
         CREATE INDEX IF NOT EXISTS idx_vectors_owner_id ON {self._get_table_name(PostgresChunksHandler.TABLE_NAME)} (owner_id);
         CREATE INDEX IF NOT EXISTS idx_vectors_collection_ids ON {self._get_table_name(PostgresChunksHandler.TABLE_NAME)} USING GIN (collection_ids);
-        CREATE INDEX IF NOT EXISTS idx_vectors_text ON {self._get_table_name(PostgresChunksHandler.TABLE_NAME)} USING GIN (to_tsvector('english', text));
+        CREATE INDEX IF NOT EXISTS idx_vectors_metadata ON {self._get_table_name(PostgresChunksHandler.TABLE_NAME)} USING GIN (metadata jsonb_path_ops);
+
+        CREATE TABLE IF NOT EXISTS {self._get_table_name(PostgresChunksHandler.FTS_TERMS_TABLE_NAME)} (
+            fts_language regconfig NOT NULL,
+            lexeme TEXT NOT NULL,
+            ndoc INT NOT NULL,
+            PRIMARY KEY (fts_language, lexeme)
+        );
+        CREATE TABLE IF NOT EXISTS {self._get_table_name(PostgresChunksHandler.FTS_CORPUS_TABLE_NAME)} (
+            fts_language regconfig PRIMARY KEY,
+            num_chunks BIGINT NOT NULL,
+            avg_length FLOAT NOT NULL,
+            refreshed_at TIMESTAMPTZ DEFAULT NOW()
+        );
         """
 
         await self.connection_manager.execute_query(query)
+        await self._create_full_text_index()
+        await self._create_metadata_indexes()
+
+    async def initialize(self) -> None:
+        self.text_search_languages = {
+            row["cfgname"]
+            for row in await self.connection_manager.fetch_query(
+                "SELECT cfgname FROM pg_ts_config;"
+            )
+        }
+        if self.text_search_language not in self.text_search_languages:
+            raise ValueError(
+                f"Text search configuration '{self.text_search_language}' does not exist in Postgres."
+            )
+
+    async def _create_full_text_index(self) -> None:
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        if self.full_text_index == "rum":
+            try:
+                await self.connection_manager.execute_query(
+                    f"""
+                    CREATE EXTENSION IF NOT EXISTS rum;
+                    CREATE INDEX IF NOT EXISTS idx_vectors_fts_rum ON {table_name} USING rum (fts rum_tsvector_ops);
+                    """
+                )
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Could not create a RUM index, falling back to GIN: {e}"
+                )
+                self.full_text_index = "gin"
+
+        await self.connection_manager.execute_query(
+            f"CREATE INDEX IF NOT EXISTS idx_vectors_fts ON {table_name} USING GIN (fts);"
+        )
+
+    async def _create_metadata_indexes(self) -> None:
+        """
+        Create expression indexes for the metadata keys declared in
+        `metadata_indexes`, so range filters on them avoid a sequential scan.
+        """
+        # Both extractors return NULL for values of the wrong type instead of
+        # failing the insert. Only ISO 8601 timestamps with a UTC offset are
+        # indexed: values without one would be read in the session time zone,
+        # so the function could not be immutable.
+        await self.connection_manager.execute_query(
+            f"""
+            CREATE OR REPLACE FUNCTION {self.project_name}.metadata_number(value jsonb)
+            RETURNS double precision
+            LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+                SELECT CASE WHEN jsonb_typeof(value) = 'number'
+                    THEN (value #>> '{{}}')::double precision END
+            $$;
+
+            CREATE OR REPLACE FUNCTION {self.project_name}.metadata_timestamp(value jsonb)
+            RETURNS timestamptz
+            LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+            BEGIN
+                IF jsonb_typeof(value) <> 'string' OR (value #>> '{{}}') !~*
+                    '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}[t ][0-9:.]+(z|[+-][0-9]{{2}}(:?[0-9]{{2}})?)$'
+                THEN
+                    RETURN NULL;
+                END IF;
+                RETURN (value #>> '{{}}')::timestamptz;
+            EXCEPTION WHEN others THEN
+                RETURN NULL;
+            END;
+            $$;
+            """
+        )
+
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        for key, index_type in self.metadata_indexes.items():
+            function, _ = self.METADATA_INDEX_TYPES[index_type]
+            index_name = self._get_metadata_index_name(key, index_type)
+            # A concurrent build that failed leaves an invalid index behind,
+            # which `IF NOT EXISTS` would otherwise keep forever.
+            existing = await self.connection_manager.fetchrow_query(
+                """
+                SELECT x.indisvalid
+                FROM pg_index x
+                JOIN pg_class i ON i.oid = x.indexrelid
+                JOIN pg_namespace n ON n.oid = i.relnamespace
+                WHERE n.nspname = $1 AND i.relname = $2
+                """,
+                [self.project_name, index_name],
+            )
+            if existing and existing["indisvalid"]:
+                continue
+            if existing:
+                await self._execute_index_statement(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {self.project_name}.{index_name}"
+                )
+            # Built concurrently so that chunks stay writable meanwhile
+            await self._execute_index_statement(
+                f"""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table_name}
+                ({self.project_name}.{function}(metadata->{psql_quote_literal(key)}));
+                """
+            )
+
+    @staticmethod
+    def _get_metadata_index_name(key: str, index_type: str) -> str:
+        # Keys that only differ in punctuation or case sanitize to the same
+        # text, so a hash of the raw key keeps their index names apart.
+        sanitized = "".join(c if c.isalnum() else "_" for c in key.lower())
+        digest = hashlib.sha256(key.encode()).hexdigest()[:8]
+        return f"idx_vectors_metadata_{index_type}_{sanitized[:20]}_{digest}"
+
+    def _get_fts_language(self, entry: VectorEntry) -> str:
+        language = entry.metadata.get("language")
+        if isinstance(language, str) and (
+            language in self.text_search_languages
+        ):
+            return language
+        return self.text_search_language
 
     async def upsert(self, entry: VectorEntry) -> None:
         """
@@ -158,8 +330,8 @@ class PostgresChunksHandler(Handler):
             # For quantized vectors, use vec_binary column
             query = f"""
             INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-            (id, document_id, owner_id, collection_ids, vec, vec_binary, text, metadata)
-            VALUES ($1, $2, $3, $4, $5, $6::bit({self.dimension}), $7, $8)
+            (id, document_id, owner_id, collection_ids, vec, vec_binary, text, metadata, fts_language)
+            VALUES ($1, $2, $3, $4, $5, $6::bit({self.dimension}), $7, $8, $9::regconfig)
             ON CONFLICT (id) DO UPDATE SET
             document_id = EXCLUDED.document_id,
             owner_id = EXCLUDED.owner_id,
@@ -167,7 +339,8 @@ class PostgresChunksHandler(Handler):
             vec = EXCLUDED.vec,
             vec_binary = EXCLUDED.vec_binary,
             text = EXCLUDED.text,
-            metadata = EXCLUDED.metadata;
+            metadata = EXCLUDED.metadata,
+            fts_language = EXCLUDED.fts_language;
             """
             await self.connection_manager.execute_query(
                 query,
@@ -182,21 +355,23 @@ class PostgresChunksHandler(Handler):
                     ),  # Convert to binary
                     entry.text,
                     json.dumps(entry.metadata),
+                    self._get_fts_language(entry),
                 ),
             )
         else:
             # For regular vectors, use vec column only
             query = f"""
             INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-            (id, document_id, owner_id, collection_ids, vec, text, metadata)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
+            (id, document_id, owner_id, collection_ids, vec, text, metadata, fts_language)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8::regconfig)
             ON CONFLICT (id) DO UPDATE SET
             document_id = EXCLUDED.document_id,
             owner_id = EXCLUDED.owner_id,
             collection_ids = EXCLUDED.collection_ids,
             vec = EXCLUDED.vec,
             text = EXCLUDED.text,
-            metadata = EXCLUDED.metadata;
+            metadata = EXCLUDED.metadata,
+            fts_language = EXCLUDED.fts_language;
             """
 
             await self.connection_manager.execute_query(
@@ -209,6 +384,7 @@ class PostgresChunksHandler(Handler):
                     str(entry.vector.data),
                     entry.text,
                     json.dumps(entry.metadata),
+                    self._get_fts_language(entry),
                 ),
             )
 
@@ -217,12 +393,18 @@ class PostgresChunksHandler(Handler):
         Batch upsert function that handles vector quantization only when quantization_type is INT1.
         Matches the table schema where vec_binary column only exists for INT1 quantization.
         """
+        query, params = self._upsert_entries_statement(entries)
+        await self.connection_manager.execute_many(query, params)
+
+    def _upsert_entries_statement(
+        self, entries: list[VectorEntry]
+    ) -> tuple[str, list[tuple]]:
         if self.quantization_type == VectorQuantizationType.INT1:
             # For quantized vectors, use vec_binary column
             query = f"""
             INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-            (id, document_id, owner_id, collection_ids, vec, vec_binary, text, metadata)
-            VALUES ($1, $2, $3, $4, $5, $6::bit({self.dimension}), $7, $8)
+            (id, document_id, owner_id, collection_ids, vec, vec_binary, text, metadata, fts_language)
+            VALUES ($1, $2, $3, $4, $5, $6::bit({self.dimension}), $7, $8, $9::regconfig)
             ON CONFLICT (id) DO UPDATE SET
             document_id = EXCLUDED.document_id,
             owner_id = EXCLUDED.owner_id,
@@ -230,7 +412,8 @@ class PostgresChunksHandler(Handler):
             vec = EXCLUDED.vec,
             vec_binary = EXCLUDED.vec_binary,
             text = EXCLUDED.text,
-            metadata = EXCLUDED.metadata;
+            metadata = EXCLUDED.metadata,
+            fts_language = EXCLUDED.fts_language;
             """
             bin_params = [
                 (
@@ -244,39 +427,40 @@ class PostgresChunksHandler(Handler):
                     ),  # Convert to binary
                     entry.text,
                     json.dumps(entry.metadata),
+                    self._get_fts_language(entry),
                 )
                 for entry in entries
             ]
-            await self.connection_manager.execute_many(query, bin_params)
+            return query, bin_params
 
-        else:
-            # For regular vectors, use vec column only
-            query = f"""
-            INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-            (id, document_id, owner_id, collection_ids, vec, text, metadata)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-            ON CONFLICT (id) DO UPDATE SET
-            document_id = EXCLUDED.document_id,
-            owner_id = EXCLUDED.owner_id,
-            collection_ids = EXCLUDED.collection_ids,
-            vec = EXCLUDED.vec,
-            text = EXCLUDED.text,
-            metadata = EXCLUDED.metadata;
-            """
-            params = [
-                (
-                    entry.id,
-                    entry.document_id,
-                    entry.owner_id,
-                    entry.collection_ids,
-                    str(entry.vector.data),
-                    entry.text,
-                    json.dumps(entry.metadata),
-                )
-                for entry in entries
-            ]
-
-            await self.connection_manager.execute_many(query, params)
+        # For regular vectors, use vec column only
+        query = f"""
+        INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+        (id, document_id, owner_id, collection_ids, vec, text, metadata, fts_language)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8::regconfig)
+        ON CONFLICT (id) DO UPDATE SET
+        document_id = EXCLUDED.document_id,
+        owner_id = EXCLUDED.owner_id,
+        collection_ids = EXCLUDED.collection_ids,
+        vec = EXCLUDED.vec,
+        text = EXCLUDED.text,
+        metadata = EXCLUDED.metadata,
+        fts_language = EXCLUDED.fts_language;
+        """
+        params = [
+            (
+                entry.id,
+                entry.document_id,
+                entry.owner_id,
+                entry.collection_ids,
+                str(entry.vector.data),
+                entry.text,
+                json.dumps(entry.metadata),
+                self._get_fts_language(entry),
+            )
+            for entry in entries
+        ]
+        return query, params
 
     async def semantic_search(
         self, query_vector: list[float], search_settings: SearchSettings
@@ -423,37 +607,99 @@ class PostgresChunksHandler(Handler):
             for result in results
         ]
 
+    def _get_search_language(self, search_settings: SearchSettings) -> str:
+        language = search_settings.search_language or self.text_search_language
+        if (
+            self.text_search_languages
+            and language not in self.text_search_languages
+        ):
+            raise R2RException(
+                f"Unsupported text search language '{language}'.", 400
+            )
+        return language
+
     async def full_text_search(
         self, query_text: str, search_settings: SearchSettings
     ) -> list[ChunkSearchResult]:
+        """
+        Keyword search over the indexed `fts` column, ranked with BM25.
 
-        where_clauses = []
-        params: list[str | int | bytes] = [query_text]
+        Only chunks indexed with the query's text search configuration are
+        matched. Term and length statistics come from a periodically
+        refreshed summary table, so ranking does not scan the whole corpus.
+        """
+        language = self._get_search_language(search_settings)
+        await self._maybe_refresh_full_text_statistics()
 
+        params: list[str | int | bytes] = [query_text, language]
+        where_clauses = [
+            "fts_language = $2::regconfig",
+            "fts @@ websearch_to_tsquery($2::regconfig, $1)",
+        ]
         if search_settings.filters:
-            filters_clause = self._build_filters(
-                search_settings.filters, params
+            where_clauses.append(
+                self._build_filters(search_settings.filters, params)
             )
-            where_clauses.append(filters_clause)
 
-        if where_clauses:
-            where_clause = (
-                "WHERE "
-                + " AND ".join(where_clauses)
-                + " AND fts @@ websearch_to_tsquery('english', $1)"
+        candidate_clause = ""
+        if self.full_text_index == "rum":
+            # The RUM index yields matches in rank order, so the scan stops
+            # after a bounded candidate set instead of reading every match.
+            params.append(
+                (
+                    search_settings.offset
+                    + search_settings.hybrid_settings.full_text_limit
+                )
+                * self.FULL_TEXT_CANDIDATE_MULTIPLIER
             )
-        else:
-            where_clause = "WHERE fts @@ websearch_to_tsquery('english', $1)"
+            candidate_clause = f"""
+                ORDER BY fts <=> websearch_to_tsquery($2::regconfig, $1)
+                LIMIT ${len(params)}
+            """
 
+        k1, b = self.BM25_K1, self.BM25_B
         query = f"""
+            WITH corpus AS (
+                SELECT
+                    COALESCE(MAX(num_chunks), 0)::float AS num_chunks,
+                    COALESCE(MAX(avg_length), 0)::float AS avg_length
+                FROM {self._get_table_name(PostgresChunksHandler.FTS_CORPUS_TABLE_NAME)}
+                WHERE fts_language = $2::regconfig
+            ),
+            query_terms AS (
+                SELECT tsvector_to_array(to_tsvector($2::regconfig, $1)) AS lexemes
+            ),
+            matches AS (
+                SELECT id, document_id, owner_id, collection_ids, text, metadata, fts
+                FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+                WHERE {" AND ".join(where_clauses)}
+                {candidate_clause}
+            )
             SELECT
-                id, document_id, owner_id, collection_ids, text, metadata,
-                ts_rank(fts, websearch_to_tsquery('english', $1), 32) as rank
-            FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-            {where_clause}
-        """
-
-        query += f"""
+                m.id, m.document_id, m.owner_id, m.collection_ids, m.text, m.metadata,
+                COALESCE(score.bm25, 0) AS rank
+            FROM matches m
+            CROSS JOIN corpus
+            CROSS JOIN query_terms
+            LEFT JOIN LATERAL (
+                SELECT SUM(
+                    ln(1 + (GREATEST(corpus.num_chunks, f.df) - f.df + 0.5) / (f.df + 0.5))
+                    * f.tf * ({k1} + 1)
+                    / (f.tf + {k1} * (1 - {b} + {b} * CASE
+                        WHEN corpus.avg_length > 0 THEN length(m.fts) / corpus.avg_length
+                        ELSE 1
+                    END))
+                ) AS bm25
+                FROM (
+                    SELECT
+                        COALESCE(array_length(t.positions, 1), 1) AS tf,
+                        COALESCE(s.ndoc, 0) AS df
+                    FROM unnest(m.fts) AS t
+                    LEFT JOIN {self._get_table_name(PostgresChunksHandler.FTS_TERMS_TABLE_NAME)} s
+                        ON s.fts_language = $2::regconfig AND s.lexeme = t.lexeme
+                    WHERE t.lexeme = ANY(query_terms.lexemes)
+                ) AS f
+            ) AS score ON TRUE
             ORDER BY rank DESC
             OFFSET ${len(params)+1} LIMIT ${len(params)+2}
         """
@@ -478,6 +724,101 @@ class PostgresChunksHandler(Handler):
             for r in results
         ]
 
+    async def refresh_full_text_statistics(self) -> None:
+        """
+        Recomputes the per-language document frequencies and average chunk
+        lengths used for BM25 ranking. This reads the whole table, so it is
+        run in the background when the table size drifts.
+
+        The statistics are aggregated into staging tables first and only the
+        rows that changed are then written to the summary tables, so a
+        refresh does not rewrite every term and searches keep reading the
+        previous statistics until it commits.
+        """
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        terms_table = self._get_table_name(
+            PostgresChunksHandler.FTS_TERMS_TABLE_NAME
+        )
+        corpus_table = self._get_table_name(
+            PostgresChunksHandler.FTS_CORPUS_TABLE_NAME
+        )
+        # A multi-statement query runs as a single implicit transaction, so
+        # searches never observe partially written statistics.
+        await self.connection_manager.execute_query(
+            f"""
+            CREATE TEMP TABLE staged_fts_terms ON COMMIT DROP AS
+            SELECT c.fts_language, t.lexeme, COUNT(*)::int AS ndoc
+            FROM {table_name} c, unnest(c.fts) AS t
+            GROUP BY c.fts_language, t.lexeme;
+
+            CREATE TEMP TABLE staged_fts_corpus ON COMMIT DROP AS
+            SELECT fts_language, COUNT(*) AS num_chunks, AVG(length(fts)) AS avg_length
+            FROM {table_name}
+            GROUP BY fts_language;
+
+            DELETE FROM {terms_table} s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM staged_fts_terms n
+                WHERE n.fts_language = s.fts_language AND n.lexeme = s.lexeme
+            );
+            INSERT INTO {terms_table} AS s (fts_language, lexeme, ndoc)
+            SELECT fts_language, lexeme, ndoc FROM staged_fts_terms
+            ON CONFLICT (fts_language, lexeme) DO UPDATE
+                SET ndoc = EXCLUDED.ndoc
+                WHERE s.ndoc <> EXCLUDED.ndoc;
+
+            DELETE FROM {corpus_table} s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM staged_fts_corpus n
+                WHERE n.fts_language = s.fts_language
+            );
+            INSERT INTO {corpus_table} AS s (fts_language, num_chunks, avg_length)
+            SELECT fts_language, num_chunks, avg_length FROM staged_fts_corpus
+            ON CONFLICT (fts_language) DO UPDATE
+                SET num_chunks = EXCLUDED.num_chunks,
+                    avg_length = EXCLUDED.avg_length,
+                    refreshed_at = NOW();
+            """
+        )
+
+    async def _maybe_refresh_full_text_statistics(self) -> None:
+        now = time.monotonic()
+        if (
+            now - self._fts_stats_checked_at
+            < self.FULL_TEXT_STATS_CHECK_INTERVAL
+            or (self._fts_stats_task and not self._fts_stats_task.done())
+        ):
+            return
+        self._fts_stats_checked_at = now
+
+        row = await self.connection_manager.fetchrow_query(
+            f"""
+            SELECT
+                (SELECT COALESCE(SUM(num_chunks), 0)::float FROM {self._get_table_name(PostgresChunksHandler.FTS_CORPUS_TABLE_NAME)}) AS indexed,
+                (SELECT reltuples FROM pg_class WHERE oid = $1::regclass) AS estimated
+            """,
+            [self._get_table_name(PostgresChunksHandler.TABLE_NAME)],
+        )
+        indexed, estimated = row["indexed"], row["estimated"]
+        # `reltuples` is -1 until the table is first vacuumed or analyzed
+        if indexed == 0 or (
+            estimated >= 0
+            and abs(estimated - indexed) > self.FULL_TEXT_STATS_DRIFT * indexed
+        ):
+            self._fts_stats_task = asyncio.create_task(
+                self._refresh_full_text_statistics_in_background()
+            )
+
+    async def _refresh_full_text_statistics_in_background(self) -> None:
+        try:
+            start_time = time.time()
+            await self.refresh_full_text_statistics()
+            logger.info(
+                f"Refreshed full-text statistics in {time.time() - start_time:.2f} seconds."
+            )
+        except Exception as e:
+            logger.error(f"Failed to refresh full-text statistics: {e}")
+
     async def hybrid_search(
         self,
         query_text: str,
@@ -606,6 +947,276 @@ class PostgresChunksHandler(Handler):
             for result in results
         }
 
+    async def delete_by_filter(
+        self, filters: dict[str, Any], batch_size: int = 10_000
+    ) -> dict[str, Any]:
+        """
+        Delete up to `batch_size` chunks matching `filters` in one
+        transaction.
+
+        Only a filter on document-level fields (document, owner and
+        collection ids) deletes documents: the matching documents this
+        leaves without chunks are purged too, as are matching documents
+        that had no chunks to begin with, such as ones that failed
+        ingestion. Purged documents take their file, document-level
+        entities and relationships with them, and the graphs of their
+        collections are marked outdated. Any other filter, such as one on
+        chunk ids or metadata, leaves the parent documents in place.
+
+        Returns the number of chunks deleted, the ids of the purged
+        documents, and whether more chunks or documents still match,
+        including chunks skipped because another transaction locked them.
+        """
+        chunks_table = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        documents_table = self._get_table_name("documents")
+
+        params: list[Any] = []
+        where_clause = self._build_filters(filters, params)
+        delete_chunks_query = f"""
+        WITH deleted AS (
+            DELETE FROM {chunks_table}
+            WHERE id IN (
+                SELECT id FROM {chunks_table}
+                WHERE {where_clause}
+                LIMIT {int(batch_size)}
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING document_id
+        )
+        SELECT document_id, COUNT(*) AS count
+        FROM deleted
+        GROUP BY document_id;
+        """
+        # Unlike the delete, this sees rows locked by other transactions
+        remaining_chunks_query = f"""
+        SELECT EXISTS (SELECT 1 FROM {chunks_table} WHERE {where_clause});
+        """
+
+        document_filters = self._to_document_filters(filters)
+        empty_documents_query = None
+        document_params: list[Any] = []
+        if document_filters is not None:
+            document_where_clause = self._build_filters(
+                document_filters, document_params
+            )
+            empty_documents_query = f"""
+            SELECT d.id FROM {documents_table} d
+            WHERE {document_where_clause}
+            AND NOT EXISTS (
+                SELECT 1 FROM {chunks_table} c WHERE c.document_id = d.id
+            )
+            LIMIT {int(batch_size)};
+            """
+
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                rows = await conn.fetch(delete_chunks_query, *params)
+                chunks_deleted = sum(row["count"] for row in rows)
+                has_more = await conn.fetchval(remaining_chunks_query, *params)
+                document_ids: list[UUID] = []
+                if empty_documents_query:
+                    empty_rows = await conn.fetch(
+                        empty_documents_query, *document_params
+                    )
+                    has_more = has_more or len(empty_rows) >= batch_size
+                    document_ids = await self._purge_empty_documents(
+                        conn,
+                        list(
+                            {row["document_id"] for row in rows}
+                            | {row["id"] for row in empty_rows}
+                        ),
+                    )
+
+        return {
+            "chunks_deleted": chunks_deleted,
+            "document_ids": document_ids,
+            "has_more": has_more,
+        }
+
+    async def _purge_empty_documents(
+        self, conn, document_ids: list[UUID]
+    ) -> list[UUID]:
+        """Delete those of `document_ids` that have no chunks left."""
+        if not document_ids:
+            return []
+
+        purged = await conn.fetch(
+            f"""
+            DELETE FROM {self._get_table_name("documents")} d
+            WHERE d.id = ANY($1::uuid[])
+            AND NOT EXISTS (
+                SELECT 1
+                FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)} c
+                WHERE c.document_id = d.id
+            )
+            RETURNING d.id, d.collection_ids;
+            """,
+            document_ids,
+        )
+        purged_ids = [row["id"] for row in purged]
+        if not purged_ids:
+            return []
+
+        for table_name in ("documents_entities", "documents_relationships"):
+            await conn.execute(
+                f"""
+                DELETE FROM {self._get_table_name(table_name)}
+                WHERE parent_id = ANY($1::uuid[]);
+                """,
+                purged_ids,
+            )
+
+        oids = await conn.fetch(
+            f"""
+            DELETE FROM {self._get_table_name("files")}
+            WHERE document_id = ANY($1::uuid[])
+            RETURNING oid;
+            """,
+            purged_ids,
+        )
+        if oids:
+            await conn.execute(
+                "SELECT lo_unlink(oid) FROM unnest($1::oid[]) AS oid;",
+                [row["oid"] for row in oids],
+            )
+
+        collection_ids = {
+            collection_id
+            for row in purged
+            for collection_id in row["collection_ids"] or []
+        }
+        if collection_ids:
+            await conn.execute(
+                f"""
+                UPDATE {self._get_table_name("collections")}
+                SET graph_sync_status = $2, graph_cluster_status = $2
+                WHERE id = ANY($1::uuid[]);
+                """,
+                list(collection_ids),
+                KGEnrichmentStatus.OUTDATED.value,
+            )
+
+        return purged_ids
+
+    @staticmethod
+    def _to_document_filters(
+        filters: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        """
+        Rewrite a chunk filter for the documents table, or return None if it
+        refers to anything other than document, owner and collection ids.
+        """
+        if not isinstance(filters, dict):
+            return None
+        translated: dict[str, Any] = {}
+        for key, value in filters.items():
+            if key in ("$and", "$or"):
+                conditions = [
+                    PostgresChunksHandler._to_document_filters(condition)
+                    for condition in value
+                ]
+                if any(condition is None for condition in conditions):
+                    return None
+                translated[key] = conditions
+            elif key == "document_id":
+                translated["id"] = value
+            elif key in ("owner_id", "collection_ids"):
+                translated[key] = value
+            else:
+                return None
+        return translated
+
+    async def get_document_chunk_hashes(
+        self, document_id: UUID
+    ) -> list[tuple[UUID, str]]:
+        """Return the id and content hash of each chunk of a document."""
+        query = f"""
+        SELECT id, content_hash
+        FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+        WHERE document_id = $1
+        ORDER BY (metadata->>'chunk_order')::integer NULLS LAST, id;
+        """
+        results = await self.connection_manager.fetch_query(
+            query, (document_id,)
+        )
+        return [(result["id"], result["content_hash"]) for result in results]
+
+    async def replace_document_chunks(
+        self,
+        deleted: list[UUID],
+        updated: list[tuple[UUID, dict]],
+        entries: list[VectorEntry],
+    ) -> None:
+        """
+        Apply a re-ingestion to the stored chunks in a single transaction:
+        delete the chunks that are gone, replace the metadata of the kept
+        ones, leaving their vectors be, and upsert the new ones. Searches
+        never see a document with only part of the changes applied.
+        """
+        table_name = self._get_table_name(PostgresChunksHandler.TABLE_NAME)
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                if deleted:
+                    await conn.execute(
+                        f"DELETE FROM {table_name} WHERE id = ANY($1::uuid[]);",
+                        deleted,
+                    )
+                if updated:
+                    await conn.executemany(
+                        f"UPDATE {table_name} SET metadata = $2::jsonb WHERE id = $1;",
+                        [
+                            (chunk_id, json.dumps(metadata))
+                            for chunk_id, metadata in updated
+                        ],
+                    )
+                if entries:
+                    query, params = self._upsert_entries_statement(entries)
+                    await conn.executemany(query, params)
+
+    async def copy_document_chunks(
+        self,
+        source_document_id: UUID,
+        document_id: UUID,
+        owner_id: UUID,
+        collection_ids: list[UUID],
+        metadata: dict,
+        source_metadata: dict,
+    ) -> int:
+        """
+        Copy the chunks and vectors of one document onto another, as when
+        the same file is ingested again. The keys of `source_metadata`, the
+        metadata of the source document, are removed from each copied chunk
+        and `metadata` is merged in their place, so only what the parser
+        added is kept. Returns the number of chunks copied.
+        """
+        binary_col = (
+            ", vec_binary"
+            if self.quantization_type == VectorQuantizationType.INT1
+            else ""
+        )
+        query = f"""
+        INSERT INTO {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+            (id, document_id, owner_id, collection_ids, vec{binary_col}, text, metadata, fts_language)
+        SELECT md5($2::text || id::text)::uuid, $2, $3, $4::uuid[], vec{binary_col},
+            text, (metadata - $6::text[]) || $5::jsonb, fts_language
+        FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
+        WHERE document_id = $1
+        ON CONFLICT (id) DO NOTHING
+        RETURNING id;
+        """
+        results = await self.connection_manager.fetch_query(
+            query,
+            (
+                source_document_id,
+                document_id,
+                owner_id,
+                collection_ids,
+                json.dumps(metadata),
+                list(source_metadata),
+            ),
+        )
+        return len(results)
+
     async def assign_document_chunks_to_collection(
         self, document_id: UUID, collection_id: UUID
     ) -> None:
@@ -641,7 +1252,7 @@ class PostgresChunksHandler(Handler):
     async def delete_collection_vector(self, collection_id: UUID) -> None:
         query = f"""
          DELETE FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
-         WHERE $1 = ANY(collection_ids)
+         WHERE collection_ids @> ARRAY[$1]::uuid[]
          RETURNING collection_ids
          """
         results = await self.connection_manager.fetchrow_query(
@@ -724,6 +1335,7 @@ class PostgresChunksHandler(Handler):
         index_name: Optional[str] = None,
         index_column: Optional[str] = None,
         concurrently: bool = True,
+        build_settings: Optional[IndexBuildSettings] = None,
     ) -> None:
         """
         Creates an index for the collection.
@@ -753,6 +1365,7 @@ class PostgresChunksHandler(Handler):
             index_arguments: (IndexArgsIVFFlat | IndexArgsHNSW, optional): Index type specific arguments
             index_name (str, optional): The name of the index to create. Defaults to None.
             concurrently (bool, optional): Whether to create the index concurrently. Defaults to True.
+            build_settings (IndexBuildSettings, optional): Session settings applied only for this build.
         Raises:
             ArgError: If an invalid index method is used, or if *replace* is False and an index already exists.
         """
@@ -840,21 +1453,296 @@ class PostgresChunksHandler(Handler):
         """
 
         try:
+            await self._execute_index_statement(
+                create_index_sql, concurrently, build_settings
+            )
+        except Exception as e:
+            raise Exception(f"Failed to create index: {e}")
+        return None
+
+    async def _execute_index_statement(
+        self,
+        statement: str,
+        concurrently: bool = True,
+        build_settings: Optional[IndexBuildSettings] = None,
+    ) -> None:
+        """
+        Runs an index DDL statement on a dedicated connection.
+
+        Build settings are applied to that session only and reset before the
+        connection goes back to the pool, so a large `maintenance_work_mem`
+        never leaks into ordinary queries.
+        """
+        if not concurrently and build_settings is None:
+            await self.connection_manager.execute_query(statement)
+            return
+
+        async with (
+            self.connection_manager.pool.get_connection() as conn  # type: ignore
+        ):
             if concurrently:
-                async with (
-                    self.connection_manager.pool.get_connection() as conn  # type: ignore
+                # Disable automatic transaction management
+                await conn.execute(
+                    "SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED"
+                )
+            try:
+                if build_settings and build_settings.maintenance_work_mem:
+                    await conn.execute(
+                        "SELECT set_config('maintenance_work_mem', $1, false)",
+                        build_settings.maintenance_work_mem,
+                    )
+                if (
+                    build_settings
+                    and build_settings.max_parallel_maintenance_workers
+                    is not None
                 ):
-                    # Disable automatic transaction management
                     await conn.execute(
-                        "SET SESSION CHARACTERISTICS AS TRANSACTION ISOLATION LEVEL READ COMMITTED"
+                        "SELECT set_config('max_parallel_maintenance_workers', $1, false)",
+                        str(build_settings.max_parallel_maintenance_workers),
                     )
-                    await conn.execute(create_index_sql)
+                await conn.execute(statement)
+            finally:
+                if build_settings:
+                    await conn.execute("RESET maintenance_work_mem")
+                    await conn.execute(
+                        "RESET max_parallel_maintenance_workers"
+                    )
+
+    async def get_index_build_progress(
+        self, index_name: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """
+        Reports the progress of index builds running in this project's schema.
+
+        Args:
+            index_name (str, optional): Only report builds of this index.
+
+        Returns:
+            list[dict]: One entry per running build, with its phase and the
+                blocks and tuples processed so far.
+        """
+        query = """
+        SELECT
+            i.relname AS index_name,
+            t.relname AS table_name,
+            p.pid,
+            p.command,
+            p.phase,
+            p.blocks_total,
+            p.blocks_done,
+            p.tuples_total,
+            p.tuples_done
+        FROM pg_stat_progress_create_index p
+        JOIN pg_class t ON t.oid = p.relid
+        JOIN pg_namespace n ON n.oid = t.relnamespace
+        LEFT JOIN pg_class i ON i.oid = p.index_relid
+        WHERE n.nspname = $1
+        AND ($2::text IS NULL OR i.relname = $2 OR i.relname = $2 || '_rebuild')
+        """
+        results = await self.connection_manager.fetch_query(
+            query, [self.project_name, index_name]
+        )
+
+        progress = []
+        for result in results:
+            if result["blocks_total"]:
+                done, total = result["blocks_done"], result["blocks_total"]
             else:
-                # Non-concurrent index creation can use normal query execution
-                await self.connection_manager.execute_query(create_index_sql)
+                done, total = result["tuples_done"], result["tuples_total"]
+            progress.append(
+                {
+                    "index_name": result["index_name"],
+                    "table_name": result["table_name"],
+                    "pid": result["pid"],
+                    "command": result["command"],
+                    "phase": result["phase"],
+                    "blocks_done": result["blocks_done"],
+                    "blocks_total": result["blocks_total"],
+                    "tuples_done": result["tuples_done"],
+                    "tuples_total": result["tuples_total"],
+                    "percent_done": (
+                        round(100.0 * done / total, 2) if total else None
+                    ),
+                }
+            )
+        return progress
+
+    async def rebuild_index(
+        self,
+        index_name: str,
+        table_name: VectorTableName,
+        index_method: Optional[IndexMethod] = None,
+        index_measure: Optional[IndexMeasure] = None,
+        index_arguments: Optional[IndexArgsIVFFlat | IndexArgsHNSW] = None,
+        build_settings: Optional[IndexBuildSettings] = None,
+        lock_timeout: str = "5s",
+        max_swap_attempts: int = 5,
+    ) -> None:
+        """
+        Rebuilds a vector index without blocking reads or writes.
+
+        A replacement index is built concurrently next to the existing one.
+        Once it is valid, the old index is dropped and the replacement takes
+        its name in a single short transaction, so searches always have an
+        index to use.
+
+        Args:
+            index_name (str): Name of the index to rebuild.
+            table_name (VectorTableName): Table the index belongs to.
+            index_method (IndexMethod, optional): New index method. Defaults to the current one.
+            index_measure (IndexMeasure, optional): New distance measure. Defaults to the current one.
+            index_arguments (IndexArgsIVFFlat | IndexArgsHNSW, optional): New build parameters. Defaults to those of the current index when the method is unchanged.
+            build_settings (IndexBuildSettings, optional): Session settings applied only for the build.
+            lock_timeout (str): How long the swap waits for its lock before retrying.
+            max_swap_attempts (int): Number of times the swap is attempted.
+
+        Raises:
+            ArgError: If the table name is invalid or the index doesn't exist.
+            Exception: If the replacement can't be built or swapped in.
+        """
+        if table_name not in VectorTableName.__members__.values():
+            raise ArgError("invalid table name")
+
+        current = await self.connection_manager.fetchrow_query(
+            """
+            SELECT
+                am.amname AS method, a.attname AS column_name, o.opcname AS ops,
+                i.reloptions AS options
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            JOIN pg_class t ON t.oid = x.indrelid
+            JOIN pg_namespace n ON n.oid = i.relnamespace
+            JOIN pg_am am ON am.oid = i.relam
+            JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = x.indkey[0]
+            JOIN pg_opclass o ON o.oid = x.indclass[0]
+            WHERE n.nspname = $1 AND t.relname = $2 AND i.relname = $3
+            """,
+            [self.project_name, str(table_name), index_name],
+        )
+        if not current:
+            raise ArgError(
+                f"Vector index '{index_name}' does not exist on table {self.project_name}.{table_name}"
+            )
+
+        if index_method in (None, IndexMethod.auto):
+            index_method = IndexMethod(current["method"])
+        # Without new build parameters, the replacement keeps the ones the
+        # current index was built with rather than falling back to defaults
+        if index_arguments is None and index_method == current["method"]:
+            index_options = (
+                f"WITH ({', '.join(current['options'])})"
+                if current["options"]
+                else ""
+            )
+        else:
+            index_options = self._get_index_options(
+                index_method, index_arguments
+            )
+        if index_method not in (IndexMethod.ivfflat, IndexMethod.hnsw):
+            raise ArgError("invalid index method")
+        if index_measure is not None:
+            ops = index_measure_to_ops(index_measure)
+            if ops is None:
+                raise ArgError("Unknown index measure")
+        else:
+            ops = current["ops"]
+        if (
+            isinstance(index_arguments, IndexArgsHNSW)
+            and index_method != IndexMethod.hnsw
+        ) or (
+            isinstance(index_arguments, IndexArgsIVFFlat)
+            and index_method != IndexMethod.ivfflat
+        ):
+            raise ArgError(
+                f"{index_arguments.__class__.__name__} build parameters were supplied but {index_method} index was specified."
+            )
+
+        table_name_str = f"{self.project_name}.{table_name}"
+        replacement_name = f"{index_name[:55]}_rebuild"
+
+        # A previous rebuild that failed part way leaves an invalid index
+        # behind, which would make the build below fail.
+        await self._execute_index_statement(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {self.project_name}.{replacement_name}"
+        )
+
+        try:
+            await self._execute_index_statement(
+                f"""
+                CREATE INDEX CONCURRENTLY {replacement_name}
+                ON {table_name_str}
+                USING {index_method} ({current["column_name"]} {ops}) {index_options};
+                """,
+                build_settings=build_settings,
+            )
+
+            is_valid = await self.connection_manager.fetchrow_query(
+                """
+                SELECT x.indisvalid
+                FROM pg_index x
+                JOIN pg_class i ON i.oid = x.indexrelid
+                JOIN pg_namespace n ON n.oid = i.relnamespace
+                WHERE n.nspname = $1 AND i.relname = $2
+                """,
+                [self.project_name, replacement_name],
+            )
+            if not is_valid or not is_valid["indisvalid"]:
+                raise Exception(
+                    f"Replacement index {replacement_name} was not built successfully"
+                )
+
+            await self._swap_index(
+                index_name, replacement_name, lock_timeout, max_swap_attempts
+            )
         except Exception as e:
-            raise Exception(f"Failed to create index: {e}")
-        return None
+            try:
+                await self._execute_index_statement(
+                    f"DROP INDEX CONCURRENTLY IF EXISTS {self.project_name}.{replacement_name}"
+                )
+            except Exception as cleanup_error:
+                logger.warning(
+                    f"Failed to drop replacement index {replacement_name}: {cleanup_error}"
+                )
+            raise Exception(f"Failed to rebuild index: {e}")
+
+    async def _swap_index(
+        self,
+        index_name: str,
+        replacement_name: str,
+        lock_timeout: str,
+        max_swap_attempts: int,
+    ) -> None:
+        """
+        Drops an index and renames its replacement in one transaction.
+
+        The drop needs an exclusive lock on the table, so a short lock timeout
+        keeps the swap from queueing every other query behind a long-running
+        one. The swap is retried with backoff instead.
+        """
+        for attempt in range(1, max_swap_attempts + 1):
+            async with (
+                self.connection_manager.pool.get_connection() as conn  # type: ignore
+            ):
+                try:
+                    async with conn.transaction():
+                        await conn.execute(
+                            "SELECT set_config('lock_timeout', $1, true)",
+                            lock_timeout,
+                        )
+                        await conn.execute(
+                            f"DROP INDEX {self.project_name}.{index_name}"
+                        )
+                        await conn.execute(
+                            f"ALTER INDEX {self.project_name}.{replacement_name} RENAME TO {index_name}"
+                        )
+                    return
+                except asyncpg.exceptions.LockNotAvailableError:
+                    if attempt == max_swap_attempts:
+                        raise
+                    logger.info(
+                        f"Lock not available to swap index {index_name}, retrying (attempt {attempt})"
+                    )
+            await asyncio.sleep(min(2**attempt, 30))
 
     def _build_filters(
         self, filters: dict, parameters: list[str | int | bytes]
@@ -880,16 +1768,15 @@ class PostgresChunksHandler(Handler):
                         return f"{key} != ALL(${len(parameters)})"
                     elif op == "$overlap":
                         parameters.append(clause)
-                        return f"{key} && ${len(parameters)}"
+                        return f"{key} && ${len(parameters)}::uuid[]"
                     elif op == "$contains":
                         parameters.append(clause)
-                        return f"{key} @> ${len(parameters)}"
+                        return f"{key} @> ${len(parameters)}::uuid[]"
                     elif op == "$any":
-                        if key == "collection_ids":
-                            parameters.append(f"%{clause}%")
-                            return f"array_to_string({key}, ',') LIKE ${len(parameters)}"
+                        # Array containment, unlike `= ANY(...)`, can be
+                        # served by the GIN index on the array column
                         parameters.append(clause)
-                        return f"${len(parameters)} = ANY({key})"
+                        return f"{key} @> ARRAY[${len(parameters)}]::uuid[]"
                     else:
                         raise FilterError(
                             f"Unsupported operator for column {key}: {op}"
@@ -900,80 +1787,15 @@ class PostgresChunksHandler(Handler):
                     return f"{key} = ${len(parameters)}"
             else:
                 # Handle JSON-based filters
-                json_col = "metadata"
                 if key.startswith("metadata."):
                     key = key.split("metadata.")[1]
                 if isinstance(value, dict):
                     op, clause = next(iter(value.items()))
-                    if op not in (
-                        "$eq",
-                        "$ne",
-                        "$lt",
-                        "$lte",
-                        "$gt",
-                        "$gte",
-                        "$in",
-                        "$contains",
-                    ):
-                        raise FilterError("unknown operator")
-
-                    if op == "$eq":
-                        parameters.append(json.dumps(clause))
-                        return (
-                            f"{json_col}->'{key}' = ${len(parameters)}::jsonb"
-                        )
-                    elif op == "$ne":
-                        parameters.append(json.dumps(clause))
-                        return (
-                            f"{json_col}->'{key}' != ${len(parameters)}::jsonb"
-                        )
-                    elif op == "$lt":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float < (${len(parameters)}::jsonb)::float"
-                    elif op == "$lte":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float <= (${len(parameters)}::jsonb)::float"
-                    elif op == "$gt":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float > (${len(parameters)}::jsonb)::float"
-                    elif op == "$gte":
-                        parameters.append(json.dumps(clause))
-                        return f"({json_col}->'{key}')::float >= (${len(parameters)}::jsonb)::float"
-                    elif op == "$in":
-                        # Ensure clause is a list
-                        if not isinstance(clause, list):
-                            raise FilterError(
-                                "argument to $in filter must be a list"
-                            )
-                        # Append the Python list as a parameter; many drivers can convert Python lists to arrays
-                        parameters.append(clause)
-                        # Cast the parameter to a text array type
-                        return f"(metadata->>'{key}')::text = ANY(${len(parameters)}::text[])"
-
-                    # elif op == "$in":
-                    #     if not isinstance(clause, list):
-                    #         raise FilterError(
-                    #             "argument to $in filter must be a list"
-                    #         )
-                    #     parameters.append(json.dumps(clause))
-                    #     return f"{json_col}->'{key}' = ANY(SELECT jsonb_array_elements(${len(parameters)}::jsonb))"
-                    elif op == "$contains":
-                        if isinstance(clause, (int, float, str)):
-                            clause = [clause]
-                        # Now clause is guaranteed to be a list or array-like structure.
-                        parameters.append(json.dumps(clause))
-                        return (
-                            f"{json_col}->'{key}' @> ${len(parameters)}::jsonb"
-                        )
-
-                        # if not isinstance(clause, (int, str, float, list)):
-                        #     raise FilterError(
-                        #         "argument to $contains filter must be a scalar or array"
-                        #     )
-                        # parameters.append(json.dumps(clause))
-                        # return (
-                        #     f"{json_col}->'{key}' @> ${len(parameters)}::jsonb"
-                        # )
+                else:
+                    op, clause = "$eq", value
+                return self._plan_metadata_condition(
+                    key, op, clause, parameters
+                )
 
         def parse_filter(filter_dict: dict) -> str:
             filter_conditions = []
@@ -1007,6 +1829,103 @@ class PostgresChunksHandler(Handler):
 
         return where_clause
 
+    def _plan_metadata_condition(
+        self,
+        key: str,
+        op: str,
+        clause: Any,
+        parameters: list[str | int | bytes],
+    ) -> str:
+        """
+        Plan a single metadata filter so that it can use an index.
+
+        Equality, `$in` and `$contains` become JSONB containment checks
+        against the whole `metadata` column, served by its GIN index. Range
+        comparisons on keys declared in `metadata_indexes` are written
+        against the same expression the index was built on. Everything else
+        falls back to comparing the extracted value.
+
+        `$in` matches values by their text, as it did when it compared the
+        extracted `->>` value, so `"1"` and `1` match each other. Booleans
+        match JSON booleans.
+        """
+        field = f"metadata->{psql_quote_literal(key)}"
+
+        if op == "$eq":
+            if isinstance(clause, (list, dict)):
+                # Containment would also match supersets, keep exact equality
+                parameters.append(json.dumps(clause))
+                return f"{field} = ${len(parameters)}::jsonb"
+            parameters.append(json.dumps({key: clause}))
+            return f"metadata @> ${len(parameters)}::jsonb"
+        elif op == "$ne":
+            parameters.append(json.dumps(clause))
+            return f"{field} != ${len(parameters)}::jsonb"
+        elif op in ("$lt", "$lte", "$gt", "$gte"):
+            comparator = {"$lt": "<", "$lte": "<=", "$gt": ">", "$gte": ">="}[
+                op
+            ]
+            index_type = self.metadata_indexes.get(key)
+            if index_type is None:
+                parameters.append(json.dumps(clause))
+                return f"({field})::float {comparator} (${len(parameters)}::jsonb)::float"
+            function, sql_type = self.METADATA_INDEX_TYPES[index_type]
+            parameters.append(str(clause))
+            return f"{self.project_name}.{function}({field}) {comparator} ${len(parameters)}::text::{sql_type}"
+        elif op == "$in":
+            # Ensure clause is a list
+            if not isinstance(clause, list):
+                raise FilterError("argument to $in filter must be a list")
+            if not clause:
+                return "FALSE"
+            if len(clause) <= self.METADATA_IN_CONTAINMENT_LIMIT and all(
+                isinstance(item, (str, int, float, bool)) for item in clause
+            ):
+                conditions = []
+                for item in clause:
+                    for value in self._text_equivalent_values(item):
+                        parameters.append(json.dumps({key: value}))
+                        conditions.append(
+                            f"metadata @> ${len(parameters)}::jsonb"
+                        )
+                return f"({' OR '.join(conditions)})"
+            parameters.append([str(item) for item in clause])  # type: ignore
+            return f"(metadata->>{psql_quote_literal(key)})::text = ANY(${len(parameters)}::text[])"
+        elif op == "$contains":
+            if isinstance(clause, (int, float, str)):
+                clause = [clause]
+            # Now clause is guaranteed to be a list or array-like structure.
+            parameters.append(json.dumps({key: clause}))
+            return f"metadata @> ${len(parameters)}::jsonb"
+        else:
+            raise FilterError("unknown operator")
+
+    @staticmethod
+    def _text_equivalent_values(item: Any) -> list[Any]:
+        """
+        The JSON scalars whose `->>` text is the text of `item`, i.e. both
+        the number and the string form of a numeric value.
+        """
+        if isinstance(item, bool):
+            return [item]
+        if isinstance(item, (int, float)):
+            return [item, str(item)]
+
+        def reject(constant: str) -> Any:
+            raise ValueError(constant)
+
+        try:
+            number = json.loads(item, parse_constant=reject)
+        except ValueError:
+            return [item]
+        if (
+            isinstance(number, (int, float))
+            and not isinstance(number, bool)
+            and json.dumps(number) == item
+        ):
+            return [item, number]
+        return [item]
+
     async def list_indices(
         self,
         offset: int,
@@ -1050,9 +1969,11 @@ class PostgresChunksHandler(Handler):
                 COALESCE(psat.idx_scan, 0) as number_of_scans,
                 COALESCE(psat.idx_tup_read, 0) as tuples_read,
                 COALESCE(psat.idx_tup_fetch, 0) as tuples_fetched,
+                x.indisvalid as is_valid,
                 COUNT(*) OVER() as total_count
             FROM pg_indexes i
             JOIN pg_class c ON c.relname = i.indexname
+            JOIN pg_index x ON x.indexrelid = c.oid
             JOIN pg_am am ON c.relam = am.oid
             LEFT JOIN pg_stat_user_indexes psat ON psat.indexrelname = i.indexname
                 AND psat.schemaname = i.schemaname
@@ -1087,6 +2008,7 @@ class PostgresChunksHandler(Handler):
                     "number_of_scans": result["number_of_scans"],
                     "tuples_read": result["tuples_read"],
                     "tuples_fetched": result["tuples_fetched"],
+                    "is_valid": result["is_valid"],
                 }
                 indices.append(index_info)
 
@@ -1350,7 +2272,10 @@ class PostgresChunksHandler(Handler):
             list[dict[str, Any]]: List of documents with their search scores and complete metadata
         """
         where_clauses = []
-        params: list[str | int | bytes] = [query_text]
+        params: list[str | int | bytes] = [
+            query_text,
+            self._get_search_language(settings),
+        ]
 
         # Build the dynamic metadata field search expression
         metadata_fields_expr = " || ' ' || ".join(
@@ -1370,8 +2295,8 @@ class PostgresChunksHandler(Handler):
                     CASE WHEN $1 = '' THEN 0.0
                     ELSE
                         ts_rank_cd(
-                            setweight(to_tsvector('english', {metadata_fields_expr}), 'A'),
-                            websearch_to_tsquery('english', $1),
+                            setweight(to_tsvector($2::regconfig, {metadata_fields_expr}), 'A'),
+                            websearch_to_tsquery($2::regconfig, $1),
                             32
                         )
                     END as metadata_rank
@@ -1379,20 +2304,21 @@ class PostgresChunksHandler(Handler):
                 LEFT JOIN {self._get_table_name('documents')} d ON v.document_id = d.id
                 WHERE v.metadata IS NOT NULL
             ),
-            -- Body search scores
+            -- Body search scores, matched through the indexed `fts` column
             body_scores AS (
                 SELECT
                     document_id,
                     AVG(
                         ts_rank_cd(
-                            setweight(to_tsvector('english', COALESCE(text, '')), 'B'),
-                            websearch_to_tsquery('english', $1),
+                            setweight(fts, 'B'),
+                            websearch_to_tsquery($2::regconfig, $1),
                             32
                         )
                     ) as body_rank
                 FROM {self._get_table_name(PostgresChunksHandler.TABLE_NAME)}
                 WHERE $1 != ''
-                {f"AND to_tsvector('english', text) @@ websearch_to_tsquery('english', $1)" if settings.search_over_body else ""}
+                AND fts_language = $2::regconfig
+                AND fts @@ websearch_to_tsquery($2::regconfig, $1)
                 GROUP BY document_id
             ),
             -- Combined scores with document metadata
@@ -52,6 +52,75 @@ class PostgresCollectionsHandler(Handler):
             user_count INT DEFAULT 0,
             document_count INT DEFAULT 0
         );
+
+        -- Keep document_count in step with documents.collection_ids. The
+        -- trigger is statement level, so bulk updates adjust each affected
+        -- collection once rather than once per document.
+        CREATE OR REPLACE FUNCTION {self.project_name}.update_collection_document_count()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                WITH delta AS (
+                    SELECT DISTINCT r.id, m.collection_id, 1 AS n
+                    FROM new_rows r, unnest(r.collection_ids) AS m(collection_id)
+                ), totals AS (
+                    SELECT collection_id, SUM(n) AS n FROM delta GROUP BY collection_id
+                )
+                UPDATE {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)} c
+                SET document_count = c.document_count + t.n
+                FROM totals t WHERE c.id = t.collection_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                WITH delta AS (
+                    SELECT DISTINCT r.id, m.collection_id, -1 AS n
+                    FROM old_rows r, unnest(r.collection_ids) AS m(collection_id)
+                ), totals AS (
+                    SELECT collection_id, SUM(n) AS n FROM delta GROUP BY collection_id
+                )
+                UPDATE {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)} c
+                SET document_count = GREATEST(c.document_count + t.n, 0)
+                FROM totals t WHERE c.id = t.collection_id;
+            ELSE
+                WITH delta AS (
+                    SELECT DISTINCT r.id, m.collection_id, 1 AS n
+                    FROM new_rows r, unnest(r.collection_ids) AS m(collection_id)
+                    UNION ALL
+                    SELECT DISTINCT r.id, m.collection_id, -1 AS n
+                    FROM old_rows r, unnest(r.collection_ids) AS m(collection_id)
+                ), totals AS (
+                    SELECT collection_id, SUM(n) AS n FROM delta
+                    GROUP BY collection_id HAVING SUM(n) <> 0
+                )
+                UPDATE {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)} c
+                SET document_count = GREATEST(c.document_count + t.n, 0)
+                FROM totals t WHERE c.id = t.collection_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS collection_document_count_insert
+        ON {self._get_table_name('documents')};
+        CREATE TRIGGER collection_document_count_insert
+            AFTER INSERT ON {self._get_table_name('documents')}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_collection_document_count();
+
+        DROP TRIGGER IF EXISTS collection_document_count_update
+        ON {self._get_table_name('documents')};
+        CREATE TRIGGER collection_document_count_update
+            AFTER UPDATE ON {self._get_table_name('documents')}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_collection_document_count();
+
+        DROP TRIGGER IF EXISTS collection_document_count_delete
+        ON {self._get_table_name('documents')};
+        CREATE TRIGGER collection_document_count_delete
+            AFTER DELETE ON {self._get_table_name('documents')}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_collection_document_count();
         """
         await self.connection_manager.execute_query(query)
 
@@ -150,20 +219,10 @@ class PostgresCollectionsHandler(Handler):
         params.append(collection_id)
 
         query = f"""
-            WITH updated_collection AS (
-                UPDATE {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)}
-                SET {', '.join(update_fields)}
-                WHERE id = ${param_index}
-                RETURNING id, owner_id, name, description, graph_sync_status, graph_cluster_status, created_at, updated_at
-            )
-            SELECT
-                uc.*,
-                COUNT(DISTINCT u.id) FILTER (WHERE u.id IS NOT NULL) as user_count,
-                COUNT(DISTINCT d.id) FILTER (WHERE d.id IS NOT NULL) as document_count
-            FROM updated_collection uc
-            LEFT JOIN {self._get_table_name('users')} u ON uc.id = ANY(u.collection_ids)
-            LEFT JOIN {self._get_table_name('documents')} d ON uc.id = ANY(d.collection_ids)
-            GROUP BY uc.id, uc.owner_id, uc.name, uc.description, uc.graph_sync_status, uc.graph_cluster_status, uc.created_at, uc.updated_at
+            UPDATE {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)}
+            SET {', '.join(update_fields)}
+            WHERE id = ${param_index}
+            RETURNING id, owner_id, name, description, graph_sync_status, graph_cluster_status, created_at, updated_at, user_count, document_count
         """
         try:
             result = await self.connection_manager.fetchrow_query(
@@ -197,7 +256,7 @@ class PostgresCollectionsHandler(Handler):
         user_update_query = f"""
             UPDATE {self._get_table_name('users')}
             SET collection_ids = array_remove(collection_ids, $1)
-            WHERE $1 = ANY(collection_ids)
+            WHERE collection_ids @> ARRAY[$1]::uuid[]
         """
         await self.connection_manager.execute_query(
             user_update_query, [collection_id]
@@ -208,7 +267,7 @@ class PostgresCollectionsHandler(Handler):
             WITH updated AS (
                 UPDATE {self._get_table_name('documents')}
                 SET collection_ids = array_remove(collection_ids, $1)
-                WHERE $1 = ANY(collection_ids)
+                WHERE collection_ids @> ARRAY[$1]::uuid[]
                 RETURNING 1
             )
             SELECT COUNT(*) AS affected_rows FROM updated
@@ -244,14 +303,20 @@ class PostgresCollectionsHandler(Handler):
         Raises:
             R2RException: If the collection doesn't exist.
         """
-        if not await self.collection_exists(collection_id):
+        collection = await self.connection_manager.fetchrow_query(
+            f"""
+            SELECT document_count FROM {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)}
+            WHERE id = $1
+            """,
+            [collection_id],
+        )
+        if not collection:
             raise R2RException(status_code=404, message="Collection not found")
         query = f"""
             SELECT d.id, d.owner_id, d.type, d.metadata, d.title, d.version,
-                d.size_in_bytes, d.ingestion_status, d.extraction_status, d.created_at, d.updated_at, d.summary,
-                COUNT(*) OVER() AS total_entries
+                d.size_in_bytes, d.ingestion_status, d.extraction_status, d.created_at, d.updated_at, d.summary
             FROM {self._get_table_name('documents')} d
-            WHERE $1 = ANY(d.collection_ids)
+            WHERE d.collection_ids @> ARRAY[$1]::uuid[]
             ORDER BY d.created_at DESC
             OFFSET $2
         """
@@ -280,9 +345,10 @@ class PostgresCollectionsHandler(Handler):
             )
             for row in results
         ]
-        total_entries = results[0]["total_entries"] if results else 0
-
-        return {"results": documents, "total_entries": total_entries}
+        return {
+            "results": documents,
+            "total_entries": collection["document_count"],
+        }
 
     async def get_collections_overview(
         self,
@@ -418,15 +484,6 @@ class PostgresCollectionsHandler(Handler):
                     message="Document is already assigned to the collection",
                 )
 
-            update_collection_query = f"""
-                UPDATE {self._get_table_name('collections')}
-                SET document_count = document_count + 1
-                WHERE id = $1
-            """
-            await self.connection_manager.execute_query(
-                query=update_collection_query, params=[collection_id]
-            )
-
             return collection_id
 
         except R2RException:
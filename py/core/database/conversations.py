@@ -1,5 +1,5 @@
 import json
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 from uuid import UUID, uuid4
 
 from core.base import Handler, Message, R2RException
@@ -28,7 +28,9 @@ class PostgresConversationsHandler(Handler):
             id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
             user_id UUID,
             created_at TIMESTAMPTZ DEFAULT NOW(),
-            name TEXT
+            name TEXT,
+            summary TEXT,
+            summary_through UUID
         );
         """
 
@@ -43,6 +45,9 @@ class PostgresConversationsHandler(Handler):
             FOREIGN KEY (conversation_id) REFERENCES {self._get_table_name("conversations")}(id),
             FOREIGN KEY (parent_id) REFERENCES {self._get_table_name("messages")}(id)
         );
+
+        CREATE INDEX IF NOT EXISTS idx_messages_conversation_created_at
+        ON {self._get_table_name("messages")} (conversation_id, created_at, id);
         """
         await self.connection_manager.execute_query(create_conversations_query)
         await self.connection_manager.execute_query(create_messages_query)
@@ -315,8 +320,24 @@ class PostgresConversationsHandler(Handler):
         )
 
     async def get_conversation(
-        self, conversation_id: UUID
+        self,
+        conversation_id: UUID,
+        after: Optional[UUID] = None,
+        before: Optional[UUID] = None,
+        limit: int = -1,
     ) -> list[MessageResponse]:
+        """
+        Get the messages of a conversation in chronological order.
+
+        Args:
+            conversation_id (UUID): The conversation to read.
+            after (UUID, optional): Only return messages after this message.
+            before (UUID, optional): Only return messages before this message.
+            limit (int): Maximum number of messages to return, -1 for all.
+
+        Messages are paged by key on `(created_at, id)`, so reading a page
+        deep into a long conversation costs the same as reading the first.
+        """
         # Check conversation
         conv_query = f"SELECT extract(epoch from created_at) AS created_at_epoch FROM {self._get_table_name('conversations')} WHERE id = $1"
         conv_row = await self.connection_manager.fetchrow_query(
@@ -328,18 +349,33 @@ class PostgresConversationsHandler(Handler):
                 message=f"Conversation {conversation_id} not found.",
             )
 
-        # Retrieve messages in chronological order
-        # We'll recursively gather messages based on parent_id = NULL as root.
+        conditions = ["conversation_id = $1"]
+        params: list[Any] = [conversation_id]
+        if after:
+            params.append(after)
+            conditions.append(
+                f"(created_at, id) > (SELECT created_at, id FROM {self._get_table_name('messages')} WHERE id = ${len(params)})"
+            )
+        if before:
+            params.append(before)
+            conditions.append(
+                f"(created_at, id) < (SELECT created_at, id FROM {self._get_table_name('messages')} WHERE id = ${len(params)})"
+            )
+
+        limit_clause = ""
+        if limit != -1:
+            params.append(limit)
+            limit_clause = f"LIMIT ${len(params)}"
+
         # Since no branching, we simply order by created_at.
         msg_query = f"""
             SELECT id, content, metadata
             FROM {self._get_table_name("messages")}
-            WHERE conversation_id = $1
-            ORDER BY created_at ASC
+            WHERE {" AND ".join(conditions)}
+            ORDER BY created_at ASC, id ASC
+            {limit_clause}
         """
-        results = await self.connection_manager.fetch_query(
-            msg_query, [conversation_id]
-        )
+        results = await self.connection_manager.fetch_query(msg_query, params)
 
         return [
             MessageResponse(
@@ -350,6 +386,104 @@ class PostgresConversationsHandler(Handler):
             for row in results
         ]
 
+    async def get_recent_messages(
+        self,
+        conversation_id: UUID,
+        max_tokens: int,
+        token_counter: Callable[[str], int],
+        page_size: int = 32,
+    ) -> tuple[list[MessageResponse], bool]:
+        """
+        Get the most recent messages that fit within a token budget.
+
+        Messages are read newest first, a page at a time, and only as many
+        pages as the budget needs are loaded. The most recent message is
+        always included.
+
+        Returns:
+            tuple[list[MessageResponse], bool]: The messages in chronological
+                order, and whether older messages were left out.
+        """
+        window: list[MessageResponse] = []
+        used_tokens = 0
+        cursor: Optional[tuple] = None
+
+        while True:
+            params: list[Any] = [conversation_id, page_size]
+            cursor_clause = ""
+            if cursor:
+                params.extend(cursor)
+                cursor_clause = "AND (created_at, id) < ($3, $4)"
+            query = f"""
+                SELECT id, content, metadata, created_at
+                FROM {self._get_table_name("messages")}
+                WHERE conversation_id = $1 {cursor_clause}
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+            """
+            rows = await self.connection_manager.fetch_query(query, params)
+
+            for row in rows:
+                message = Message(**json.loads(row["content"]))
+                tokens = token_counter(
+                    message.content
+                    if isinstance(message.content, str)
+                    else json.dumps(message.content)
+                )
+                if window and used_tokens + tokens > max_tokens:
+                    window.reverse()
+                    return window, True
+                used_tokens += tokens
+                window.append(
+                    MessageResponse(
+                        id=str(row["id"]),
+                        message=message,
+                        metadata=json.loads(row["metadata"]),
+                    )
+                )
+
+            if len(rows) < page_size:
+                window.reverse()
+                return window, False
+            cursor = (rows[-1]["created_at"], rows[-1]["id"])
+
+    async def get_conversation_summary(
+        self, conversation_id: UUID
+    ) -> tuple[Optional[str], Optional[UUID]]:
+        """
+        Get the rolling summary of a conversation's older turns.
+
+        Returns:
+            tuple[Optional[str], Optional[UUID]]: The summary, and the last
+                message it covers.
+        """
+        query = f"""
+            SELECT summary, summary_through
+            FROM {self._get_table_name("conversations")}
+            WHERE id = $1
+        """
+        row = await self.connection_manager.fetchrow_query(
+            query, [conversation_id]
+        )
+        if not row:
+            return None, None
+        return row["summary"], row["summary_through"]
+
+    async def update_conversation_summary(
+        self,
+        conversation_id: UUID,
+        summary: str,
+        summary_through: UUID,
+    ) -> None:
+        query = f"""
+            UPDATE {self._get_table_name("conversations")}
+            SET summary = $1, summary_through = $2
+            WHERE id = $3
+        """
+        await self.connection_manager.execute_query(
+            query, [summary, summary_through, conversation_id]
+        )
+
     async def delete_conversation(self, conversation_id: UUID):
         # Check if conversation exists
         conv_query = f"SELECT 1 FROM {self._get_table_name('conversations')} WHERE id = $1"
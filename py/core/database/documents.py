@@ -64,6 +64,7 @@ class PostgresDocumentsHandler(Handler):
                 created_at TIMESTAMPTZ DEFAULT NOW(),
                 updated_at TIMESTAMPTZ DEFAULT NOW(),
                 ingestion_attempt_number INT DEFAULT 0,
+                content_hash TEXT NULL,
                 raw_tsvector tsvector GENERATED ALWAYS AS (
                     setweight(to_tsvector('english', COALESCE(title, '')), 'A') ||
                     setweight(to_tsvector('english', COALESCE(summary, '')), 'B') ||
@@ -73,6 +74,13 @@ class PostgresDocumentsHandler(Handler):
             CREATE INDEX IF NOT EXISTS idx_collection_ids_{self.project_name}
             ON {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)} USING GIN (collection_ids);
 
+            CREATE INDEX IF NOT EXISTS idx_documents_owner_id_{self.project_name}
+            ON {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)} (owner_id);
+
+            CREATE INDEX IF NOT EXISTS idx_documents_content_hash_{self.project_name}
+            ON {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)} (content_hash)
+            WHERE content_hash IS NOT NULL;
+
             -- Full text search index
             CREATE INDEX IF NOT EXISTS idx_doc_search_{self.project_name}
             ON {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}
@@ -199,6 +207,60 @@ class PostgresDocumentsHandler(Handler):
                         wait_time = 0.1 * (2**retries)  # Exponential backoff
                         await asyncio.sleep(wait_time)
 
+    async def set_content_hash(
+        self, document_id: UUID, content_hash: Optional[str]
+    ) -> None:
+        query = f"""
+        UPDATE {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}
+        SET content_hash = $2
+        WHERE id = $1
+        """
+        await self.connection_manager.execute_query(
+            query, [document_id, content_hash]
+        )
+
+    async def get_document_by_content_hash(
+        self,
+        content_hash: str,
+        exclude_id: Optional[UUID] = None,
+    ) -> Optional[dict]:
+        """
+        Return the id, title, metadata, summary and summary embedding of the
+        oldest successfully ingested document with the given content hash,
+        whichever user ingested it.
+        """
+        query = f"""
+        SELECT id, title, metadata, summary, summary_embedding
+        FROM {self._get_table_name(PostgresDocumentsHandler.TABLE_NAME)}
+        WHERE content_hash = $1
+          AND ingestion_status = $2
+          AND ($3::uuid IS NULL OR id != $3)
+        ORDER BY created_at
+        LIMIT 1
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query,
+            [
+                content_hash,
+                IngestionStatus.SUCCESS.value,
+                exclude_id,
+            ],
+        )
+        if result is None:
+            return None
+        summary_embedding = None
+        if result["summary_embedding"]:
+            summary_embedding = [
+                float(x) for x in result["summary_embedding"][1:-1].split(",")
+            ]
+        return {
+            "id": result["id"],
+            "title": result["title"],
+            "metadata": json.loads(result["metadata"] or "{}"),
+            "summary": result["summary"],
+            "summary_embedding": summary_embedding,
+        }
+
     async def delete(
         self, document_id: UUID, version: Optional[str] = None
     ) -> None:
@@ -259,7 +321,7 @@ class PostgresDocumentsHandler(Handler):
         """
         query = f"""
             SELECT id FROM {self._get_table_name(table_name)}
-            WHERE {status_type} = ANY($1) and $2 = ANY(collection_ids)
+            WHERE {status_type} = ANY($1) and collection_ids @> ARRAY[$2]::uuid[]
         """
         records = await self.connection_manager.fetch_query(
             query, [status, collection_id]
@@ -1626,7 +1626,7 @@ class PostgresGraphsHandler(Handler):
                 FROM {self._get_table_name("entity")}
                 WHERE document_id = ANY(
                     SELECT document_id FROM {self._get_table_name("documents")}
-                    WHERE $1 = ANY(collection_ids)
+                    WHERE collection_ids @> ARRAY[$1]::uuid[]
                 )
                 GROUP BY name
                 HAVING count(name) >= 5
@@ -2097,7 +2097,7 @@ class PostgresGraphsHandler(Handler):
 
             # setting the kg_creation_status to PENDING for this collection.
             QUERY = f"""
-                UPDATE {self._get_table_name("documents")} SET extraction_status = $1 WHERE $2::uuid = ANY(collection_ids)
+                UPDATE {self._get_table_name("documents")} SET extraction_status = $1 WHERE collection_ids @> ARRAY[$2::uuid]
             """
             await self.connection_manager.execute_query(
                 QUERY, [KGExtractionStatus.PENDING, collection_id]
@@ -0,0 +1,258 @@
+import json
+import logging
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+from core.base import Handler
+
+from .base import PostgresConnectionManager
+
+logger = logging.getLogger()
+
+
+class PostgresJobsHandler(Handler):
+    """
+    A durable job queue for the simple orchestration provider.
+
+    Jobs are claimed with `FOR UPDATE SKIP LOCKED`, so any number of workers,
+    in one process or many, can poll the table without blocking each other.
+    A claimed job is leased until `locked_until`; if its worker dies, the
+    lease runs out and another worker picks the job up again.
+    """
+
+    TABLE_NAME = "jobs"
+
+    # Held for the duration of a claim so that concurrency limits, which are
+    # checked against the jobs currently running, hold across workers
+    CLAIM_LOCK_KEY = 0x72327271
+
+    def __init__(
+        self,
+        project_name: str,
+        connection_manager: PostgresConnectionManager,
+    ):
+        super().__init__(project_name, connection_manager)
+
+    async def create_tables(self):
+        query = f"""
+        CREATE TABLE IF NOT EXISTS {self._get_table_name(PostgresJobsHandler.TABLE_NAME)} (
+            id UUID PRIMARY KEY,
+            workflow TEXT NOT NULL,
+            payload JSONB NOT NULL,
+            user_id UUID,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INT NOT NULL DEFAULT 0,
+            max_attempts INT NOT NULL DEFAULT 3,
+            run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            locked_until TIMESTAMPTZ,
+            worker_id TEXT,
+            error TEXT,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            updated_at TIMESTAMPTZ DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_pending
+            ON {self._get_table_name(PostgresJobsHandler.TABLE_NAME)} (run_after)
+            WHERE status = 'pending';
+        CREATE INDEX IF NOT EXISTS idx_jobs_running
+            ON {self._get_table_name(PostgresJobsHandler.TABLE_NAME)} (locked_until)
+            WHERE status = 'running';
+        """
+        await self.connection_manager.execute_query(query)
+
+    async def enqueue(
+        self,
+        workflow: str,
+        payload: dict,
+        user_id: Optional[UUID] = None,
+        max_attempts: int = 3,
+    ) -> UUID:
+        job_id = uuid4()
+        query = f"""
+        INSERT INTO {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+            (id, workflow, payload, user_id, max_attempts)
+        VALUES ($1, $2, $3::jsonb, $4, $5)
+        """
+        await self.connection_manager.execute_query(
+            query,
+            [
+                job_id,
+                workflow,
+                json.dumps(payload, default=str),
+                user_id,
+                max_attempts,
+            ],
+        )
+        return job_id
+
+    async def claim(
+        self,
+        worker_id: str,
+        visibility_timeout: float,
+        workflow_limits: dict[str, int],
+        user_limit: Optional[int] = None,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Lease the next runnable job, respecting the concurrency limits.
+
+        A job is runnable when it is pending and due, or when it is running
+        but its lease has expired. Workflows missing from `workflow_limits`
+        are not claimed.
+        """
+        table_name = self._get_table_name(PostgresJobsHandler.TABLE_NAME)
+        query = f"""
+        WITH running AS (
+            SELECT workflow, user_id
+            FROM {table_name}
+            WHERE status = 'running' AND locked_until > NOW()
+        ),
+        candidate AS (
+            SELECT j.id
+            FROM {table_name} j
+            WHERE (
+                (j.status = 'pending' AND j.run_after <= NOW())
+                OR (
+                    j.status = 'running'
+                    AND j.locked_until <= NOW()
+                    AND j.attempts < j.max_attempts
+                )
+            )
+            AND ($2::jsonb ? j.workflow)
+            AND (
+                SELECT COUNT(*) FROM running r WHERE r.workflow = j.workflow
+            ) < ($2::jsonb ->> j.workflow)::int
+            AND (
+                $3::int IS NULL
+                OR j.user_id IS NULL
+                OR (
+                    SELECT COUNT(*) FROM running r WHERE r.user_id = j.user_id
+                ) < $3::int
+            )
+            ORDER BY j.run_after, j.created_at
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE {table_name} j
+        SET status = 'running',
+            attempts = j.attempts + 1,
+            locked_until = NOW() + make_interval(secs => $4),
+            worker_id = $1,
+            updated_at = NOW()
+        FROM candidate
+        WHERE j.id = candidate.id
+        RETURNING j.id, j.workflow, j.payload, j.user_id, j.attempts, j.max_attempts
+        """
+        async with self.connection_manager.pool.get_connection() as conn:  # type: ignore
+            async with conn.transaction():
+                await conn.execute(
+                    "SELECT pg_advisory_xact_lock($1)",
+                    PostgresJobsHandler.CLAIM_LOCK_KEY,
+                )
+                row = await conn.fetchrow(
+                    query,
+                    worker_id,
+                    json.dumps(workflow_limits),
+                    user_limit,
+                    float(visibility_timeout),
+                )
+
+        if row is None:
+            return None
+        return {
+            "id": row["id"],
+            "workflow": row["workflow"],
+            "payload": json.loads(row["payload"]),
+            "user_id": row["user_id"],
+            "attempts": row["attempts"],
+            "max_attempts": row["max_attempts"],
+        }
+
+    async def extend_lease(
+        self, job_id: UUID, worker_id: str, visibility_timeout: float
+    ) -> bool:
+        query = f"""
+        UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        SET locked_until = NOW() + make_interval(secs => $3),
+            updated_at = NOW()
+        WHERE id = $1 AND worker_id = $2 AND status = 'running'
+        RETURNING id
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query, [job_id, worker_id, float(visibility_timeout)]
+        )
+        return result is not None
+
+    async def complete(self, job_id: UUID, worker_id: str) -> None:
+        query = f"""
+        UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        SET status = 'completed', locked_until = NULL, error = NULL,
+            updated_at = NOW()
+        WHERE id = $1 AND worker_id = $2
+        """
+        await self.connection_manager.execute_query(query, [job_id, worker_id])
+
+    async def fail(
+        self,
+        job_id: UUID,
+        worker_id: str,
+        error: str,
+        retry_delay: float,
+    ) -> None:
+        """Schedule a retry after `retry_delay`, or fail the job for good."""
+        query = f"""
+        UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        SET status = CASE WHEN attempts < max_attempts
+                THEN 'pending' ELSE 'failed' END,
+            run_after = NOW() + make_interval(secs => $4),
+            locked_until = NULL,
+            error = $3,
+            updated_at = NOW()
+        WHERE id = $1 AND worker_id = $2
+        """
+        await self.connection_manager.execute_query(
+            query, [job_id, worker_id, error, float(retry_delay)]
+        )
+
+    async def release(self, job_id: UUID, worker_id: str) -> None:
+        """Hand a job back without counting the attempt, e.g. on shutdown."""
+        query = f"""
+        UPDATE {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        SET status = 'pending',
+            attempts = GREATEST(attempts - 1, 0),
+            run_after = NOW(),
+            locked_until = NULL,
+            updated_at = NOW()
+        WHERE id = $1 AND worker_id = $2 AND status = 'running'
+        """
+        await self.connection_manager.execute_query(query, [job_id, worker_id])
+
+    async def expire_abandoned(self, retention_days: int = 7) -> None:
+        """
+        Fail jobs whose lease ran out on their last attempt, and drop
+        finished jobs older than `retention_days`.
+        """
+        table_name = self._get_table_name(PostgresJobsHandler.TABLE_NAME)
+        query = f"""
+        UPDATE {table_name}
+        SET status = 'failed',
+            error = COALESCE(error, 'Worker lease expired'),
+            locked_until = NULL,
+            updated_at = NOW()
+        WHERE status = 'running'
+          AND locked_until <= NOW()
+          AND attempts >= max_attempts;
+
+        DELETE FROM {table_name}
+        WHERE status IN ('completed', 'failed')
+          AND updated_at < NOW() - make_interval(days => {int(retention_days)});
+        """
+        await self.connection_manager.execute_query(query)
+
+    async def get_job(self, job_id: UUID) -> Optional[dict[str, Any]]:
+        query = f"""
+        SELECT id, workflow, user_id, status, attempts, max_attempts,
+            run_after, error, created_at, updated_at
+        FROM {self._get_table_name(PostgresJobsHandler.TABLE_NAME)}
+        WHERE id = $1
+        """
+        result = await self.connection_manager.fetchrow_query(query, [job_id])
+        return dict(result) if result else None
@@ -0,0 +1,93 @@
+import logging
+import time
+from typing import Optional
+
+from core.base import Handler
+
+from .base import PostgresConnectionManager
+
+logger = logging.getLogger()
+
+
+class PostgresParseCacheHandler(Handler):
+    """
+    Caches the output of expensive parsing steps, such as a vision model's
+    description of a PDF page, by a hash of everything that produced it.
+
+    The cache is shared by all documents and users, so entries that have
+    not been used for `retention_days` are evicted as new ones are written.
+    """
+
+    TABLE_NAME = "parse_cache"
+
+    # Minimum number of seconds between evictions of unused entries
+    EVICTION_INTERVAL = 3600.0
+
+    connection_manager: PostgresConnectionManager
+
+    def __init__(
+        self,
+        project_name: str,
+        connection_manager: PostgresConnectionManager,
+        retention_days: int = 30,
+    ):
+        super().__init__(project_name, connection_manager)
+        self.retention_days = retention_days
+        self._evicted_at = float("-inf")
+
+    async def create_tables(self):
+        query = f"""
+        CREATE TABLE IF NOT EXISTS {self._get_table_name(PostgresParseCacheHandler.TABLE_NAME)} (
+            cache_key TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            created_at TIMESTAMPTZ DEFAULT NOW(),
+            last_used_at TIMESTAMPTZ DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS idx_parse_cache_last_used_at_{self.project_name}
+            ON {self._get_table_name(PostgresParseCacheHandler.TABLE_NAME)} (last_used_at);
+        """
+        await self.connection_manager.execute_query(query)
+
+    async def get_cached(self, cache_key: str) -> Optional[str]:
+        query = f"""
+        UPDATE {self._get_table_name(PostgresParseCacheHandler.TABLE_NAME)}
+        SET last_used_at = NOW()
+        WHERE cache_key = $1
+        RETURNING content
+        """
+        result = await self.connection_manager.fetchrow_query(
+            query, [cache_key]
+        )
+        return result["content"] if result else None
+
+    async def set_cached(self, cache_key: str, content: str) -> None:
+        query = f"""
+        INSERT INTO {self._get_table_name(PostgresParseCacheHandler.TABLE_NAME)}
+        (cache_key, content)
+        VALUES ($1, $2)
+        ON CONFLICT (cache_key) DO UPDATE SET
+            content = EXCLUDED.content,
+            created_at = NOW(),
+            last_used_at = NOW()
+        """
+        await self.connection_manager.execute_query(
+            query, [cache_key, content]
+        )
+        await self._maybe_evict()
+
+    async def evict_unused(self) -> None:
+        """Delete the entries that were not used for `retention_days`."""
+        query = f"""
+        DELETE FROM {self._get_table_name(PostgresParseCacheHandler.TABLE_NAME)}
+        WHERE last_used_at < NOW() - make_interval(days => $1)
+        """
+        await self.connection_manager.execute_query(
+            query, [self.retention_days]
+        )
+
+    async def _maybe_evict(self) -> None:
+        now = time.monotonic()
+        if now - self._evicted_at < self.EVICTION_INTERVAL:
+            return
+        self._evicted_at = now
+        await self.evict_unused()
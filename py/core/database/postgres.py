@@ -1,7 +1,11 @@
 # TODO: Clean this up and make it more congruent across the vector database and the relational database.
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import warnings
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 from ..base.abstractions import VectorQuantizationType
@@ -22,7 +26,9 @@ from .graphs import (
     PostgresGraphsHandler,
     PostgresRelationshipsHandler,
 )
+from .jobs import PostgresJobsHandler
 from .limits import PostgresLimitsHandler
+from .parse_cache import PostgresParseCacheHandler
 from .prompts_handler import PostgresPromptsHandler
 from .tokens import PostgresTokensHandler
 from .users import PostgresUserHandler
@@ -43,6 +49,11 @@ def get_env_var(new_var, old_var, config_value):
 
 
 class PostgresDatabaseProvider(DatabaseProvider):
+    # Records a fingerprint of the schema last set up, so that restarts
+    # without schema changes can skip running the DDL
+    SCHEMA_TABLE_NAME = "schema_state"
+    SCHEMA_LOCK_KEY = 0x72327273
+
     # R2R configuration settings
     config: DatabaseConfig
     project_name: str
@@ -76,6 +87,8 @@ class PostgresDatabaseProvider(DatabaseProvider):
     files_handler: PostgresFilesHandler
     conversations_handler: PostgresConversationsHandler
     limits_handler: PostgresLimitsHandler
+    jobs_handler: PostgresJobsHandler
+    parse_cache_handler: PostgresParseCacheHandler
 
     def __init__(
         self,
@@ -161,6 +174,9 @@ class PostgresDatabaseProvider(DatabaseProvider):
             self.connection_manager,
             self.dimension,
             self.quantization_type,
+            text_search_language=self.config.text_search_language,
+            full_text_index=self.config.full_text_index,
+            metadata_indexes=self.config.metadata_indexes,
         )
         self.conversations_handler = PostgresConversationsHandler(
             self.project_name, self.connection_manager
@@ -205,6 +221,14 @@ class PostgresDatabaseProvider(DatabaseProvider):
             connection_manager=self.connection_manager,
             config=self.config,
         )
+        self.jobs_handler = PostgresJobsHandler(
+            self.project_name, self.connection_manager
+        )
+        self.parse_cache_handler = PostgresParseCacheHandler(
+            self.project_name,
+            self.connection_manager,
+            retention_days=self.config.parse_cache_retention_days,
+        )
 
     async def initialize(self):
         logger.info("Initializing `PostgresDatabaseProvider`.")
@@ -214,30 +238,116 @@ class PostgresDatabaseProvider(DatabaseProvider):
         await self.pool.initialize()
         await self.connection_manager.initialize(self.pool)
 
-        async with self.pool.get_connection() as conn:
-            await conn.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
-            await conn.execute("CREATE EXTENSION IF NOT EXISTS vector;")
-            await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
-            await conn.execute("CREATE EXTENSION IF NOT EXISTS fuzzystrmatch;")
+        fingerprint = self._schema_fingerprint()
+        if await self._get_schema_fingerprint() == fingerprint:
+            logger.info("Database schema is current, skipping table setup.")
+        else:
+            # Serialize schema setup across replicas starting together
+            async with self.pool.get_connection() as conn:
+                await conn.execute(
+                    "SELECT pg_advisory_lock($1)", self.SCHEMA_LOCK_KEY
+                )
+                try:
+                    if await self._get_schema_fingerprint() != fingerprint:
+                        await self._create_tables(conn)
+                        await self._set_schema_fingerprint(conn, fingerprint)
+                finally:
+                    await conn.execute(
+                        "SELECT pg_advisory_unlock($1)", self.SCHEMA_LOCK_KEY
+                    )
+
+        await asyncio.gather(
+            self.chunks_handler.initialize(),
+            self.prompts_handler.initialize(),
+        )
 
-            # Create schema if it doesn't exist
-            await conn.execute(
-                f'CREATE SCHEMA IF NOT EXISTS "{self.project_name}";'
-            )
+    async def _create_tables(self, conn) -> None:
+        logger.info("Setting up database schema.")
+        await conn.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS vector;")
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS fuzzystrmatch;")
 
+        # Create schema if it doesn't exist
+        await conn.execute(
+            f'CREATE SCHEMA IF NOT EXISTS "{self.project_name}";'
+        )
+
+        # The users and collections handlers keep their document counts up
+        # to date with triggers on the documents table, so it must exist
+        # first, and their triggers are created one after the other. The
+        # remaining handlers only touch their own tables.
         await self.documents_handler.create_tables()
-        await self.collections_handler.create_tables()
-        await self.token_handler.create_tables()
         await self.users_handler.create_tables()
-        await self.chunks_handler.create_tables()
-        await self.prompts_handler.create_tables()
-        await self.files_handler.create_tables()
+        await self.collections_handler.create_tables()
+        await asyncio.gather(
+            self.token_handler.create_tables(),
+            self.chunks_handler.create_tables(),
+            self.prompts_handler.create_tables(),
+            self.files_handler.create_tables(),
+            self.conversations_handler.create_tables(),
+            self.limits_handler.create_tables(),
+            self.jobs_handler.create_tables(),
+            self.parse_cache_handler.create_tables(),
+        )
+        # The graph tables reference documents; the graphs handler also
+        # creates the entity, relationship and community tables.
         await self.graphs_handler.create_tables()
-        await self.communities_handler.create_tables()
-        await self.entities_handler.create_tables()
-        await self.relationships_handler.create_tables()
-        await self.conversations_handler.create_tables()
-        await self.limits_handler.create_tables()
+
+    def _schema_fingerprint(self) -> str:
+        """
+        Hash everything the schema is derived from: the handlers' DDL, which
+        lives in this package, and the settings it is parameterized by.
+        """
+        digest = hashlib.sha256()
+        package_dir = Path(__file__).parent
+        for path in sorted(package_dir.glob("*.py")):
+            digest.update(path.name.encode())
+            digest.update(path.read_bytes())
+        digest.update(
+            json.dumps(
+                {
+                    "project_name": self.project_name,
+                    "dimension": self.dimension,
+                    "quantization_type": str(self.quantization_type),
+                    "text_search_language": self.config.text_search_language,
+                    "full_text_index": self.config.full_text_index,
+                    "metadata_indexes": self.config.metadata_indexes,
+                },
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    async def _get_schema_fingerprint(self) -> Optional[str]:
+        table_name = f"{self.project_name}.{self.SCHEMA_TABLE_NAME}"
+        async with self.pool.get_connection() as conn:  # type: ignore
+            if not await conn.fetchval(
+                "SELECT to_regclass($1) IS NOT NULL", table_name
+            ):
+                return None
+            return await conn.fetchval(f"SELECT fingerprint FROM {table_name}")
+
+    async def _set_schema_fingerprint(self, conn, fingerprint: str) -> None:
+        table_name = f"{self.project_name}.{self.SCHEMA_TABLE_NAME}"
+        await conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+                fingerprint TEXT NOT NULL,
+                updated_at TIMESTAMPTZ DEFAULT NOW()
+            );
+            """
+        )
+        await conn.execute(
+            f"""
+            INSERT INTO {table_name} (id, fingerprint) VALUES (TRUE, $1)
+            ON CONFLICT (id) DO UPDATE SET
+                fingerprint = EXCLUDED.fingerprint, updated_at = NOW()
+            """,
+            fingerprint,
+        )
 
     def _get_postgres_configuration_settings(
         self, config: DatabaseConfig
@@ -284,6 +394,7 @@ class PostgresDatabaseProvider(DatabaseProvider):
         return settings
 
     async def close(self):
+        await self.prompts_handler.stop_listening()
         if self.pool:
             await self.pool.close()
 
@@ -1,12 +1,15 @@
+import asyncio
 import json
 import logging
 import os
 from abc import abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Generic, Optional, TypeVar
 
+import asyncpg
 import yaml
 
 from core.base import Handler, generate_default_prompt_id
@@ -29,7 +32,7 @@ class CacheEntry(Generic[T]):
 
 
 class Cache(Generic[T]):
-    """A generic cache implementation with TTL and LRU-like features"""
+    """A generic cache implementation with TTL and LRU eviction"""
 
     def __init__(
         self,
@@ -37,7 +40,9 @@ class Cache(Generic[T]):
         max_size: Optional[int] = 1000,
         cleanup_interval: timedelta = timedelta(hours=1),
     ):
-        self._cache: dict[str, CacheEntry[T]] = {}
+        # Entries are kept in access order, so the least recently used one
+        # is always first and eviction doesn't need to scan.
+        self._cache: OrderedDict[str, CacheEntry[T]] = OrderedDict()
         self._ttl = ttl
         self._max_size = max_size
         self._cleanup_interval = cleanup_interval
@@ -47,16 +52,17 @@ class Cache(Generic[T]):
         """Retrieve an item from cache"""
         self._maybe_cleanup()
 
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
 
-        entry = self._cache[key]
-
-        if self._ttl and datetime.now() - entry.created_at > self._ttl:
+        now = datetime.now()
+        if self._ttl and now - entry.created_at > self._ttl:
             del self._cache[key]
             return None
 
-        entry.last_accessed = datetime.now()
+        self._cache.move_to_end(key)
+        entry.last_accessed = now
         entry.access_count += 1
         return entry.value
 
@@ -68,6 +74,7 @@ class Cache(Generic[T]):
         self._cache[key] = CacheEntry(
             value=value, created_at=now, last_accessed=now
         )
+        self._cache.move_to_end(key)
 
         if self._max_size and len(self._cache) > self._max_size:
             self._evict_lru()
@@ -80,6 +87,9 @@ class Cache(Generic[T]):
         """Clear all cached items"""
         self._cache.clear()
 
+    def __len__(self) -> int:
+        return len(self._cache)
+
     def _maybe_cleanup(self) -> None:
         """Periodically clean up expired entries"""
         now = datetime.now()
@@ -101,38 +111,27 @@ class Cache(Generic[T]):
 
     def _evict_lru(self) -> None:
         """Remove least recently used item"""
-        if not self._cache:
-            return
-
-        lru_key = min(
-            self._cache.keys(), key=lambda k: self._cache[k].last_accessed
-        )
-        del self._cache[lru_key]
+        if self._cache:
+            self._cache.popitem(last=False)
 
 
 class CacheablePromptHandler(Handler):
-    """Abstract base class that adds caching capabilities to prompt handlers"""
+    """Abstract base class that adds caching capabilities to prompt handlers
+
+    Only templates are cached, keyed by prompt name. Rendering a template is
+    cheap, and rendered prompts almost never repeat since they embed search
+    results, so they are not cached.
+    """
 
     def __init__(
         self,
         cache_ttl: Optional[timedelta] = timedelta(hours=1),
         max_cache_size: Optional[int] = 1000,
     ):
-        self._prompt_cache = Cache[str](ttl=cache_ttl, max_size=max_cache_size)
         self._template_cache = Cache[dict](
             ttl=cache_ttl, max_size=max_cache_size
         )
 
-    def _cache_key(
-        self, prompt_name: str, inputs: Optional[dict] = None
-    ) -> str:
-        """Generate a cache key for a prompt request"""
-        if inputs:
-            # Sort dict items for consistent keys
-            sorted_inputs = sorted(inputs.items())
-            return f"{prompt_name}:{sorted_inputs}"
-        return prompt_name
-
     async def get_cached_prompt(
         self,
         prompt_name: str,
@@ -140,7 +139,7 @@ class CacheablePromptHandler(Handler):
         prompt_override: Optional[str] = None,
         bypass_cache: bool = False,
     ) -> str:
-        """Get a prompt with caching support"""
+        """Render a prompt from its cached template"""
         if prompt_override:
             if inputs:
                 try:
@@ -149,17 +148,10 @@ class CacheablePromptHandler(Handler):
                     return prompt_override
             return prompt_override
 
-        cache_key = self._cache_key(prompt_name, inputs)
-
-        if not bypass_cache:
-            cached = self._prompt_cache.get(cache_key)
-            if cached is not None:
-                logger.debug(f"Cache hit for prompt: {cache_key}")
-                return cached
+        if bypass_cache:
+            self._template_cache.invalidate(prompt_name)
 
-        result = await self._get_prompt_impl(prompt_name, inputs)
-        self._prompt_cache.set(cache_key, result)
-        return result
+        return await self._get_prompt_impl(prompt_name, inputs)
 
     async def get_prompt(  # type: ignore
         self,
@@ -204,15 +196,8 @@ class CacheablePromptHandler(Handler):
         input_types: Optional[dict[str, str]] = None,
     ) -> None:
         """Public method to update a prompt with proper cache invalidation"""
-        # First invalidate all caches for this prompt
+        # First invalidate the cached template for this prompt
         self._template_cache.invalidate(name)
-        cache_keys_to_invalidate = [
-            key
-            for key in self._prompt_cache._cache.keys()
-            if key.startswith(f"{name}:") or key == name
-        ]
-        for key in cache_keys_to_invalidate:
-            self._prompt_cache.invalidate(key)
 
         # Perform the update
         await self._update_prompt_impl(name, template, input_types)
@@ -255,6 +240,66 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         self.connection_manager = connection_manager
         self.project_name = project_name
         self.prompts: dict[str, dict[str, str | dict[str, str]]] = {}
+        self._listener_connection: Optional[asyncpg.Connection] = None
+
+    @property
+    def notification_channel(self) -> str:
+        """Channel on which prompt changes are announced to every worker."""
+        return f"{self.project_name}_prompts"
+
+    async def start_listening(self) -> None:
+        """
+        Invalidate cached templates when any worker changes a prompt.
+
+        A trigger on the prompts table sends the prompt name on
+        `notification_channel` whenever a row changes. The listener holds its
+        own connection outside the pool so it never takes a slot from queries.
+        """
+        if self._listener_connection is not None:
+            return
+        connection = None
+        try:
+            connection = await asyncpg.connect(
+                self.connection_manager.pool.connection_string  # type: ignore
+            )
+            await connection.add_listener(
+                self.notification_channel, self._on_prompt_notification
+            )
+            connection.add_termination_listener(self._on_listener_terminated)
+            self._listener_connection = connection
+        except Exception as e:
+            # Cached templates still expire through their TTL.
+            logger.warning(
+                f"Failed to listen for prompt changes, relying on cache TTL: {e}"
+            )
+            if connection is not None:
+                await connection.close()
+
+    async def stop_listening(self) -> None:
+        if self._listener_connection is None:
+            return
+        connection, self._listener_connection = (
+            self._listener_connection,
+            None,
+        )
+        connection.remove_termination_listener(self._on_listener_terminated)
+        try:
+            await connection.close()
+        except Exception as e:
+            logger.warning(f"Error closing prompt listener connection: {e}")
+
+    def _on_prompt_notification(
+        self, connection, pid: int, channel: str, name: str
+    ) -> None:
+        logger.debug(f"Prompt '{name}' changed, invalidating cached template")
+        self._template_cache.invalidate(name)
+
+    def _on_listener_terminated(self, connection) -> None:
+        # Notifications sent while reconnecting are lost, so start afresh.
+        logger.warning("Prompt listener connection lost, reconnecting")
+        self._listener_connection = None
+        self._template_cache.clear()
+        asyncio.get_running_loop().create_task(self.start_listening())
 
     async def _load_prompts(self) -> None:
         """Load prompts from both database and YAML files."""
@@ -363,9 +408,8 @@ class PostgresPromptsHandler(CacheablePromptHandler):
 
         if inputs:
             # Validate input types
-            for key, value in inputs.items():
-                expected_type = input_types.get(key)
-                if not expected_type:
+            for key in inputs:
+                if key not in input_types:
                     raise ValueError(
                         f"Unexpected input key: {key} expected input types: {input_types}"
                     )
@@ -414,11 +458,8 @@ class PostgresPromptsHandler(CacheablePromptHandler):
         if not template and not input_types:
             return
 
-        # Clear caches first
+        # Clear the cached template first
         self._template_cache.invalidate(name)
-        for key in list(self._prompt_cache._cache.keys()):
-            if key.startswith(f"{name}:"):
-                self._prompt_cache.invalidate(key)
 
         # Build update query
         set_clauses = []
@@ -492,9 +533,29 @@ class PostgresPromptsHandler(CacheablePromptHandler):
             BEFORE UPDATE ON {self._get_table_name("prompts")}
             FOR EACH ROW
             EXECUTE FUNCTION {self.project_name}.update_updated_at_column();
+
+        -- Announce changes so every worker drops its cached template
+        CREATE OR REPLACE FUNCTION {self.project_name}.notify_prompt_change()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify(TG_ARGV[0], COALESCE(NEW.name, OLD.name));
+            RETURN NULL;
+        END;
+        $$ language 'plpgsql';
+
+        DROP TRIGGER IF EXISTS notify_prompt_change
+        ON {self._get_table_name("prompts")};
+
+        CREATE TRIGGER notify_prompt_change
+            AFTER INSERT OR UPDATE OR DELETE ON {self._get_table_name("prompts")}
+            FOR EACH ROW
+            EXECUTE FUNCTION {self.project_name}.notify_prompt_change('{self.notification_channel}');
         """
         await self.connection_manager.execute_query(query)
+
+    async def initialize(self) -> None:
         await self._load_prompts()
+        await self.start_listening()
 
     async def add_prompt(
         self,
@@ -548,11 +609,6 @@ class PostgresPromptsHandler(CacheablePromptHandler):
             },  # Store as dict in cache
         )
 
-        # Invalidate any cached formatted prompts
-        for key in list(self._prompt_cache._cache.keys()):
-            if key.startswith(f"{name}:"):
-                self._prompt_cache.invalidate(key)
-
     async def get_all_prompts(self) -> dict[str, Any]:
         """Retrieve all stored prompts."""
         query = f"""
@@ -596,9 +652,6 @@ class PostgresPromptsHandler(CacheablePromptHandler):
 
         # Invalidate caches
         self._template_cache.invalidate(name)
-        for key in list(self._prompt_cache._cache.keys()):
-            if key.startswith(f"{name}:"):
-                self._prompt_cache.invalidate(key)
 
     async def get_message_payload(
         self,
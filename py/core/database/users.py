@@ -42,9 +42,148 @@ class PostgresUserHandler(Handler):
             reset_token TEXT,
             reset_token_expiry TIMESTAMPTZ,
             collection_ids UUID[] NULL,
+            document_count BIGINT NOT NULL DEFAULT 0,
+            total_size_in_bytes BIGINT NOT NULL DEFAULT 0,
             created_at TIMESTAMPTZ DEFAULT NOW(),
             updated_at TIMESTAMPTZ DEFAULT NOW()
         );
+
+        CREATE INDEX IF NOT EXISTS idx_users_collection_ids
+        ON {self._get_table_name(PostgresUserHandler.TABLE_NAME)} USING GIN (collection_ids);
+
+        -- Keep collections.user_count in step with users.collection_ids.
+        CREATE OR REPLACE FUNCTION {self.project_name}.update_collection_user_count()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                WITH delta AS (
+                    SELECT DISTINCT r.id, m.collection_id, 1 AS n
+                    FROM new_rows r, unnest(r.collection_ids) AS m(collection_id)
+                ), totals AS (
+                    SELECT collection_id, SUM(n) AS n FROM delta GROUP BY collection_id
+                )
+                UPDATE {self._get_table_name('collections')} c
+                SET user_count = c.user_count + t.n
+                FROM totals t WHERE c.id = t.collection_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                WITH delta AS (
+                    SELECT DISTINCT r.id, m.collection_id, -1 AS n
+                    FROM old_rows r, unnest(r.collection_ids) AS m(collection_id)
+                ), totals AS (
+                    SELECT collection_id, SUM(n) AS n FROM delta GROUP BY collection_id
+                )
+                UPDATE {self._get_table_name('collections')} c
+                SET user_count = GREATEST(c.user_count + t.n, 0)
+                FROM totals t WHERE c.id = t.collection_id;
+            ELSE
+                WITH delta AS (
+                    SELECT DISTINCT r.id, m.collection_id, 1 AS n
+                    FROM new_rows r, unnest(r.collection_ids) AS m(collection_id)
+                    UNION ALL
+                    SELECT DISTINCT r.id, m.collection_id, -1 AS n
+                    FROM old_rows r, unnest(r.collection_ids) AS m(collection_id)
+                ), totals AS (
+                    SELECT collection_id, SUM(n) AS n FROM delta
+                    GROUP BY collection_id HAVING SUM(n) <> 0
+                )
+                UPDATE {self._get_table_name('collections')} c
+                SET user_count = GREATEST(c.user_count + t.n, 0)
+                FROM totals t WHERE c.id = t.collection_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS collection_user_count_insert
+        ON {self._get_table_name(PostgresUserHandler.TABLE_NAME)};
+        CREATE TRIGGER collection_user_count_insert
+            AFTER INSERT ON {self._get_table_name(PostgresUserHandler.TABLE_NAME)}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_collection_user_count();
+
+        DROP TRIGGER IF EXISTS collection_user_count_update
+        ON {self._get_table_name(PostgresUserHandler.TABLE_NAME)};
+        CREATE TRIGGER collection_user_count_update
+            AFTER UPDATE ON {self._get_table_name(PostgresUserHandler.TABLE_NAME)}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_collection_user_count();
+
+        DROP TRIGGER IF EXISTS collection_user_count_delete
+        ON {self._get_table_name(PostgresUserHandler.TABLE_NAME)};
+        CREATE TRIGGER collection_user_count_delete
+            AFTER DELETE ON {self._get_table_name(PostgresUserHandler.TABLE_NAME)}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_collection_user_count();
+
+        -- Keep each owner's document count and storage total in step with
+        -- the documents table, so the users overview never aggregates it.
+        CREATE OR REPLACE FUNCTION {self.project_name}.update_user_document_stats()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                WITH totals AS (
+                    SELECT owner_id, COUNT(*) AS n, SUM(COALESCE(size_in_bytes, 0)) AS bytes
+                    FROM new_rows WHERE owner_id IS NOT NULL GROUP BY owner_id
+                )
+                UPDATE {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
+                SET document_count = u.document_count + t.n,
+                    total_size_in_bytes = u.total_size_in_bytes + t.bytes
+                FROM totals t WHERE u.id = t.owner_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                WITH totals AS (
+                    SELECT owner_id, COUNT(*) AS n, SUM(COALESCE(size_in_bytes, 0)) AS bytes
+                    FROM old_rows WHERE owner_id IS NOT NULL GROUP BY owner_id
+                )
+                UPDATE {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
+                SET document_count = GREATEST(u.document_count - t.n, 0),
+                    total_size_in_bytes = GREATEST(u.total_size_in_bytes - t.bytes, 0)
+                FROM totals t WHERE u.id = t.owner_id;
+            ELSE
+                WITH delta AS (
+                    SELECT owner_id, 1 AS n, COALESCE(size_in_bytes, 0)::bigint AS bytes
+                    FROM new_rows WHERE owner_id IS NOT NULL
+                    UNION ALL
+                    SELECT owner_id, -1 AS n, -COALESCE(size_in_bytes, 0)::bigint AS bytes
+                    FROM old_rows WHERE owner_id IS NOT NULL
+                ), totals AS (
+                    SELECT owner_id, SUM(n) AS n, SUM(bytes) AS bytes FROM delta
+                    GROUP BY owner_id HAVING SUM(n) <> 0 OR SUM(bytes) <> 0
+                )
+                UPDATE {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
+                SET document_count = GREATEST(u.document_count + t.n, 0),
+                    total_size_in_bytes = GREATEST(u.total_size_in_bytes + t.bytes, 0)
+                FROM totals t WHERE u.id = t.owner_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS user_document_stats_insert
+        ON {self._get_table_name('documents')};
+        CREATE TRIGGER user_document_stats_insert
+            AFTER INSERT ON {self._get_table_name('documents')}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_user_document_stats();
+
+        DROP TRIGGER IF EXISTS user_document_stats_update
+        ON {self._get_table_name('documents')};
+        CREATE TRIGGER user_document_stats_update
+            AFTER UPDATE ON {self._get_table_name('documents')}
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_user_document_stats();
+
+        DROP TRIGGER IF EXISTS user_document_stats_delete
+        ON {self._get_table_name('documents')};
+        CREATE TRIGGER user_document_stats_delete
+            AFTER DELETE ON {self._get_table_name('documents')}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION {self.project_name}.update_user_document_stats();
         """
         await self.connection_manager.execute_query(query)
 
@@ -398,16 +537,6 @@ class PostgresUserHandler(Handler):
                 status_code=400, message="User already in collection"
             )
 
-        update_collection_query = f"""
-            UPDATE {self._get_table_name('collections')}
-            SET user_count = user_count + 1
-            WHERE id = $1
-        """
-        await self.connection_manager.execute_query(
-            query=update_collection_query,
-            params=[collection_id],
-        )
-
         return True
 
     async def remove_user_from_collection(
@@ -449,15 +578,21 @@ class PostgresUserHandler(Handler):
         Raises:
             R2RException: If the collection doesn't exist.
         """
-        if not await self._collection_exists(collection_id):  # type: ignore
+        collection = await self.connection_manager.fetchrow_query(
+            f"""
+            SELECT user_count FROM {self._get_table_name(PostgresCollectionsHandler.TABLE_NAME)}
+            WHERE id = $1
+            """,
+            [collection_id],
+        )
+        if not collection:
             raise R2RException(status_code=404, message="Collection not found")
 
         query = f"""
             SELECT u.id, u.email, u.is_active, u.is_superuser, u.created_at, u.updated_at,
-                u.is_verified, u.collection_ids, u.name, u.bio, u.profile_picture,
-                COUNT(*) OVER() AS total_entries
+                u.is_verified, u.collection_ids, u.name, u.bio, u.profile_picture
             FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
-            WHERE $1 = ANY(u.collection_ids)
+            WHERE u.collection_ids @> ARRAY[$1]::uuid[]
             ORDER BY u.name
             OFFSET $2
         """
@@ -488,9 +623,7 @@ class PostgresUserHandler(Handler):
             for row in results
         ]
 
-        total_entries = results[0]["total_entries"] if results else 0
-
-        return {"results": users, "total_entries": total_entries}
+        return {"results": users, "total_entries": collection["user_count"]}
 
     async def mark_user_as_superuser(self, id: UUID):
         query = f"""
@@ -531,53 +664,66 @@ class PostgresUserHandler(Handler):
         offset: int,
         limit: int,
         user_ids: Optional[list[UUID]] = None,
+        after_email: Optional[str] = None,
     ) -> dict[str, list[User] | int]:
+        """
+        Page through users with their document statistics.
 
-        query = f"""
-            WITH user_document_ids AS (
-                SELECT
-                    u.id as user_id,
-                    ARRAY_AGG(d.id) FILTER (WHERE d.id IS NOT NULL) AS doc_ids
-                FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
-                LEFT JOIN {self._get_table_name('documents')} d ON u.id = d.owner_id
-                GROUP BY u.id
-            ),
-            user_docs AS (
-                SELECT
-                    u.id,
-                    u.email,
-                    u.is_superuser,
-                    u.is_active,
-                    u.is_verified,
-                    u.created_at,
-                    u.updated_at,
-                    u.collection_ids,
-                    COUNT(d.id) AS num_files,
-                    COALESCE(SUM(d.size_in_bytes), 0) AS total_size_in_bytes,
-                    ud.doc_ids as document_ids
-                FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)} u
-                LEFT JOIN {self._get_table_name('documents')} d ON u.id = d.owner_id
-                LEFT JOIN user_document_ids ud ON u.id = ud.user_id
-                {' WHERE u.id = ANY($3::uuid[])' if user_ids else ''}
-                GROUP BY u.id, u.email, u.is_superuser, u.is_active, u.is_verified,
-                         u.created_at, u.updated_at, u.collection_ids, ud.doc_ids
-            )
-            SELECT
-                user_docs.*,
-                COUNT(*) OVER() AS total_entries
-            FROM user_docs
-            ORDER BY email
-            OFFSET $1
+        Document counts and storage totals are maintained on the users table
+        by triggers, so only the users on the requested page are read. Passing
+        the last email of the previous page as `after_email` pages by key
+        instead of by offset, which stays fast however deep the page is.
+        """
+        conditions = []
+        params: list = []
+
+        if user_ids:
+            params.append(user_ids)
+            conditions.append(f"id = ANY(${len(params)}::uuid[])")
+
+        where_clause = (
+            f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        )
+        count_query = f"""
+            SELECT COUNT(*) AS total_entries
+            FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)}
+            {where_clause}
         """
+        count_params = list(params)
 
-        params: list = [offset]
+        if after_email is not None:
+            params.append(after_email)
+            conditions.append(f"email > ${len(params)}")
+            where_clause = f"WHERE {' AND '.join(conditions)}"
 
+        page_clause = ""
+        if after_email is None and offset:
+            params.append(offset)
+            page_clause += f" OFFSET ${len(params)}"
         if limit != -1:
-            query += " LIMIT $2"
             params.append(limit)
+            page_clause += f" LIMIT ${len(params)}"
 
-        if user_ids:
-            params.append(user_ids)
+        query = f"""
+            SELECT
+                u.*,
+                docs.document_ids
+            FROM (
+                SELECT id, email, is_superuser, is_active, is_verified,
+                    created_at, updated_at, collection_ids,
+                    document_count, total_size_in_bytes
+                FROM {self._get_table_name(PostgresUserHandler.TABLE_NAME)}
+                {where_clause}
+                ORDER BY email
+                {page_clause}
+            ) u
+            LEFT JOIN LATERAL (
+                SELECT ARRAY_AGG(d.id) AS document_ids
+                FROM {self._get_table_name('documents')} d
+                WHERE d.owner_id = u.id
+            ) docs ON TRUE
+            ORDER BY u.email
+        """
 
         results = await self.connection_manager.fetch_query(query, params)
 
@@ -591,7 +737,7 @@ class PostgresUserHandler(Handler):
                 created_at=row["created_at"],
                 updated_at=row["updated_at"],
                 collection_ids=row["collection_ids"] or [],
-                num_files=row["num_files"],
+                num_files=row["document_count"],
                 total_size_in_bytes=row["total_size_in_bytes"],
                 document_ids=(
                     []
@@ -602,12 +748,14 @@ class PostgresUserHandler(Handler):
             for row in results
         ]
 
-        if not users:
+        if not users and after_email is None:
             raise R2RException(status_code=404, message="No users found")
 
-        total_entries = results[0]["total_entries"]
+        total = await self.connection_manager.fetchrow_query(
+            count_query, count_params
+        )
 
-        return {"results": users, "total_entries": total_entries}
+        return {"results": users, "total_entries": total["total_entries"]}
 
     async def _collection_exists(self, collection_id: UUID) -> bool:
         """Check if a collection exists."""
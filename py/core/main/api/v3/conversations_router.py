@@ -261,15 +261,27 @@ class ConversationsRouter(BaseRouterV3):
             id: UUID = Path(
                 ..., description="The unique identifier of the conversation"
             ),
+            after: Optional[UUID] = Query(
+                None,
+                description="Only return messages that come after this message, for paging through long conversations.",
+            ),
+            limit: int = Query(
+                -1,
+                ge=-1,
+                le=1000,
+                description="The maximum number of messages to return, or -1 for all of them.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper),
         ) -> WrappedConversationMessagesResponse:
             """
             Get details of a specific conversation.
 
             This endpoint retrieves detailed information about a single conversation identified by its UUID.
+            Messages are returned in chronological order; pass the id of the last message received as `after`
+            to fetch the next page.
             """
             conversation = await self.services.management.get_conversation(
-                str(id)
+                str(id), after=after, limit=limit
             )
             return conversation
 
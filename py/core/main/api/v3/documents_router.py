@@ -1,13 +1,16 @@
 import base64
+import hashlib
 import json
 import logging
 import mimetypes
+import tarfile
 import textwrap
+import zipfile
 from io import BytesIO
-from typing import Any, Optional
+from typing import IO, Any, Optional
 from uuid import UUID
 
-from fastapi import Body, Depends, File, Form, Path, Query, UploadFile
+from fastapi import Body, Depends, File, Form, Header, Path, Query, UploadFile
 from fastapi.responses import StreamingResponse
 from pydantic import Json
 
@@ -27,6 +30,7 @@ from core.base.abstractions import KGCreationSettings, KGRunType
 from core.base.api.models import (
     GenericBooleanResponse,
     WrappedBooleanResponse,
+    WrappedBulkIngestionResponse,
     WrappedChunksResponse,
     WrappedCollectionsResponse,
     WrappedDocumentResponse,
@@ -43,6 +47,40 @@ from .base_router import BaseRouterV3
 
 logger = logging.getLogger()
 MAX_CHUNKS_PER_REQUEST = 1024 * 100
+MAX_DOCUMENTS_PER_REQUEST = 1_000
+
+
+def _parse_byte_range(range_header: str, size: int) -> tuple[int, int]:
+    """Parse a single `bytes=start-end` range into inclusive offsets."""
+    try:
+        unit, _, byte_range = range_header.partition("=")
+        if unit.strip() != "bytes" or "," in byte_range:
+            raise ValueError
+        first, _, last = byte_range.strip().partition("-")
+        if first:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+        else:
+            # A suffix range, the last `last` bytes
+            start = max(size - int(last), 0)
+            end = size - 1
+    except ValueError:
+        raise R2RException(
+            status_code=416, message=f"Invalid range '{range_header}'."
+        )
+    if start > end or start >= size:
+        raise R2RException(
+            status_code=416,
+            message=f"Range '{range_header}' is not satisfiable for a file of {size} bytes.",
+        )
+    return start, end
+
+
+def _is_hidden_path(path: str) -> bool:
+    # Skip dotfiles and the metadata folders archivers add, like __MACOSX
+    return any(
+        part.startswith((".", "__MACOSX")) for part in path.split("/") if part
+    )
 
 
 def merge_search_settings(
@@ -120,42 +158,52 @@ class DocumentsRouter(BaseRouterV3):
             {
                 "ingest-files": (
                     "Ingest files task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Document created and ingested successfully."
                 ),
+                "ingest-files-batch": (
+                    "Ingest files batch task queued successfully."
+                    if self.providers.orchestration.config.runs_in_background
+                    else "Documents created and ingested."
+                ),
                 "ingest-chunks": (
                     "Ingest chunks task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Document created and ingested successfully."
                 ),
                 "update-files": (
                     "Update file task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Update task queued successfully."
                 ),
                 "update-chunk": (
                     "Update chunk task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Chunk update completed successfully."
                 ),
                 "update-document-metadata": (
                     "Update document metadata task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Document metadata update completed successfully."
                 ),
                 "create-vector-index": (
                     "Vector index creation task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Vector index creation task completed successfully."
                 ),
+                "update-vector-index": (
+                    "Vector index update task queued successfully."
+                    if self.providers.orchestration.config.runs_in_background
+                    else "Vector index update task completed successfully."
+                ),
                 "delete-vector-index": (
                     "Vector index deletion task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Vector index deletion task completed successfully."
                 ),
                 "select-vector-index": (
                     "Vector index selection task queued successfully."
-                    if self.providers.orchestration.config.provider != "simple"
+                    if self.providers.orchestration.config.runs_in_background
                     else "Vector index selection task completed successfully."
                 ),
             },
@@ -436,6 +484,10 @@ class DocumentsRouter(BaseRouterV3):
                         message="Either a file or content must be provided.",
                     )
 
+            file_data["content_hash"] = hashlib.sha256(
+                file_content.getvalue()
+            ).hexdigest()
+
             workflow_input = {
                 "file_data": file_data,
                 "document_id": str(document_id),
@@ -489,6 +541,200 @@ class DocumentsRouter(BaseRouterV3):
                     "task_id": None,
                 }
 
+        @self.router.post(
+            "/documents/bulk",
+            dependencies=[Depends(self.rate_limit_dependency)],
+            status_code=202,
+            summary="Create documents in bulk",
+            openapi_extra={
+                "x-codeSamples": [
+                    {
+                        "lang": "Python",
+                        "source": textwrap.dedent(
+                            """
+                            from r2r import R2RClient
+
+                            client = R2RClient("http://localhost:7272")
+                            # when using auth, do client.login(...)
+
+                            response = client.documents.create_bulk(
+                                archive_path="essays.zip",
+                                metadata={"source": "essays"},
+                            )
+                            """
+                        ),
+                    },
+                    {
+                        "lang": "cURL",
+                        "source": textwrap.dedent(
+                            """
+                            curl -X POST "https://api.example.com/v3/documents/bulk" \\
+                            -H "Content-Type: multipart/form-data" \\
+                            -H "Authorization: Bearer YOUR_API_KEY" \\
+                            -F "files=@pg_essay_1.html;type=text/html" \\
+                            -F "files=@pg_essay_2.html;type=text/html" \\
+                            -F 'metadata={"source": "essays"}'
+                            """
+                        ),
+                    },
+                ]
+            },
+        )
+        @self.base_endpoint
+        async def create_documents_bulk(
+            files: Optional[list[UploadFile]] = File(
+                None,
+                description="The files to ingest.",
+            ),
+            archive: Optional[UploadFile] = File(
+                None,
+                description="A zip or tar archive of files to ingest. Each file in the archive becomes a document.",
+            ),
+            collection_ids: Optional[Json[list[UUID]]] = Form(
+                None,
+                description="Collection IDs to associate with every document. If none are provided, the documents will be assigned to the user's default collection.",
+            ),
+            metadata: Optional[Json[dict]] = Form(
+                None,
+                description="Metadata shared by every document. The title of each document defaults to its file name.",
+            ),
+            ingestion_mode: IngestionMode = Form(
+                default=IngestionMode.custom,
+                description="The ingestion mode, as for creating a single document.",
+            ),
+            ingestion_config: Optional[Json[IngestionConfig]] = Form(
+                None,
+                description="An optional dictionary to override the default chunking configuration for the ingestion process.",
+            ),
+            run_with_orchestration: Optional[bool] = Form(
+                True,
+                description="Whether or not ingestion runs with orchestration, default is `True`. When set to `False`, the ingestion process will run synchronous and directly return the status of each document.",
+            ),
+            auth_user=Depends(self.providers.auth.auth_wrapper),
+        ) -> WrappedBulkIngestionResponse:
+            """
+            Creates many documents at once from a list of files, an archive
+            of files, or both.
+
+            The documents are ingested by a single workflow that parses them
+            concurrently and embeds and stores their chunks in shared
+            batches, which cuts the per-document overhead of large loads
+            compared to creating each document on its own. A file that fails
+            to ingest does not stop the others; the response lists every
+            document with its status.
+            """
+            effective_ingestion_config = self._prepare_ingestion_config(
+                ingestion_mode=ingestion_mode,
+                ingestion_config=ingestion_config,
+            )
+            entries = [
+                (file.filename, await file.read()) for file in files or []
+            ]
+            if archive:
+                entries.extend(
+                    self._read_archive(
+                        archive.filename,
+                        await archive.read(),
+                        max_entries=MAX_DOCUMENTS_PER_REQUEST - len(entries),
+                        max_total_size=self.providers.ingestion.config.max_archive_size,
+                    )
+                )
+            if not entries:
+                raise R2RException(
+                    status_code=422,
+                    message="Either `files` or an `archive` must be provided.",
+                )
+            if len(entries) > MAX_DOCUMENTS_PER_REQUEST:
+                raise R2RException(
+                    f"Maximum of {MAX_DOCUMENTS_PER_REQUEST} documents per request",
+                    400,
+                )
+            # Document ids are derived from the file name, so a repeated
+            # name would silently overwrite the earlier file
+            seen_names: set[Optional[str]] = set()
+            for file_name, _ in entries:
+                if file_name in seen_names:
+                    raise R2RException(
+                        f"'{file_name}' is included more than once.", 422
+                    )
+                seen_names.add(file_name)
+
+            documents: list[dict[str, Any]] = []
+            for file_name, content in entries:
+                document_id = generate_document_id(file_name, auth_user.id)
+                content_type = (
+                    mimetypes.guess_type(file_name)[0]
+                    or "application/octet-stream"
+                )
+                await self.providers.database.files_handler.store_file(
+                    document_id, file_name, BytesIO(content), content_type
+                )
+                documents.append(
+                    {
+                        "document_id": str(document_id),
+                        "file_data": {
+                            "filename": file_name,
+                            "content_type": content_type,
+                            "content_hash": hashlib.sha256(
+                                content
+                            ).hexdigest(),
+                        },
+                        "size_in_bytes": len(content),
+                    }
+                )
+
+            workflow_input = {
+                "documents": documents,
+                "collection_ids": (
+                    [str(cid) for cid in collection_ids]
+                    if collection_ids
+                    else None
+                ),
+                "metadata": metadata or {},
+                "ingestion_config": effective_ingestion_config.model_dump(
+                    mode="json"
+                ),
+                "user": auth_user.model_dump_json(),
+            }
+
+            if run_with_orchestration:
+                raw_message: dict[str, Any] = await self.providers.orchestration.run_workflow(  # type: ignore
+                    "ingest-files-batch",
+                    {"request": workflow_input},
+                    options={
+                        "additional_metadata": {
+                            "document_count": len(documents),
+                        }
+                    },
+                )
+                raw_message["documents"] = [
+                    {
+                        "document_id": document["document_id"],
+                        "filename": document["file_data"]["filename"],
+                        "status": "pending",
+                        "error": None,
+                    }
+                    for document in documents
+                ]
+                return raw_message  # type: ignore
+            else:
+                logger.info(
+                    f"Running bulk ingestion without orchestration for {len(documents)} documents."
+                )
+                from core.main.orchestration import simple_ingestion_factory
+
+                simple_ingestor = simple_ingestion_factory(
+                    self.services.ingestion  # type: ignore
+                )
+                result = await simple_ingestor["ingest-files-batch"](
+                    workflow_input
+                )
+                return {  # type: ignore
+                    "message": "Documents created and ingested.",
+                    "task_id": None,
+                    "documents": result["documents"],
+                }
+
         @self.router.get(
             "/documents",
             dependencies=[Depends(self.rate_limit_dependency)],
@@ -895,6 +1141,16 @@ class DocumentsRouter(BaseRouterV3):
         @self.base_endpoint
         async def get_document_file(
             id: str = Path(..., description="Document ID"),
+            range_header: Optional[str] = Header(
+                None,
+                alias="Range",
+                description="An optional byte range, such as `bytes=1048576-`, to resume an interrupted download.",
+            ),
+            if_range: Optional[str] = Header(
+                None,
+                alias="If-Range",
+                description="The `ETag` of a partially downloaded file. The range is only served if the file is unchanged, otherwise the whole file is sent.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper),
         ) -> StreamingResponse:
             """
@@ -902,6 +1158,8 @@ class DocumentsRouter(BaseRouterV3):
 
             For uploaded files, returns the original file with its proper MIME type.
             For text-only documents, returns the content as plain text.
+            A single byte range may be requested with the `Range` header,
+            guarded by `If-Range` with the `ETag` of an earlier response.
 
             Users can only download documents they own or have access to through collections.
             """
@@ -968,21 +1226,41 @@ class DocumentsRouter(BaseRouterV3):
             if not mime_type:
                 mime_type = "application/octet-stream"
 
+            # Changes whenever the document's file is replaced
+            etag = '"{}"'.format(
+                hashlib.sha256(
+                    f"{document_uuid}:{document.version}:{document.updated_at}:{file_size}".encode()
+                ).hexdigest()[:32]
+            )
+            headers = {
+                "Content-Disposition": f'inline; filename="{file_name}"',
+                "Accept-Ranges": "bytes",
+                "ETag": etag,
+            }
+            status_code = 200
+            start, end = 0, file_size - 1
+            if range_header and (if_range is None or if_range == etag):
+                start, end = _parse_byte_range(range_header, file_size)
+                file_content.seek(start)
+                status_code = 206
+                headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+            headers["Content-Length"] = str(end - start + 1)
+
             async def file_stream():
                 chunk_size = 1024 * 1024  # 1MB
-                while True:
-                    data = file_content.read(chunk_size)
+                remaining = end - start + 1
+                while remaining > 0:
+                    data = file_content.read(min(chunk_size, remaining))
                     if not data:
                         break
+                    remaining -= len(data)
                     yield data
 
             return StreamingResponse(
                 file_stream(),
+                status_code=status_code,
                 media_type=mime_type,
-                headers={
-                    "Content-Disposition": f'inline; filename="{file_name}"',
-                    "Content-Length": str(file_size),
-                },
+                headers=headers,
             )
 
         @self.router.delete(
@@ -1621,6 +1899,82 @@ class DocumentsRouter(BaseRouterV3):
             )
             return results
 
+    @staticmethod
+    def _read_archive(
+        archive_name: str,
+        content: bytes,
+        max_entries: int,
+        max_total_size: int,
+    ) -> list[tuple[str, bytes]]:
+        """
+        Return the name and contents of each file in a zip or tar archive.
+
+        The number of files and their total uncompressed size are checked
+        against the limits before anything is extracted, and every read is
+        capped at what is left of the size limit, since the sizes an
+        archive declares can't be trusted.
+        """
+
+        def check_count(count: int) -> None:
+            if count > max_entries:
+                raise R2RException(
+                    f"Maximum of {MAX_DOCUMENTS_PER_REQUEST} documents per request",
+                    400,
+                )
+
+        def check_size(total_size: int) -> None:
+            if total_size > max_total_size:
+                raise R2RException(
+                    f"'{archive_name}' exceeds the maximum uncompressed size of {max_total_size} bytes.",
+                    413,
+                )
+
+        def read_capped(stream: IO[bytes], total_size: int) -> bytes:
+            data = stream.read(max_total_size - total_size + 1)
+            check_size(total_size + len(data))
+            return data
+
+        entries: list[tuple[str, bytes]] = []
+        total_size = 0
+        if zipfile.is_zipfile(BytesIO(content)):
+            with zipfile.ZipFile(BytesIO(content)) as zf:
+                infos = [
+                    info
+                    for info in zf.infolist()
+                    if not info.is_dir() and not _is_hidden_path(info.filename)
+                ]
+                check_count(len(infos))
+                check_size(sum(info.file_size for info in infos))
+                for info in infos:
+                    with zf.open(info) as f:
+                        data = read_capped(f, total_size)
+                    total_size += len(data)
+                    entries.append((info.filename, data))
+            return entries
+
+        try:
+            with tarfile.open(fileobj=BytesIO(content)) as tf:
+                members = [
+                    member
+                    for member in tf.getmembers()
+                    if member.isfile() and not _is_hidden_path(member.name)
+                ]
+                check_count(len(members))
+                check_size(sum(member.size for member in members))
+                for member in members:
+                    extracted = tf.extractfile(member)
+                    if extracted is None:
+                        continue
+                    data = read_capped(extracted, total_size)
+                    total_size += len(data)
+                    entries.append((member.name, data))
+        except tarfile.TarError:
+            raise R2RException(
+                status_code=422,
+                message=f"'{archive_name}' is not a zip or tar archive.",
+            )
+        return entries
+
     @staticmethod
     async def _process_file(file):
         import base64
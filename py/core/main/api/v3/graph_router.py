@@ -42,7 +42,7 @@ class GraphRouter(BaseRouterV3):
     def _register_workflows(self):
 
         workflow_messages = {}
-        if self.providers.orchestration.config.provider == "hatchet":
+        if self.providers.orchestration.config.runs_in_background:
             workflow_messages["extract-triples"] = (
                 "Graph creation task queued successfully."
             )
@@ -1,5 +1,4 @@
 # TODO - Move indices to 'id' basis
-# TODO - Implement update index
 # TODO - Implement index data model
 
 import logging
@@ -38,6 +37,7 @@ class IndicesRouter(BaseRouterV3):
             "/indices",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="Create Vector Index",
+            response_model=WrappedGenericMessageResponse,
             openapi_extra={
                 "x-codeSamples": [
                     {
@@ -173,7 +173,7 @@ class IndicesRouter(BaseRouterV3):
                 description="Whether to run index creation as an orchestrated task (recommended for large indices)",
             ),
             auth_user=Depends(self.providers.auth.auth_wrapper),
-        ) -> WrappedGenericMessageResponse:
+        ) -> dict[str, str]:
             """
             Create a new vector similarity search index in over the target table. Allowed tables include 'vectors', 'entity', 'document_collections'.
             Vectors correspond to the chunks of text that are indexed for similarity search, whereas entity and document_collections are created during knowledge graph construction.
@@ -225,6 +225,11 @@ class IndicesRouter(BaseRouterV3):
                         "index_column": config.index_column,
                         "index_arguments": config.index_arguments,
                         "concurrently": config.concurrently,
+                        "build_settings": (
+                            config.build_settings.model_dump()
+                            if config.build_settings
+                            else None
+                        ),
                     },
                 },
                 options={
@@ -441,71 +446,144 @@ class IndicesRouter(BaseRouterV3):
                 raise R2RException(
                     f"Index '{index_name}' not found", status_code=404
                 )
-            return {"index": indices["indices"][0]}
-
-        # TODO - Implement update index
-        #         @self.router.post(
-        #             "/indices/{name}",
-        #             summary="Update Vector Index",
-        #             openapi_extra={
-        #                 "x-codeSamples": [
-        #                     {
-        #                         "lang": "Python",
-        #                         "source": """
-        # from r2r import R2RClient
-
-        # client = R2RClient("http://localhost:7272")
-
-        # # Update HNSW index parameters
-        # result = client.indices.update(
-        #     "550e8400-e29b-41d4-a716-446655440000",
-        #     config={
-        #         "index_arguments": {
-        #             "ef": 80,  # Increase search quality
-        #             "m": 24    # Increase connections per layer
-        #         },
-        #         "concurrently": True
-        #     },
-        #     run_with_orchestration=True
-        # )""",
-        #                     },
-        #                     {
-        #                         "lang": "Shell",
-        #                         "source": """
-        # curl -X PUT "https://api.example.com/indices/550e8400-e29b-41d4-a716-446655440000" \\
-        #      -H "Content-Type: application/json" \\
-        #      -H "Authorization: Bearer YOUR_API_KEY" \\
-        #      -d '{
-        #        "config": {
-        #          "index_arguments": {
-        #            "ef": 80,
-        #            "m": 24
-        #          },
-        #          "concurrently": true
-        #        },
-        #        "run_with_orchestration": true
-        #      }'""",
-        #                     },
-        #                 ]
-        #             },
-        #         )
-        #         @self.base_endpoint
-        #         async def update_index(
-        #             id: UUID = Path(...),
-        #             config: IndexConfig = Body(...),
-        #             run_with_orchestration: Optional[bool] = Body(True),
-        #             auth_user=Depends(self.providers.auth.auth_wrapper),
-        #         ):  # -> WrappedUpdateIndexResponse:
-        #             """
-        #             Update an existing index's configuration.
-        #             """
-        #             # TODO: Implement index update logic
-        #             pass
+            build_progress = await self.providers.database.chunks_handler.get_index_build_progress(
+                index_name=indices["indices"][0]["name"]
+            )
+            return {
+                "index": indices["indices"][0],
+                "build_progress": build_progress,
+            }
+
+        @self.router.post(
+            "/indices/{table_name}/{index_name}",
+            dependencies=[Depends(self.rate_limit_dependency)],
+            summary="Update Vector Index",
+            response_model=WrappedGenericMessageResponse,
+            openapi_extra={
+                "x-codeSamples": [
+                    {
+                        "lang": "Python",
+                        "source": textwrap.dedent(
+                            """
+                            from r2r import R2RClient
+
+                            client = R2RClient("http://localhost:7272")
+                            # when using auth, do client.login(...)
+
+                            # Rebuild an HNSW index with more connections per layer
+                            result = client.indices.update(
+                                index_name="index_1",
+                                table_name="chunks",
+                                config={
+                                    "index_arguments": {
+                                        "m": 24,
+                                        "ef_construction": 128,
+                                    },
+                                    "build_settings": {
+                                        "maintenance_work_mem": "2GB",
+                                        "max_parallel_maintenance_workers": 4,
+                                    },
+                                },
+                                run_with_orchestration=True
+                            )
+                            """
+                        ),
+                    },
+                    {
+                        "lang": "Shell",
+                        "source": textwrap.dedent(
+                            """
+                            curl -X POST "https://api.example.com/indices/chunks/index_1" \\
+                                -H "Content-Type: application/json" \\
+                                -H "Authorization: Bearer YOUR_API_KEY" \\
+                                -d '{
+                                    "config": {
+                                        "index_arguments": {"m": 24, "ef_construction": 128},
+                                        "build_settings": {"maintenance_work_mem": "2GB"}
+                                    },
+                                    "run_with_orchestration": true
+                                }'
+                            """
+                        ),
+                    },
+                ]
+            },
+        )
+        @self.base_endpoint
+        async def update_index(
+            table_name: VectorTableName = Path(
+                ...,
+                description="The table of vector embeddings the index belongs to",
+            ),
+            index_name: str = Path(
+                ..., description="The name of the index to update"
+            ),
+            config: IndexConfig = Body(
+                ...,
+                description="The new index configuration. Method and measure default to those of the existing index.",
+            ),
+            run_with_orchestration: Optional[bool] = Body(
+                True,
+                description="Whether to run the rebuild as an orchestrated task (recommended for large indices)",
+            ),
+            auth_user=Depends(self.providers.auth.auth_wrapper),
+        ) -> dict[str, str]:
+            """
+            Rebuild an existing vector index with new parameters, without downtime.
+
+            A replacement index is built concurrently alongside the existing one, so
+            searches and writes keep using the current index throughout the build.
+            Once the replacement is valid it is swapped in under the existing name in
+            a single short transaction. If the build fails, the existing index is left
+            untouched.
+
+            Build progress is reported by the get index endpoint while the rebuild runs.
+            `build_settings` raise `maintenance_work_mem` and parallel workers for this
+            build only.
+            """
+            logger.info(
+                f"Updating vector index {index_name} on table {table_name}"
+            )
+
+            provided = config.model_fields_set
+            return await self.providers.orchestration.run_workflow(
+                "update-vector-index",
+                {
+                    "request": {
+                        "index_name": index_name,
+                        "table_name": table_name,
+                        "index_method": (
+                            config.index_method
+                            if "index_method" in provided
+                            else None
+                        ),
+                        "index_measure": (
+                            config.index_measure
+                            if "index_measure" in provided
+                            else None
+                        ),
+                        "index_arguments": (
+                            config.index_arguments.model_dump()
+                            if config.index_arguments
+                            else None
+                        ),
+                        "build_settings": (
+                            config.build_settings.model_dump()
+                            if config.build_settings
+                            else None
+                        ),
+                    },
+                },
+                options={
+                    "additional_metadata": {},
+                },
+            )
 
         @self.router.delete(
             "/indices/{table_name}/{index_name}",
             dependencies=[Depends(self.rate_limit_dependency)],
             summary="Delete Vector Index",
+            response_model=WrappedGenericMessageResponse,
             openapi_extra={
                 "x-codeSamples": [
                     {
@@ -582,7 +660,7 @@ class IndicesRouter(BaseRouterV3):
             # ),
             # run_with_orchestration: Optional[bool] = Body(True),
             auth_user=Depends(self.providers.auth.auth_wrapper),
-        ) -> WrappedGenericMessageResponse:
+        ) -> dict[str, str]:
             """
             Delete an existing vector similarity search index.
 
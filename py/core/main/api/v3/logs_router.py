@@ -1,13 +1,13 @@
-import asyncio
 import contextlib
 import logging
 from pathlib import Path
 
-import aiofiles
 from fastapi import Depends, WebSocket
 from fastapi.requests import Request
 from fastapi.templating import Jinja2Templates
 
+from core.utils import LogTailer
+
 from ...abstractions import R2RProviders, R2RServices
 from .base_router import BaseRouterV3
 
@@ -28,40 +28,8 @@ class LogsRouter(BaseRouterV3):
         if not self.log_file.exists():
             self.log_file.touch(mode=0o666)
 
-        # Start from the beginning of the file
-        self.last_position = 0
-
-    async def read_full_file(self) -> str:
-        """Read the entire log file from the start."""
-        if not self.log_file.exists():
-            return "Initializing logging system..."
-
-        try:
-            async with aiofiles.open(self.log_file, mode="r") as f:
-                # Start at beginning
-                await f.seek(0)
-                full_content = await f.read()
-                # Move last_position to end of file after reading full content
-                self.last_position = await f.tell()
-                return full_content
-        except Exception as e:
-            logging.error(f"Error reading full logs: {str(e)}")
-            return f"Error accessing full log file: {str(e)}"
-
-    async def read_new_logs(self) -> str:
-        """Read new logs appended after last_position."""
-        if not self.log_file.exists():
-            return "Initializing logging system..."
-
-        try:
-            async with aiofiles.open(self.log_file, mode="r") as f:
-                await f.seek(self.last_position)
-                new_content = await f.read()
-                self.last_position = await f.tell()
-                return new_content or ""
-        except Exception as e:
-            logging.error(f"Error reading logs: {str(e)}")
-            return f"Error accessing log file: {str(e)}"
+        # One tailer per process, shared by every connected viewer
+        self.log_tailer = LogTailer(self.log_file)
 
     def _setup_routes(self):
         @self.router.websocket(
@@ -70,21 +38,19 @@ class LogsRouter(BaseRouterV3):
         )
         async def stream_logs(websocket: WebSocket):
             await websocket.accept()
+            backlog, queue = self.log_tailer.subscribe()
             try:
-                # Send the entire file content upon initial connection
-                full_logs = await self.read_full_file()
-                if full_logs:
-                    await websocket.send_text(full_logs)
+                # Send the recent log lines upon initial connection
+                if backlog:
+                    await websocket.send_text(backlog)
 
                 # Now send incremental updates only
                 while True:
-                    new_logs = await self.read_new_logs()
-                    if new_logs:
-                        await websocket.send_text(new_logs)
-                    await asyncio.sleep(0.5)
+                    await websocket.send_text(await queue.get())
             except Exception as e:
                 logging.error(f"WebSocket error: {str(e)}")
             finally:
+                self.log_tailer.unsubscribe(queue)
                 with contextlib.suppress(Exception):
                     await websocket.close()
 
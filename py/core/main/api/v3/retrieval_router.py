@@ -442,9 +442,10 @@ class RetrievalRouterV3(BaseRouterV3):
                     try:
                         async for chunk in response:
                             yield chunk
-                    except GeneratorExit:
-                        # Clean up if needed, then return
-                        return
+                    finally:
+                        # Also runs when the client disconnects, closing the
+                        # upstream search and completion streams right away.
+                        await response.aclose()
 
                 return StreamingResponse(
                     stream_generator(), media_type="application/json"
@@ -669,9 +670,10 @@ class RetrievalRouterV3(BaseRouterV3):
                         try:
                             async for chunk in response:
                                 yield chunk
-                        except GeneratorExit:
-                            # Clean up if needed, then return
-                            return
+                        finally:
+                            # Also runs when the client disconnects, closing the
+                            # upstream search and completion streams right away.
+                            await response.aclose()
 
                     return StreamingResponse(
                         stream_generator(), media_type="application/json"
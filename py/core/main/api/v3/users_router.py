@@ -709,11 +709,18 @@ class UsersRouter(BaseRouterV3):
                 le=1000,
                 description="Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.",
             ),
+            after_email: Optional[str] = Query(
+                None,
+                description="Return users whose email sorts after this one. Pass the last email of the previous page to paginate without an offset.",
+            ),
             auth_user=Depends(self.providers.auth.auth_wrapper),
         ) -> WrappedUsersResponse:
             """
             List all users with pagination and filtering options.
             Only accessible by superusers.
+
+            Users are ordered by email. For deep pagination, pass the last email of the
+            previous page as `after_email` instead of increasing `offset`.
             """
 
             if not auth_user.is_superuser:
@@ -726,7 +733,10 @@ class UsersRouter(BaseRouterV3):
 
             users_overview_response = (
                 await self.services.management.users_overview(
-                    user_ids=user_uuids, offset=offset, limit=limit
+                    user_ids=user_uuids,
+                    offset=offset,
+                    limit=limit,
+                    after_email=after_email,
                 )
             )
             return users_overview_response["results"], {  # type: ignore
@@ -3,7 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 
-from core.base import R2RException
+from core.base import EmbeddingProvider, R2RException
 from core.providers import (
     HatchetOrchestrationProvider,
     SimpleOrchestrationProvider,
@@ -30,6 +30,7 @@ class R2RApp:
         orchestration_provider: (
             HatchetOrchestrationProvider | SimpleOrchestrationProvider
         ),
+        embedding_provider: EmbeddingProvider,
         chunks_router: ChunksRouter,
         collections_router: CollectionsRouter,
         conversations_router: ConversationsRouter,
@@ -51,6 +52,7 @@ class R2RApp:
         self.indices_router = indices_router
         self.logs_router = logs_router
         self.orchestration_provider = orchestration_provider
+        self.embedding_provider = embedding_provider
         self.prompts_router = prompts_router
         self.retrieval_router_v3 = retrieval_router_v3
         self.system_router = system_router
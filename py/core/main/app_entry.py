@@ -44,6 +44,8 @@ async def lifespan(app: FastAPI):
 
     # # Shutdown
     scheduler.shutdown()
+    await r2r_app.orchestration_provider.stop_worker()
+    await r2r_app.embedding_provider.close()
 
 
 async def create_r2r_app(
@@ -179,5 +179,6 @@ class R2RBuilder:
         return R2RApp(
             config=self.config,
             orchestration_provider=providers.orchestration,
+            embedding_provider=providers.embedding,
             **routers,
         )
@@ -134,7 +134,10 @@ class R2RProviderFactory:
 
     @staticmethod
     def create_orchestration_provider(
-        config: OrchestrationConfig, *args, **kwargs
+        config: OrchestrationConfig,
+        database_provider: Optional[PostgresDatabaseProvider] = None,
+        *args,
+        **kwargs,
     ) -> Union[HatchetOrchestrationProvider, SimpleOrchestrationProvider]:
         if config.provider == "hatchet":
             orchestration_provider = HatchetOrchestrationProvider(config)
@@ -143,7 +146,7 @@ class R2RProviderFactory:
         elif config.provider == "simple":
             from core.providers import SimpleOrchestrationProvider
 
-            return SimpleOrchestrationProvider(config)
+            return SimpleOrchestrationProvider(config, database_provider)
         else:
             raise ValueError(
                 f"Orchestration provider {config.provider} not supported"
@@ -341,7 +344,9 @@ class R2RProviderFactory:
 
         orchestration_provider = (
             orchestration_provider_override
-            or self.create_orchestration_provider(self.config.orchestration)
+            or self.create_orchestration_provider(
+                self.config.orchestration, database_provider
+            )
         )
 
         return R2RProviders(
@@ -1,7 +1,7 @@
 import asyncio
 import logging
 import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
@@ -11,16 +11,12 @@ from litellm import AuthenticationError
 from core.base import (
     DocumentChunk,
     IngestionStatus,
-    KGEnrichmentStatus,
     OrchestrationProvider,
     generate_extraction_id,
     increment_version,
 )
 from core.base.abstractions import DocumentResponse, R2RException
-from core.utils import (
-    generate_default_user_collection_id,
-    update_settings_from_dict,
-)
+from core.utils import update_settings_from_dict
 
 from ...services import IngestionService, IngestionServiceAdapter
 
@@ -73,134 +69,86 @@ def hatchet_ingestion_factory(
 
                 document_info = ingestion_result["info"]
 
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.PARSING,
-                )
-
                 ingestion_config = parsed_data["ingestion_config"] or {}
-                extractions_generator = (
-                    await self.ingestion_service.parse_file(
-                        document_info, ingestion_config
+                if not await self.ingestion_service.ingest_duplicate_file(
+                    document_info, parsed_data["file_data"], ingestion_config
+                ):
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.PARSING,
                     )
-                )
 
-                extractions = []
-                async for extraction in extractions_generator:
-                    extractions.append(extraction)
+                    extractions_generator = (
+                        await self.ingestion_service.parse_file(
+                            document_info, ingestion_config
+                        )
+                    )
 
-                await service.update_document_status(
-                    document_info, status=IngestionStatus.AUGMENTING
-                )
-                await service.augment_document_info(
-                    document_info,
-                    [extraction.to_dict() for extraction in extractions],
-                )
+                    extractions = []
+                    async for extraction in extractions_generator:
+                        extractions.append(extraction)
 
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.EMBEDDING,
-                )
+                    await service.update_document_status(
+                        document_info, status=IngestionStatus.AUGMENTING
+                    )
+                    await service.augment_document_info(
+                        document_info,
+                        [extraction.to_dict() for extraction in extractions],
+                    )
 
-                # extractions = context.step_output("parse")["extractions"]
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.EMBEDDING,
+                    )
+
+                    # extractions = context.step_output("parse")["extractions"]
 
-                embedding_generator = (
-                    await self.ingestion_service.embed_document(
-                        [extraction.to_dict() for extraction in extractions]
+                    embedding_generator = (
+                        await self.ingestion_service.embed_document(
+                            [
+                                extraction.to_dict()
+                                for extraction in extractions
+                            ]
+                        )
                     )
-                )
 
-                embeddings = []
-                async for embedding in embedding_generator:
-                    embeddings.append(embedding)
+                    embeddings = []
+                    async for embedding in embedding_generator:
+                        embeddings.append(embedding)
 
-                await self.ingestion_service.update_document_status(
-                    document_info,
-                    status=IngestionStatus.STORING,
-                )
+                    await self.ingestion_service.update_document_status(
+                        document_info,
+                        status=IngestionStatus.STORING,
+                    )
 
-                storage_generator = await self.ingestion_service.store_embeddings(  # type: ignore
-                    embeddings
-                )
+                    storage_generator = await self.ingestion_service.store_embeddings(  # type: ignore
+                        embeddings
+                    )
 
-                async for _ in storage_generator:
-                    pass
+                    async for _ in storage_generator:
+                        pass
 
                 await self.ingestion_service.finalize_ingestion(document_info)
 
+                collection_ids = context.workflow_input()["request"].get(
+                    "collection_ids"
+                )
+                await self.ingestion_service.assign_document_to_collections(
+                    document_info,
+                    (
+                        [UUID(cid) for cid in collection_ids]
+                        if collection_ids
+                        else None
+                    ),
+                    name=document_info.title or "N/A",
+                    description="",
+                )
+
                 await self.ingestion_service.update_document_status(
                     document_info,
                     status=IngestionStatus.SUCCESS,
                 )
 
-                collection_ids = context.workflow_input()["request"].get(
-                    "collection_ids"
-                )
-                if not collection_ids:
-                    # TODO: Move logic onto the `management service`
-                    collection_id = generate_default_user_collection_id(
-                        document_info.owner_id
-                    )
-                    await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-                    await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_sync_status",
-                        status=KGEnrichmentStatus.OUTDATED,
-                    )
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_cluster_status",  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                        status=KGEnrichmentStatus.OUTDATED,
-                    )
-                else:
-                    for collection_id_str in collection_ids:
-                        collection_id = UUID(collection_id_str)
-                        try:
-                            name = document_info.title or "N/A"
-                            description = ""
-                            await service.providers.database.collections_handler.create_collection(
-                                owner_id=document_info.owner_id,
-                                name=name,
-                                description=description,
-                                collection_id=collection_id,
-                            )
-                            await self.providers.database.graphs_handler.create(
-                                collection_id=collection_id,
-                                name=name,
-                                description=description,
-                                graph_id=collection_id,
-                            )
-
-                        except Exception as e:
-                            logger.warning(
-                                f"Warning, could not create collection with error: {str(e)}"
-                            )
-
-                        await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-                        await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_sync_status",
-                            status=KGEnrichmentStatus.OUTDATED,
-                        )
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_cluster_status",  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                            status=KGEnrichmentStatus.OUTDATED,
-                        )
                 # get server chunk enrichment settings and override parts of it if provided in the ingestion config
                 server_chunk_enrichment_settings = getattr(
                     service.providers.ingestion.config,
@@ -305,7 +253,48 @@ def hatchet_ingestion_factory(
                     f"Failed to update document status for {document_id}: {e}"
                 )
 
-    # TODO: Implement a check to see if the file is actually changed before updating
+    @orchestration_provider.workflow(
+        name="ingest-files-batch",
+        timeout="360m",
+    )
+    class HatchetIngestFilesBatchWorkflow:
+        def __init__(self, ingestion_service: IngestionService):
+            self.ingestion_service = ingestion_service
+
+        @orchestration_provider.concurrency(  # type: ignore
+            max_runs=orchestration_provider.config.ingestion_concurrency_limit,  # type: ignore
+            limit_strategy=ConcurrencyLimitStrategy.GROUP_ROUND_ROBIN,
+        )
+        def concurrency(self, context: Context) -> str:
+            try:
+                input_data = context.workflow_input()["request"]
+                return str(
+                    IngestionServiceAdapter._parse_user_data(
+                        input_data["user"]
+                    ).id
+                )
+            except Exception:
+                return str(uuid.uuid4())
+
+        @orchestration_provider.step(retries=0, timeout="360m")
+        async def ingest(self, context: Context) -> dict:
+            input_data = context.workflow_input()["request"]
+            parsed_data = (
+                IngestionServiceAdapter.parse_ingest_files_batch_input(
+                    input_data
+                )
+            )
+            results = await self.ingestion_service.ingest_files_batch(
+                **parsed_data
+            )
+            return {
+                "status": "Successfully ingested batch",
+                "documents": [
+                    {**result, "document_id": str(result["document_id"])}
+                    for result in results
+                ],
+            }
+
     @orchestration_provider.workflow(name="update-files", timeout="60m")
     class HatchetUpdateFilesWorkflow:
         def __init__(self, ingestion_service: IngestionService):
@@ -375,35 +364,37 @@ def hatchet_ingestion_factory(
                     or file_data["filename"].split("/")[-1]
                 )
 
-                # Prepare input for ingest_file workflow
-                ingest_input = {
-                    "file_data": file_data,
-                    "user": data.get("user"),
-                    "metadata": updated_metadata,
-                    "document_id": str(doc_id),
-                    "version": new_version,
-                    "ingestion_config": (
-                        ingestion_config.model_dump_json()
-                        if ingestion_config
-                        else None
-                    ),
-                    "size_in_bytes": file_size_in_bytes,
-                }
-
-                # Spawn ingest_file workflow as a child workflow
-                child_result = (
-                    await context.aio.spawn_workflow(
-                        "ingest-files",
-                        {"request": ingest_input},
-                        key=f"ingest_file_{doc_id}",
+                document_info = (
+                    self.ingestion_service.create_document_info_for_update(
+                        doc_info,
+                        updated_metadata,
+                        new_version,
+                        file_size_in_bytes,
                     )
-                ).result()
-                results.append(child_result)
+                )
+                results.append(
+                    self._reingest_file(document_info, ingestion_config)
+                )
 
             await asyncio.gather(*results)
 
             return None
 
+        async def _reingest_file(
+            self,
+            document_info: DocumentResponse,
+            ingestion_config: Optional[dict],
+        ) -> None:
+            try:
+                await self.ingestion_service.reingest_document(
+                    document_info, ingestion_config or {}
+                )
+            except Exception:
+                await self.ingestion_service.update_document_status(
+                    document_info, status=IngestionStatus.FAILED
+                )
+                raise
+
     @orchestration_provider.workflow(
         name="ingest-chunks",
         timeout="60m",
@@ -482,88 +473,24 @@ def hatchet_ingestion_factory(
 
             await self.ingestion_service.finalize_ingestion(document_info)
 
+            collection_ids = context.workflow_input()["request"].get(
+                "collection_ids"
+            )
+            await self.ingestion_service.assign_document_to_collections(
+                document_info,
+                (
+                    [UUID(cid) for cid in collection_ids]
+                    if collection_ids
+                    else None
+                ),
+                name=document_info.title or "N/A",
+                description="",
+            )
+
             await self.ingestion_service.update_document_status(
                 document_info, status=IngestionStatus.SUCCESS
             )
 
-            try:
-                # TODO - Move logic onto the `management service`
-                collection_ids = context.workflow_input()["request"].get(
-                    "collection_ids"
-                )
-                if not collection_ids:
-                    # TODO: Move logic onto the `management service`
-                    collection_id = generate_default_user_collection_id(
-                        document_info.owner_id
-                    )
-                    await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-                    await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_sync_status",
-                        status=KGEnrichmentStatus.OUTDATED,
-                    )
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_cluster_status",  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                        status=KGEnrichmentStatus.OUTDATED,
-                    )
-                else:
-                    for collection_id_str in collection_ids:
-                        collection_id = UUID(collection_id_str)
-                        try:
-                            name = document_info.title or "N/A"
-                            description = ""
-                            await service.providers.database.collections_handler.create_collection(
-                                owner_id=document_info.owner_id,
-                                name=name,
-                                description=description,
-                                collection_id=collection_id,
-                            )
-                            await self.providers.database.graphs_handler.create(
-                                collection_id=collection_id,
-                                name=name,
-                                description=description,
-                                graph_id=collection_id,
-                            )
-
-                        except Exception as e:
-                            logger.warning(
-                                f"Warning, could not create collection with error: {str(e)}"
-                            )
-
-                        await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-
-                        await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_sync_status",
-                            status=KGEnrichmentStatus.OUTDATED,
-                        )
-
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_cluster_status",
-                            status=KGEnrichmentStatus.OUTDATED,  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                        )
-            except Exception as e:
-                logger.error(
-                    f"Error during assigning document to collection: {str(e)}"
-                )
-
             return {
                 "status": "Successfully finalized ingestion",
                 "document_info": document_info.to_dict(),
@@ -687,6 +614,28 @@ def hatchet_ingestion_factory(
                 "status": "Vector index creation queued successfully.",
             }
 
+    @orchestration_provider.workflow(
+        name="update-vector-index", timeout="360m"
+    )
+    class HatchetUpdateVectorIndexWorkflow:
+        def __init__(self, ingestion_service: IngestionService):
+            self.ingestion_service = ingestion_service
+
+        @orchestration_provider.step(timeout="360m")
+        async def update_vector_index(self, context: Context) -> dict:
+            input_data = context.workflow_input()["request"]
+            parsed_data = (
+                IngestionServiceAdapter.parse_update_vector_index_input(
+                    input_data
+                )
+            )
+
+            await self.ingestion_service.providers.database.chunks_handler.rebuild_index(
+                **parsed_data
+            )
+
+            return {"status": "Vector index updated successfully."}
+
     @orchestration_provider.workflow(name="delete-vector-index", timeout="30m")
     class HatchetDeleteVectorIndexWorkflow:
         def __init__(self, ingestion_service: IngestionService):
@@ -752,6 +701,7 @@ def hatchet_ingestion_factory(
 
     # Add this to the workflows dictionary in hatchet_ingestion_factory
     ingest_files_workflow = HatchetIngestFilesWorkflow(service)
+    ingest_files_batch_workflow = HatchetIngestFilesBatchWorkflow(service)
     update_files_workflow = HatchetUpdateFilesWorkflow(service)
     ingest_chunks_workflow = HatchetIngestChunksWorkflow(service)
     update_chunks_workflow = HatchetUpdateChunkWorkflow(service)
@@ -759,14 +709,17 @@ def hatchet_ingestion_factory(
         service
     )
     create_vector_index_workflow = HatchetCreateVectorIndexWorkflow(service)
+    update_vector_index_workflow = HatchetUpdateVectorIndexWorkflow(service)
     delete_vector_index_workflow = HatchetDeleteVectorIndexWorkflow(service)
 
     return {
         "ingest_files": ingest_files_workflow,
+        "ingest_files_batch": ingest_files_batch_workflow,
         "update_files": update_files_workflow,
         "ingest_chunks": ingest_chunks_workflow,
         "update_chunk": update_chunks_workflow,
         "update_document_metadata": update_document_metadata_workflow,
         "create_vector_index": create_vector_index_workflow,
+        "update_vector_index": update_vector_index_workflow,
         "delete_vector_index": delete_vector_index_workflow,
     }
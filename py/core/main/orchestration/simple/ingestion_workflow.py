@@ -5,16 +5,8 @@ from uuid import UUID
 from fastapi import HTTPException
 from litellm import AuthenticationError
 
-from core.base import (
-    DocumentChunk,
-    KGEnrichmentStatus,
-    R2RException,
-    increment_version,
-)
-from core.utils import (
-    generate_default_user_collection_id,
-    generate_extraction_id,
-)
+from core.base import DocumentChunk, R2RException, increment_version
+from core.utils import generate_extraction_id
 
 from ...services import IngestionService
 
@@ -34,122 +26,53 @@ def simple_ingestion_factory(service: IngestionService):
             ingestion_result = await service.ingest_file_ingress(**parsed_data)
             document_info = ingestion_result["info"]
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.PARSING
-            )
-
             ingestion_config = parsed_data["ingestion_config"]
-            extractions_generator = await service.parse_file(
-                document_info, ingestion_config
-            )
-            extractions = [
-                extraction.model_dump()
-                async for extraction in extractions_generator
-            ]
+            if not await service.ingest_duplicate_file(
+                document_info, parsed_data["file_data"], ingestion_config
+            ):
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.PARSING
+                )
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.AUGMENTING
-            )
-            await service.augment_document_info(document_info, extractions)
+                extractions_generator = await service.parse_file(
+                    document_info, ingestion_config
+                )
+                extractions = [
+                    extraction.model_dump()
+                    async for extraction in extractions_generator
+                ]
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.EMBEDDING
-            )
-            embedding_generator = await service.embed_document(extractions)
-            embeddings = [
-                embedding.model_dump()
-                async for embedding in embedding_generator
-            ]
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.AUGMENTING
+                )
+                await service.augment_document_info(document_info, extractions)
 
-            await service.update_document_status(
-                document_info, status=IngestionStatus.STORING
-            )
-            storage_generator = await service.store_embeddings(embeddings)
-            async for _ in storage_generator:
-                pass
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.EMBEDDING
+                )
+                embedding_generator = await service.embed_document(extractions)
+                embeddings = [
+                    embedding.model_dump()
+                    async for embedding in embedding_generator
+                ]
+
+                await service.update_document_status(
+                    document_info, status=IngestionStatus.STORING
+                )
+                storage_generator = await service.store_embeddings(embeddings)
+                async for _ in storage_generator:
+                    pass
 
             await service.finalize_ingestion(document_info)
 
+            await service.assign_document_to_collections(
+                document_info, parsed_data.get("collection_ids")
+            )
+
             await service.update_document_status(
                 document_info, status=IngestionStatus.SUCCESS
             )
 
-            collection_ids = parsed_data.get("collection_ids")
-
-            try:
-                if not collection_ids:
-                    # TODO: Move logic onto the `management service`
-                    collection_id = generate_default_user_collection_id(
-                        document_info.owner_id
-                    )
-                    await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-                    await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_sync_status",
-                        status=KGEnrichmentStatus.OUTDATED,
-                    )
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_cluster_status",
-                        status=KGEnrichmentStatus.OUTDATED,  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                    )
-                else:
-
-                    for collection_id in collection_ids:
-                        try:
-                            # FIXME: Right now we just throw a warning if the collection already exists, but we should probably handle this more gracefully
-                            name = "My Collection"
-                            description = f"A collection started during {document_info.title} ingestion"
-
-                            await service.providers.database.collections_handler.create_collection(
-                                owner_id=document_info.owner_id,
-                                name=name,
-                                description=description,
-                                collection_id=collection_id,
-                            )
-                            await service.providers.database.graphs_handler.create(
-                                collection_id=collection_id,
-                                name=name,
-                                description=description,
-                                graph_id=collection_id,
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Warning, could not create collection with error: {str(e)}"
-                            )
-
-                        await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-
-                        await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_sync_status",
-                            status=KGEnrichmentStatus.OUTDATED,
-                        )
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_cluster_status",
-                            status=KGEnrichmentStatus.OUTDATED,  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                        )
-
-            except Exception as e:
-                logger.error(
-                    f"Error during assigning document to collection: {str(e)}"
-                )
-
         except AuthenticationError as e:
             if document_info is not None:
                 await service.update_document_status(
@@ -168,6 +91,48 @@ def simple_ingestion_factory(service: IngestionService):
                 status_code=500, detail=f"Error during ingestion: {str(e)}"
             )
 
+    async def ingest_files_batch(input_data):
+        from core.main import IngestionServiceAdapter
+
+        parsed_data = IngestionServiceAdapter.parse_ingest_files_batch_input(
+            input_data
+        )
+        try:
+            results = await service.ingest_files_batch(**parsed_data)
+        except AuthenticationError:
+            raise R2RException(
+                status_code=401,
+                message="Authentication error: Invalid API key or credentials.",
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error during ingestion: {str(e)}"
+            )
+        return {"documents": results}
+
+    async def reingest_file(document_info, ingestion_config):
+        from core.base import IngestionStatus
+
+        try:
+            await service.reingest_document(
+                document_info, ingestion_config or {}
+            )
+        except AuthenticationError:
+            await service.update_document_status(
+                document_info, status=IngestionStatus.FAILED
+            )
+            raise R2RException(
+                status_code=401,
+                message="Authentication error: Invalid API key or credentials.",
+            )
+        except Exception as e:
+            await service.update_document_status(
+                document_info, status=IngestionStatus.FAILED
+            )
+            raise HTTPException(
+                status_code=500, detail=f"Error during ingestion: {str(e)}"
+            )
+
     async def update_files(input_data):
         from core.main import IngestionServiceAdapter
 
@@ -232,18 +197,10 @@ def simple_ingestion_factory(service: IngestionService):
                 or file_data["filename"].split("/")[-1]
             )
 
-            ingest_input = {
-                "file_data": file_data,
-                "user": user.model_dump(),
-                "metadata": updated_metadata,
-                "document_id": str(doc_id),
-                "version": new_version,
-                "ingestion_config": ingestion_config,
-                "size_in_bytes": file_size_in_bytes,
-            }
-
-            result = ingest_files(ingest_input)
-            results.append(result)
+            document_info = service.create_document_info_for_update(
+                doc_info, updated_metadata, new_version, file_size_in_bytes
+            )
+            results.append(reingest_file(document_info, ingestion_config))
 
         await asyncio.gather(*results)
 
@@ -295,86 +252,17 @@ def simple_ingestion_factory(service: IngestionService):
 
             await service.finalize_ingestion(document_info)
 
+            await service.assign_document_to_collections(
+                document_info,
+                parsed_data.get("collection_ids"),
+                name=document_info.title or "N/A",
+                description="",
+            )
+
             await service.update_document_status(
                 document_info, status=IngestionStatus.SUCCESS
             )
 
-            collection_ids = parsed_data.get("collection_ids")
-
-            try:
-                # TODO - Move logic onto management service
-                if not collection_ids:
-                    collection_id = generate_default_user_collection_id(
-                        document_info.owner_id
-                    )
-
-                    await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-
-                    await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                        document_id=document_info.id,
-                        collection_id=collection_id,
-                    )
-
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_sync_status",
-                        status=KGEnrichmentStatus.OUTDATED,
-                    )
-                    await service.providers.database.documents_handler.set_workflow_status(
-                        id=collection_id,
-                        status_type="graph_cluster_status",
-                        status=KGEnrichmentStatus.OUTDATED,  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                    )
-
-                else:
-                    for collection_id in collection_ids:
-                        try:
-
-                            name = document_info.title or "N/A"
-                            description = ""
-                            result = await service.providers.database.collections_handler.create_collection(
-                                owner_id=document_info.owner_id,
-                                name=name,
-                                description=description,
-                                collection_id=collection_id,
-                            )
-                            await service.providers.database.graphs_handler.create(
-                                collection_id=collection_id,
-                                name=name,
-                                description=description,
-                                graph_id=collection_id,
-                            )
-                        except Exception as e:
-                            logger.warning(
-                                f"Warning, could not create collection with error: {str(e)}"
-                            )
-                        await service.providers.database.collections_handler.assign_document_to_collection_relational(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-                        await service.providers.database.chunks_handler.assign_document_chunks_to_collection(
-                            document_id=document_info.id,
-                            collection_id=collection_id,
-                        )
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_sync_status",
-                            status=KGEnrichmentStatus.OUTDATED,
-                        )
-                        await service.providers.database.documents_handler.set_workflow_status(
-                            id=collection_id,
-                            status_type="graph_cluster_status",
-                            status=KGEnrichmentStatus.OUTDATED,  # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
-                        )
-
-            except Exception as e:
-                logger.error(
-                    f"Error during assigning document to collection: {str(e)}"
-                )
-
         except Exception as e:
             if document_info is not None:
                 await service.update_document_status(
@@ -439,6 +327,28 @@ def simple_ingestion_factory(service: IngestionService):
                 detail=f"Error during vector index creation: {str(e)}",
             )
 
+    async def update_vector_index(input_data):
+        try:
+            from core.main import IngestionServiceAdapter
+
+            parsed_data = (
+                IngestionServiceAdapter.parse_update_vector_index_input(
+                    input_data
+                )
+            )
+
+            await service.providers.database.chunks_handler.rebuild_index(
+                **parsed_data
+            )
+
+            return {"status": "Vector index updated successfully."}
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error during vector index update: {str(e)}",
+            )
+
     async def delete_vector_index(input_data):
         try:
             from core.main import IngestionServiceAdapter
@@ -495,10 +405,12 @@ def simple_ingestion_factory(service: IngestionService):
 
     return {
         "ingest-files": ingest_files,
+        "ingest-files-batch": ingest_files_batch,
         "update-files": update_files,
         "ingest-chunks": ingest_chunks,
         "update-chunk": update_chunk,
         "update-document-metadata": update_document_metadata,
         "create-vector-index": create_vector_index,
+        "update-vector-index": update_vector_index,
         "delete-vector-index": delete_vector_index,
     }
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import json
 import logging
 import uuid
@@ -15,6 +16,7 @@ from core.base import (
     DocumentType,
     GenerationConfig,
     IngestionStatus,
+    KGEnrichmentStatus,
     R2RException,
     RawChunk,
     RunManager,
@@ -23,10 +25,14 @@ from core.base import (
     VectorEntry,
     VectorType,
     decrement_version,
+    generate_default_user_collection_id,
 )
 from core.base.abstractions import (
     ChunkEnrichmentSettings,
     ChunkEnrichmentStrategy,
+    IndexArgsHNSW,
+    IndexArgsIVFFlat,
+    IndexBuildSettings,
     IndexMeasure,
     IndexMethod,
     VectorTableName,
@@ -46,6 +52,11 @@ OVERVIEW_FETCH_PAGE_SIZE = 1_000
 
 
 class IngestionService(Service):
+    # Files parsed at once, and documents whose chunks are embedded and
+    # stored together, by `ingest_files_batch`
+    BATCH_PARSE_CONCURRENCY = 8
+    BATCH_WINDOW_SIZE = 64
+
     def __init__(
         self,
         config: R2RConfig,
@@ -203,6 +214,107 @@ class IngestionService(Service):
             updated_at=datetime.now(),
         )
 
+    def _get_content_hash(
+        self,
+        file_hash: str,
+        document_type: DocumentType,
+        ingestion_config: dict,
+    ) -> str:
+        """
+        Key parse and embedding results by the file bytes together with the
+        settings that produced them, so changing either misses the cache.
+        """
+        embedding_config = self.providers.embedding.config
+        settings = json.dumps(
+            {
+                "document_type": document_type.value,
+                "parser_config": self.providers.ingestion.config.model_dump(
+                    exclude={"app"}
+                ),
+                "ingestion_config": ingestion_config,
+                "embedding_model": embedding_config.base_model,
+                "embedding_dimension": embedding_config.base_dimension,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(
+            f"{file_hash}:{settings}".encode("utf-8")
+        ).hexdigest()
+
+    async def ingest_duplicate_file(
+        self,
+        document_info: DocumentResponse,
+        file_data: dict,
+        ingestion_config: dict,
+    ) -> bool:
+        """
+        Record the content hash of a newly ingested file and, when file
+        deduplication is enabled and any user already ingested an identical
+        file with the same settings, copy that document's chunks and vectors
+        instead of processing the file again. The source document's metadata
+        is not copied, and its summary is only reused when the title and
+        metadata match; otherwise one is written from the copied chunks.
+
+        Returns whether the document was ingested from a duplicate.
+        """
+        file_hash = file_data.get("content_hash")
+        if not file_hash:
+            return False
+
+        documents_handler = self.providers.database.documents_handler
+        content_hash = self._get_content_hash(
+            file_hash, document_info.document_type, ingestion_config
+        )
+        await documents_handler.set_content_hash(
+            document_info.id, content_hash
+        )
+        if not self.config.ingestion.deduplicate_files:
+            return False
+
+        source = await documents_handler.get_document_by_content_hash(
+            content_hash,
+            exclude_id=document_info.id,
+        )
+        if source is None:
+            return False
+
+        await self.update_document_status(
+            document_info, status=IngestionStatus.STORING
+        )
+        num_chunks = (
+            await self.providers.database.chunks_handler.copy_document_chunks(
+                source_document_id=source["id"],
+                document_id=document_info.id,
+                owner_id=document_info.owner_id,
+                collection_ids=document_info.collection_ids,
+                metadata=document_info.metadata,
+                source_metadata=source["metadata"],
+            )
+        )
+        # The summary is written from the title and metadata as well as the
+        # text, so it only carries over when those match too
+        if (
+            source["title"] == document_info.title
+            and source["metadata"] == document_info.metadata
+        ):
+            document_info.summary = source["summary"]
+            document_info.summary_embedding = source["summary_embedding"]
+        else:
+            chunks = await self.providers.database.chunks_handler.list_document_chunks(
+                document_id=document_info.id,
+                offset=0,
+                limit=self.config.ingestion.chunks_for_document_summary,
+            )
+            await self.augment_document_info(
+                document_info,
+                [{"data": chunk["text"]} for chunk in chunks["results"]],
+            )
+        logger.info(
+            f"Ingested document {document_info.id} from duplicate {source['id']}, copying {num_chunks} chunks."
+        )
+        return True
+
     async def parse_file(
         self, document_info: DocumentResponse, ingestion_config: dict
     ) -> AsyncGenerator[DocumentChunk, None]:
@@ -297,6 +409,376 @@ class IngestionService(Service):
             run_manager=self.run_manager,
         )
 
+    def create_document_info_for_update(
+        self,
+        existing_document_info: DocumentResponse,
+        metadata: dict,
+        version: str,
+        size_in_bytes: int,
+    ) -> DocumentResponse:
+        metadata = {**metadata, "version": version}
+        return existing_document_info.model_copy(
+            update={
+                "title": metadata.get("title", existing_document_info.title),
+                "metadata": metadata,
+                "version": version,
+                "size_in_bytes": size_in_bytes,
+                "ingestion_status": IngestionStatus.PENDING,
+                "updated_at": datetime.now(),
+            }
+        )
+
+    async def reingest_document(
+        self,
+        document_info: DocumentResponse,
+        ingestion_config: dict,
+    ) -> dict[str, int]:
+        """
+        Re-ingest an updated file, embedding only the chunks that changed.
+
+        The new chunks are matched to the stored ones by content hash. A
+        matched chunk keeps its id and vector, so graph extractions that
+        point at it stay valid, and only its metadata is refreshed. Chunks
+        without a match are embedded and stored, and stored chunks that
+        no longer appear in the document are deleted, all in one
+        transaction.
+        """
+        # The old content hash no longer describes the document
+        await self.providers.database.documents_handler.set_content_hash(
+            document_info.id, None
+        )
+        await self.update_document_status(
+            document_info, status=IngestionStatus.PARSING
+        )
+        extractions_generator = await self.parse_file(
+            document_info, ingestion_config
+        )
+        extractions = [
+            extraction.model_dump()
+            async for extraction in extractions_generator
+        ]
+
+        await self.update_document_status(
+            document_info, status=IngestionStatus.AUGMENTING
+        )
+        await self.augment_document_info(document_info, extractions)
+
+        chunks_handler = self.providers.database.chunks_handler
+        stored: dict[str, list[UUID]] = {}
+        for (
+            chunk_id,
+            content_hash,
+        ) in await chunks_handler.get_document_chunk_hashes(document_info.id):
+            stored.setdefault(content_hash, []).append(chunk_id)
+
+        unchanged: list[tuple[UUID, dict]] = []
+        changed: list[dict] = []
+        for extraction in extractions:
+            content_hash = hashlib.md5(
+                extraction["data"].encode("utf-8")
+            ).hexdigest()
+            if stored.get(content_hash):
+                unchanged.append(
+                    (stored[content_hash].pop(0), extraction["metadata"])
+                )
+            else:
+                changed.append(extraction)
+        deleted = [chunk_id for ids in stored.values() for chunk_id in ids]
+
+        # New chunks must not take the id of a chunk that is being kept
+        kept_ids = {chunk_id for chunk_id, _ in unchanged}
+        for extraction in changed:
+            if UUID(str(extraction["id"])) in kept_ids:
+                extraction["id"] = uuid.uuid4()
+
+        await self.update_document_status(
+            document_info, status=IngestionStatus.EMBEDDING
+        )
+        embeddings: list[VectorEntry] = []
+        if changed:
+            embedding_generator = await self.embed_document(changed)
+            embeddings = [embedding async for embedding in embedding_generator]
+
+        await self.update_document_status(
+            document_info, status=IngestionStatus.STORING
+        )
+        await chunks_handler.replace_document_chunks(
+            deleted, unchanged, embeddings
+        )
+
+        await self.update_document_status(
+            document_info, status=IngestionStatus.SUCCESS
+        )
+        logger.info(
+            f"Re-ingested document {document_info.id}: {len(unchanged)} chunks unchanged, {len(changed)} embedded, {len(deleted)} deleted."
+        )
+        return {
+            "unchanged": len(unchanged),
+            "embedded": len(changed),
+            "deleted": len(deleted),
+        }
+
+    async def ingest_files_batch(
+        self,
+        documents: list[dict],
+        user: User,
+        metadata: dict,
+        collection_ids: Optional[list[UUID]],
+        ingestion_config: dict,
+    ) -> list[dict]:
+        """
+        Ingest many stored files as one batch.
+
+        Files are parsed and summarized concurrently, a window of documents
+        at a time, and the chunks of the whole window are embedded and
+        stored together, so the embedding provider sees full batches and
+        the vectors go into Postgres in bulk. A file that fails is marked
+        as failed without failing the rest of the batch.
+
+        Returns the status of each document, in input order.
+        """
+        results = [
+            {
+                "document_id": document["document_id"],
+                "filename": document["file_data"]["filename"],
+                "status": IngestionStatus.PENDING.value,
+                "error": None,
+            }
+            for document in documents
+        ]
+        semaphore = asyncio.Semaphore(self.BATCH_PARSE_CONCURRENCY)
+
+        async def prepare(
+            document: dict, result: dict
+        ) -> Optional[tuple[DocumentResponse, list[dict]]]:
+            document_info = None
+            try:
+                async with semaphore:
+                    document_info = (
+                        await self.ingest_file_ingress(
+                            file_data=document["file_data"],
+                            user=user,
+                            document_id=document["document_id"],
+                            size_in_bytes=document["size_in_bytes"],
+                            metadata={**metadata},
+                        )
+                    )["info"]
+                    if await self.ingest_duplicate_file(
+                        document_info, document["file_data"], ingestion_config
+                    ):
+                        return document_info, []
+
+                    await self.update_document_status(
+                        document_info, status=IngestionStatus.PARSING
+                    )
+                    extractions = [
+                        extraction.model_dump()
+                        async for extraction in await self.parse_file(
+                            document_info, ingestion_config
+                        )
+                    ]
+                    await self.update_document_status(
+                        document_info, status=IngestionStatus.AUGMENTING
+                    )
+                    await self.augment_document_info(
+                        document_info, extractions
+                    )
+                    return document_info, extractions
+            except Exception as e:
+                await self._fail_batch_document(document_info, result, e)
+                return None
+
+        for start in range(0, len(documents), self.BATCH_WINDOW_SIZE):
+            window = list(
+                zip(
+                    documents[start : start + self.BATCH_WINDOW_SIZE],
+                    results[start : start + self.BATCH_WINDOW_SIZE],
+                )
+            )
+            prepared = await asyncio.gather(
+                *(prepare(document, result) for document, result in window)
+            )
+            ready = [
+                (result, item[0], item[1])
+                for (_, result), item in zip(window, prepared)
+                if item is not None
+            ]
+            if not ready:
+                continue
+
+            try:
+                extractions = [
+                    extraction
+                    for _, _, document_extractions in ready
+                    for extraction in document_extractions
+                ]
+                for _, document_info, document_extractions in ready:
+                    if document_extractions:
+                        await self.update_document_status(
+                            document_info, status=IngestionStatus.EMBEDDING
+                        )
+                if extractions:
+                    embeddings = [
+                        embedding
+                        async for embedding in await self.embed_document(
+                            extractions
+                        )
+                    ]
+                    for _, document_info, _ in ready:
+                        await self.update_document_status(
+                            document_info, status=IngestionStatus.STORING
+                        )
+                    async for _ in await self.store_embeddings(embeddings):
+                        pass
+            except Exception as e:
+                for result, document_info, _ in ready:
+                    await self._fail_batch_document(document_info, result, e)
+                continue
+
+            failures = await self.assign_documents_to_collections(
+                [document_info for _, document_info, _ in ready],
+                collection_ids,
+            )
+            for result, document_info, _ in ready:
+                if document_info.id in failures:
+                    await self._fail_batch_document(
+                        document_info, result, failures[document_info.id]
+                    )
+                    continue
+                await self.update_document_status(
+                    document_info, status=IngestionStatus.SUCCESS
+                )
+                result["status"] = IngestionStatus.SUCCESS.value
+
+        return results
+
+    async def _fail_batch_document(
+        self,
+        document_info: Optional[DocumentResponse],
+        result: dict,
+        error: Exception,
+    ) -> None:
+        logger.error(
+            f"Error ingesting {result['filename']} ({result['document_id']}): {error}"
+        )
+        result["status"] = IngestionStatus.FAILED.value
+        if isinstance(error, R2RException):
+            result["error"] = error.message
+        elif isinstance(error, HTTPException):
+            result["error"] = str(error.detail)
+        else:
+            result["error"] = str(error)
+        if document_info is not None:
+            await self.update_document_status(
+                document_info, status=IngestionStatus.FAILED
+            )
+
+    async def assign_document_to_collections(
+        self,
+        document_info: DocumentResponse,
+        collection_ids: Optional[list[UUID]],
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> None:
+        """
+        Add one ingested document to collections, as
+        `assign_documents_to_collections` does, raising if it fails.
+        """
+        failures = await self.assign_documents_to_collections(
+            [document_info], collection_ids, name, description
+        )
+        if failures:
+            raise failures[document_info.id]
+
+    async def assign_documents_to_collections(
+        self,
+        document_infos: list[DocumentResponse],
+        collection_ids: Optional[list[UUID]],
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> dict[UUID, Exception]:
+        """
+        Add ingested documents and their chunks to the given collections,
+        creating any that do not exist yet with `name` and `description`,
+        or to their owners' default collections when no collections are
+        given.
+
+        Returns the error of each document that could not be assigned.
+        """
+        database = self.providers.database
+        if collection_ids:
+            assignments = [
+                (document_info, collection_id)
+                for collection_id in collection_ids
+                for document_info in document_infos
+            ]
+            name = name or "My Collection"
+            if description is None:
+                description = (
+                    f"A collection started during {document_infos[0].title} ingestion"
+                    if len(document_infos) == 1
+                    else "A collection started during bulk ingestion"
+                )
+            for collection_id in collection_ids:
+                try:
+                    # FIXME: Right now we just throw a warning if the collection already exists, but we should probably handle this more gracefully
+                    await database.collections_handler.create_collection(
+                        owner_id=document_infos[0].owner_id,
+                        name=name,
+                        description=description,
+                        collection_id=collection_id,
+                    )
+                    await database.graphs_handler.create(
+                        collection_id=collection_id,
+                        name=name,
+                        description=description,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Warning, could not create collection with error: {str(e)}"
+                    )
+        else:
+            assignments = [
+                (
+                    document_info,
+                    generate_default_user_collection_id(
+                        document_info.owner_id
+                    ),
+                )
+                for document_info in document_infos
+            ]
+
+        failures: dict[UUID, Exception] = {}
+        outdated = set()
+        for document_info, collection_id in assignments:
+            if document_info.id in failures:
+                continue
+            try:
+                await database.collections_handler.assign_document_to_collection_relational(
+                    document_id=document_info.id,
+                    collection_id=collection_id,
+                )
+                await database.chunks_handler.assign_document_chunks_to_collection(
+                    document_id=document_info.id,
+                    collection_id=collection_id,
+                )
+                outdated.add(collection_id)
+            except Exception as e:
+                logger.error(
+                    f"Error during assigning document to collection: {str(e)}"
+                )
+                failures[document_info.id] = e
+
+        for collection_id in outdated:
+            for status_type in ("graph_sync_status", "graph_cluster_status"):
+                # NOTE - we should actually check that cluster has been made first, if not it should be PENDING still
+                await database.documents_handler.set_workflow_status(
+                    id=collection_id,
+                    status_type=status_type,
+                    status=KGEnrichmentStatus.OUTDATED,
+                )
+        return failures
+
     async def finalize_ingestion(
         self, document_info: DocumentResponse
     ) -> None:
@@ -739,7 +1221,32 @@ class IngestionServiceAdapter:
             "ingestion_config": data["ingestion_config"] or {},
             "file_data": data["file_data"],
             "size_in_bytes": data["size_in_bytes"],
-            "collection_ids": data.get("collection_ids", []),
+            "collection_ids": (
+                [UUID(cid) for cid in data["collection_ids"]]
+                if data.get("collection_ids")
+                else None
+            ),
+        }
+
+    @staticmethod
+    def parse_ingest_files_batch_input(data: dict) -> dict:
+        return {
+            "user": IngestionServiceAdapter._parse_user_data(data["user"]),
+            "documents": [
+                {
+                    "document_id": UUID(document["document_id"]),
+                    "file_data": document["file_data"],
+                    "size_in_bytes": document["size_in_bytes"],
+                }
+                for document in data["documents"]
+            ],
+            "metadata": data.get("metadata") or {},
+            "collection_ids": (
+                [UUID(cid) for cid in data["collection_ids"]]
+                if data.get("collection_ids")
+                else None
+            ),
+            "ingestion_config": data.get("ingestion_config") or {},
         }
 
     @staticmethod
@@ -784,10 +1291,61 @@ class IngestionServiceAdapter:
             "index_measure": IndexMeasure(data["index_measure"]),
             "index_name": data["index_name"],
             "index_column": data["index_column"],
-            "index_arguments": data["index_arguments"],
+            "index_arguments": IngestionServiceAdapter._parse_index_arguments(
+                data["index_method"], data["index_arguments"]
+            ),
             "concurrently": data["concurrently"],
+            "build_settings": IngestionServiceAdapter._parse_build_settings(
+                data.get("build_settings")
+            ),
+        }
+
+    @staticmethod
+    def parse_update_vector_index_input(data: dict) -> dict:
+        index_method = data.get("index_method")
+        index_measure = data.get("index_measure")
+        return {
+            "index_name": data["index_name"],
+            "table_name": VectorTableName(data["table_name"]),
+            "index_method": (
+                IndexMethod(index_method) if index_method else None
+            ),
+            "index_measure": (
+                IndexMeasure(index_measure) if index_measure else None
+            ),
+            "index_arguments": IngestionServiceAdapter._parse_index_arguments(
+                index_method, data.get("index_arguments")
+            ),
+            "build_settings": IngestionServiceAdapter._parse_build_settings(
+                data.get("build_settings")
+            ),
         }
 
+    @staticmethod
+    def _parse_index_arguments(
+        index_method: Optional[str],
+        index_arguments: Optional[dict | IndexArgsIVFFlat | IndexArgsHNSW],
+    ) -> Optional[IndexArgsIVFFlat | IndexArgsHNSW]:
+        # Workflow inputs arrive as plain dicts, which the handler would
+        # otherwise silently ignore in favour of the default parameters.
+        if not isinstance(index_arguments, dict):
+            return index_arguments
+        if not index_arguments:
+            return None
+        if index_method == IndexMethod.ivfflat or "n_lists" in index_arguments:
+            return IndexArgsIVFFlat(**index_arguments)
+        return IndexArgsHNSW(**index_arguments)
+
+    @staticmethod
+    def _parse_build_settings(
+        build_settings: Optional[dict | IndexBuildSettings],
+    ) -> Optional[IndexBuildSettings]:
+        if not isinstance(build_settings, dict):
+            return build_settings
+        if not build_settings:
+            return None
+        return IndexBuildSettings(**build_settings)
+
     @staticmethod
     def parse_list_vector_indices_input(input_data: dict) -> dict:
         return {"table_name": input_data["table_name"]}
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from collections import defaultdict
@@ -30,6 +31,13 @@ logger = logging.getLogger()
 
 
 class ManagementService(Service):
+    # Chunks deleted per transaction when deleting by filter
+    DELETE_BATCH_SIZE = 10_000
+    # Seconds to wait before deleting again when every remaining match is
+    # locked by another transaction, and how many times to wait
+    DELETE_LOCKED_INTERVAL = 1.0
+    DELETE_LOCKED_ATTEMPTS = 30
+
     def __init__(
         self,
         config: R2RConfig,
@@ -47,6 +55,7 @@ class ManagementService(Service):
             agents,
             run_manager,
         )
+        self._delete_tasks: set[asyncio.Task] = set()
 
     @telemetry_event("AppSettings")
     async def app_settings(self):
@@ -68,6 +77,7 @@ class ManagementService(Service):
         offset: int,
         limit: int,
         user_ids: Optional[list[UUID]] = None,
+        after_email: Optional[str] = None,
         *args,
         **kwargs,
     ):
@@ -75,6 +85,7 @@ class ManagementService(Service):
             offset=offset,
             limit=limit,
             user_ids=user_ids,
+            after_email=after_email,
         )
 
     @telemetry_event("Delete")
@@ -89,10 +100,14 @@ class ManagementService(Service):
         "{key: {operator: value}, key: {operator: value}, ...}"
         and deletes entries matching the given filters from both vector and relational databases.
 
-        NOTE: This method is not atomic and may result in orphaned entries in the documents overview table.
-        NOTE: This method assumes that filters delete entire contents of any touched documents.
+        Chunks are deleted in batches of `DELETE_BATCH_SIZE`. Each batch also
+        removes, in the same transaction, the documents it leaves without
+        chunks along with their files and graph rows. The first batch runs
+        before returning; any further batches run in the background.
+
+        Returns the number of chunks and the ids of the documents deleted by
+        the first batch, and whether more is being deleted in the background.
         """
-        ### TODO - FIX THIS, ENSURE THAT DOCUMENTS OVERVIEW IS CLEARED
 
         def validate_filters(filters: dict[str, Any]) -> None:
             ALLOWED_FILTERS = {
@@ -141,148 +156,85 @@ class ManagementService(Service):
 
         logger.info(f"Deleting entries with filters: {filters}")
 
-        try:
-
-            def transform_chunk_id_to_id(
-                filters: dict[str, Any]
-            ) -> dict[str, Any]:
-                if isinstance(filters, dict):
-                    transformed = {}
-                    for key, value in filters.items():
-                        if key == "chunk_id":
-                            transformed["id"] = value
-                        elif key in ["$and", "$or"]:
-                            transformed[key] = [
-                                transform_chunk_id_to_id(item)
-                                for item in value
-                            ]
-                        else:
-                            transformed[key] = transform_chunk_id_to_id(value)
-                    return transformed
-                return filters
-
-            filters_xf = transform_chunk_id_to_id(copy(filters))
-
-            await self.providers.database.chunks_handler.delete(filters)
-
-            vector_delete_results = (
-                await self.providers.database.chunks_handler.delete(filters_xf)
-            )
-        except Exception as e:
-            logger.error(f"Error deleting from vector database: {e}")
-            vector_delete_results = {}
-
-        document_ids_to_purge: set[UUID] = set()
-        if vector_delete_results:
-            document_ids_to_purge.update(
-                UUID(result.get("document_id"))
-                for result in vector_delete_results.values()
-                if result.get("document_id")
+        def transform_chunk_id_to_id(
+            filters: dict[str, Any]
+        ) -> dict[str, Any]:
+            if isinstance(filters, dict):
+                transformed = {}
+                for key, value in filters.items():
+                    if key == "chunk_id":
+                        transformed["id"] = value
+                    elif key in ["$and", "$or"]:
+                        transformed[key] = [
+                            transform_chunk_id_to_id(item) for item in value
+                        ]
+                    else:
+                        transformed[key] = transform_chunk_id_to_id(value)
+                return transformed
+            return filters
+
+        filters_xf = transform_chunk_id_to_id(copy(filters))
+
+        result = await self.providers.database.chunks_handler.delete_by_filter(
+            filters_xf, batch_size=self.DELETE_BATCH_SIZE
+        )
+        if (
+            not result["chunks_deleted"]
+            and not result["document_ids"]
+            and not result["has_more"]
+        ):
+            raise R2RException(
+                status_code=404, message="No entries found for deletion."
             )
 
-        # TODO: This might be appropriate to move elsewhere and revisit filter logic in other methods
-        def extract_filters(filters: dict[str, Any]) -> dict[str, list[str]]:
-            relational_filters: dict = {}
-
-            def process_filter(filter_dict: dict[str, Any]):
-                if "document_id" in filter_dict:
-                    relational_filters.setdefault(
-                        "filter_document_ids", []
-                    ).append(filter_dict["document_id"]["$eq"])
-                if "owner_id" in filter_dict:
-                    relational_filters.setdefault(
-                        "filter_user_ids", []
-                    ).append(filter_dict["owner_id"]["$eq"])
-                if "collection_ids" in filter_dict:
-                    relational_filters.setdefault(
-                        "filter_collection_ids", []
-                    ).extend(filter_dict["collection_ids"]["$in"])
-
-            # Handle nested conditions
-            if "$and" in filters:
-                for condition in filters["$and"]:
-                    process_filter(condition)
-            elif "$or" in filters:
-                for condition in filters["$or"]:
-                    process_filter(condition)
-            else:
-                process_filter(filters)
-
-            return relational_filters
-
-        relational_filters = extract_filters(filters)
-        if relational_filters:
-            try:
-                documents_overview = (
-                    await self.providers.database.documents_handler.get_documents_overview(  # FIXME: This was using the pagination defaults from before... We need to review if this is as intended.
-                        offset=0,
-                        limit=1000,
-                        **relational_filters,  # type: ignore
-                    )
-                )["results"]
-            except Exception as e:
-                logger.error(
-                    f"Error fetching documents from relational database: {e}"
-                )
-                documents_overview = []
-
-            if documents_overview:
-                document_ids_to_purge.update(
-                    doc.id for doc in documents_overview
-                )
-
-            if not document_ids_to_purge:
-                raise R2RException(
-                    status_code=404, message="No entries found for deletion."
-                )
+        if result["has_more"]:
+            # The rest is deleted in the background, one consistent batch
+            # at a time; should that stop early, deleting again resumes it
+            task = asyncio.create_task(self._delete_remaining(filters_xf))
+            self._delete_tasks.add(task)
+            task.add_done_callback(self._delete_tasks.discard)
 
-            for document_id in document_ids_to_purge:
-                remaining_chunks = await self.providers.database.chunks_handler.list_document_chunks(  # FIXME: This was using the pagination defaults from before... We need to review if this is as intended.
-                    document_id=document_id,
-                    offset=0,
-                    limit=1000,
-                )
-                if remaining_chunks["total_entries"] == 0:
-                    try:
-                        await self.providers.database.chunks_handler.delete(
-                            {"document_id": {"$eq": document_id}}
-                        )
-                        logger.info(
-                            f"Deleted document ID {document_id} from documents_overview."
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error deleting document ID {document_id} from documents_overview: {e}"
-                        )
-                await self.providers.database.graphs_handler.entities.delete(
-                    parent_id=document_id,
-                    store_type="documents",  # type: ignore
-                )
-                await self.providers.database.graphs_handler.relationships.delete(
-                    parent_id=document_id,
-                    store_type="documents",  # type: ignore
-                )
-                await self.providers.database.documents_handler.delete(
-                    document_id=document_id
-                )
+        logger.info(
+            f"Deleted {result['chunks_deleted']} chunks and {len(result['document_ids'])} documents"
+            + (
+                ", continuing in the background."
+                if result["has_more"]
+                else "."
+            )
+        )
+        return result
 
-                collections = await self.providers.database.collections_handler.get_collections_overview(
-                    offset=0, limit=1000, filter_document_ids=[document_id]
+    async def _delete_remaining(self, filters: dict[str, Any]) -> None:
+        chunks_deleted, documents_deleted = 0, 0
+        locked_attempts = 0
+        try:
+            while True:
+                result = await self.providers.database.chunks_handler.delete_by_filter(
+                    filters, batch_size=self.DELETE_BATCH_SIZE
                 )
-                # TODO - Loop over all collections
-                for collection in collections["results"]:
-                    await self.providers.database.documents_handler.set_workflow_status(
-                        id=collection.id,
-                        status_type="graph_sync_status",
-                        status=KGEnrichmentStatus.OUTDATED,
-                    )
-                    await self.providers.database.documents_handler.set_workflow_status(
-                        id=collection.id,
-                        status_type="graph_cluster_status",
-                        status=KGEnrichmentStatus.OUTDATED,
+                chunks_deleted += result["chunks_deleted"]
+                documents_deleted += len(result["document_ids"])
+                if not result["has_more"]:
+                    break
+                if result["chunks_deleted"] or result["document_ids"]:
+                    locked_attempts = 0
+                    continue
+                # What still matches is locked by another transaction
+                locked_attempts += 1
+                if locked_attempts > self.DELETE_LOCKED_ATTEMPTS:
+                    raise R2RException(
+                        "Remaining entries stayed locked by other transactions.",
+                        409,
                     )
-
-        return None
+                await asyncio.sleep(self.DELETE_LOCKED_INTERVAL)
+        except Exception as e:
+            logger.error(
+                f"Background deletion with filters {filters} stopped after {chunks_deleted} chunks and {documents_deleted} documents: {e}"
+            )
+            return
+        logger.info(
+            f"Background deletion with filters {filters} finished, deleting {chunks_deleted} more chunks and {documents_deleted} more documents."
+        )
 
     @telemetry_event("DownloadFile")
     async def download_file(
@@ -674,10 +626,12 @@ class ManagementService(Service):
     async def get_conversation(
         self,
         conversation_id: str,
+        after: Optional[UUID] = None,
+        limit: int = -1,
         auth_user=None,
     ) -> Tuple[str, list[Message], list[dict]]:
         return await self.providers.database.conversations_handler.get_conversation(  # type: ignore
-            conversation_id
+            conversation_id, after=after, limit=limit
         )
 
     async def verify_conversation_access(
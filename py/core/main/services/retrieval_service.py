@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import time
@@ -22,7 +23,6 @@ from core.base import (
 )
 from core.base.api.models import CombinedSearchResponse, RAGResponse, User
 from core.telemetry.telemetry_decorator import telemetry_event
-from shared.api.models.management.responses import MessageResponse
 
 from ..abstractions import R2RAgents, R2RPipelines, R2RPipes, R2RProviders
 from ..config import R2RConfig
@@ -49,6 +49,7 @@ class RetrievalService(Service):
             agents,
             run_manager,
         )
+        self._history_summary_tasks: dict[UUID, asyncio.Task] = {}
 
     @telemetry_event("Search")
     async def search(  # TODO - rename to 'search_chunks'
@@ -223,13 +224,15 @@ class RetrievalService(Service):
                     **kwargs,
                 }
 
-                async for (
-                    chunk
-                ) in await self.pipelines.streaming_rag_pipeline.run(
+                stream = await self.pipelines.streaming_rag_pipeline.run(
                     *args,
                     **merged_kwargs,
-                ):
-                    yield chunk
+                )
+                try:
+                    async for chunk in stream:
+                        yield chunk
+                finally:
+                    await stream.aclose()
 
         return stream_response()
 
@@ -302,31 +305,13 @@ class RetrievalService(Service):
                     if isinstance(value, UUID):
                         search_settings.filters[filter_key] = str(value)
 
-                ids = []
+                ids: list[UUID] = []
 
                 if conversation_id:  # Fetch the existing conversation
-                    try:
-                        conversation = await self.providers.database.conversations_handler.get_conversations_overview(
-                            offset=0,
-                            limit=1,
-                            conversation_ids=[conversation_id],
-                        )
-                    except Exception as e:
-                        logger.error(f"Error fetching conversation: {str(e)}")
-
-                    if conversation is not None:
-                        messages_from_conversation: list[Message] = []
-                        for message_response in conversation:
-                            if isinstance(message_response, MessageResponse):
-                                messages_from_conversation.append(
-                                    message_response.message
-                                )
-                                ids.append(message_response.id)
-                            else:
-                                logger.warning(
-                                    f"Unexpected type in conversation found: {type(message_response)}\n{message_response}"
-                                )
-                        messages = messages_from_conversation + messages
+                    history, ids = await self._load_conversation_history(
+                        conversation_id
+                    )
+                    messages = history + messages
                 else:  # Create new conversation
                     conversation_response = (
                         await self.providers.database.conversations_handler.create_conversation()
@@ -376,6 +361,11 @@ class RetrievalService(Service):
                                 include_title_if_available=include_title_if_available,
                             ):
                                 yield chunk
+                            yield (
+                                "<context>"
+                                f"{json.dumps(agent.context_reports)}"
+                                "</context>"
+                            )
 
                     return stream_response()
 
@@ -408,6 +398,9 @@ class RetrievalService(Service):
                     "conversation_id": str(
                         conversation_id
                     ),  # Ensure it's a string
+                    "metadata": {
+                        "context": self.agents.rag_agent.context_reports
+                    },
                 }
 
             except Exception as e:
@@ -422,6 +415,114 @@ class RetrievalService(Service):
                     detail=f"Internal Server Error - {str(e)}",
                 )
 
+    async def _load_conversation_history(
+        self, conversation_id: UUID
+    ) -> tuple[list[Message], list[UUID]]:
+        """
+        Load the part of a conversation the agent should see.
+
+        Only the most recent messages that fit `history_token_budget` are
+        loaded. When older messages are left out and `summarize_history` is
+        enabled, the stored summary of those turns is prepended instead, and
+        the summary is brought up to date in the background.
+        """
+        agent_config = self.config.agent
+        conversations_handler = self.providers.database.conversations_handler
+
+        if agent_config.history_token_budget is None:
+            history = await conversations_handler.get_conversation(
+                conversation_id
+            )
+            omitted = False
+        else:
+            history, omitted = await conversations_handler.get_recent_messages(
+                conversation_id,
+                max_tokens=agent_config.history_token_budget,
+                token_counter=lambda text: self.providers.llm.count_tokens(
+                    text, agent_config.generation_config.model
+                ),
+            )
+
+        messages = [message_response.message for message_response in history]
+        if omitted and agent_config.summarize_history:
+            summary, _ = await conversations_handler.get_conversation_summary(
+                conversation_id
+            )
+            if summary:
+                messages.insert(
+                    0,
+                    Message(
+                        role="system",
+                        content=f"Summary of the earlier conversation:\n{summary}",
+                    ),
+                )
+            self._schedule_history_summary(conversation_id, history[0].id)
+
+        return messages, [message_response.id for message_response in history]
+
+    def _schedule_history_summary(
+        self, conversation_id: UUID, window_start: UUID
+    ) -> None:
+        if conversation_id in self._history_summary_tasks:
+            return
+        task = asyncio.create_task(
+            self._update_history_summary(conversation_id, window_start)
+        )
+        self._history_summary_tasks[conversation_id] = task
+        task.add_done_callback(
+            lambda _: self._history_summary_tasks.pop(conversation_id, None)
+        )
+
+    async def _update_history_summary(
+        self,
+        conversation_id: UUID,
+        window_start: UUID,
+        batch_size: int = 64,
+    ) -> None:
+        """Fold the turns that fell out of the history window into the summary."""
+        conversations_handler = self.providers.database.conversations_handler
+        try:
+            summary, summary_through = (
+                await conversations_handler.get_conversation_summary(
+                    conversation_id
+                )
+            )
+            pending = await conversations_handler.get_conversation(
+                conversation_id,
+                after=summary_through,
+                before=window_start,
+                limit=batch_size,
+            )
+            transcript = "\n".join(
+                f"{getattr(m.message.role, 'value', m.message.role)}: {m.message.content}"
+                for m in pending
+                if m.message.content
+            )
+            if not transcript:
+                return
+
+            response = await self.providers.llm.aget_completion(
+                messages=await self.providers.database.prompts_handler.get_message_payload(
+                    task_prompt_name=self.config.agent.history_summary_prompt,
+                    task_inputs={
+                        "summary": summary or "None yet.",
+                        "messages": transcript,
+                    },
+                ),
+                generation_config=GenerationConfig(
+                    model=self.config.agent.generation_config.model
+                ),
+            )
+            new_summary = response.choices[0].message.content
+            if new_summary:
+                await conversations_handler.update_conversation_summary(
+                    conversation_id, new_summary, pending[-1].id
+                )
+        except Exception as e:
+            logger.warning(
+                f"Failed to update summary for conversation {conversation_id}: {e}"
+            )
+
 
 class RetrievalServiceAdapter:
     @staticmethod
@@ -1,4 +1,5 @@
 from .media import *
+from .repositories import *
 from .structured import *
 from .text import *
 
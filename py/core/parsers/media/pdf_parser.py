@@ -1,12 +1,13 @@
 # type: ignore
 import asyncio
 import base64
+import hashlib
 import logging
 import os
 import string
 import tempfile
 import unicodedata
-import uuid
+from collections import deque
 from io import BytesIO
 from typing import AsyncGenerator
 
@@ -27,7 +28,30 @@ logger = logging.getLogger()
 
 
 class VLMPDFParser(AsyncParser[str | bytes]):
-    """A parser for PDF documents using vision models for page processing."""
+    """
+    A parser for PDF documents using vision models for page processing.
+
+    Pages are rendered one at a time, in memory, just ahead of the vision
+    calls that consume them, and at most `vision_pdf_max_concurrency` calls
+    are in flight. Pages whose own text layer is usable and that have no
+    images are not sent to the vision model, and descriptions are cached by
+    rendered page image so re-ingesting a document does not pay for them
+    again.
+    """
+
+    # Resolution bounds; denser text gets the higher resolution, and large
+    # pages are scaled down to what vision models accept without resizing
+    MIN_DPI = 72
+    SPARSE_DPI = 200
+    DENSE_DPI = 300
+    DENSE_CHARS_PER_SQUARE_INCH = 40
+    MAX_IMAGE_EDGE = 3_072
+
+    JPEG_QUALITY = 85
+
+    # Share of a text layer's characters that must be readable for it to be
+    # used in place of the vision model
+    MIN_READABLE_RATIO = 0.9
 
     def __init__(
         self,
@@ -49,54 +73,118 @@ class VLMPDFParser(AsyncParser[str | bytes]):
             raise ImportError(
                 "Please install the `litellm` package to use the VLMPDFParser."
             )
+        try:
+            from pypdf import PdfReader
+
+            self.PdfReader = PdfReader
+        except ImportError:
+            raise ImportError(
+                "Please install the `pypdf` package to use the VLMPDFParser."
+            )
+
+    def _analyze_page(self, reader, page_num: int) -> dict:
+        """Read what rendering and caching need to know about a page."""
+        page = reader.pages[page_num - 1]
+        width = float(page.mediabox.width) / 72
+        height = float(page.mediabox.height) / 72
+
+        try:
+            text = page.extract_text() or ""
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {page_num}: {e}")
+            text = ""
 
-    def _create_temp_dir(self) -> str:
-        """Create a unique temporary directory for PDF processing."""
-        # Create a unique directory name using UUID
-        unique_id = str(uuid.uuid4())
-        temp_base = tempfile.gettempdir()
-        temp_dir = os.path.join(temp_base, f"pdf_images_{unique_id}")
-        os.makedirs(temp_dir, exist_ok=True)
-        return temp_dir
-
-    async def convert_pdf_to_images(
-        self, pdf_path: str, temp_dir: str
-    ) -> list[str]:
-        """Convert PDF pages to images asynchronously."""
-        options = {
-            "pdf_path": pdf_path,
-            "output_folder": temp_dir,
-            "dpi": 300,  # Configurable via config if needed
-            "fmt": "jpeg",
-            "thread_count": 4,
-            "paths_only": True,
+        has_images = False
+        try:
+            resources = page.get("/Resources")
+            xobjects = (
+                resources.get_object().get("/XObject") if resources else None
+            )
+            if xobjects:
+                xobjects = xobjects.get_object()
+                has_images = any(
+                    xobjects[name].get_object().get("/Subtype") == "/Image"
+                    for name in xobjects
+                )
+        except Exception as e:
+            logger.warning(
+                f"Failed to read the images of page {page_num}: {e}"
+            )
+            has_images = True
+
+        return {
+            "page_num": page_num,
+            "text": text,
+            "has_images": has_images,
+            "dpi": self._choose_dpi(width, height, len(text)),
         }
+
+    def _choose_dpi(self, width: float, height: float, chars: int) -> int:
+        """Pick a resolution from the page size (in inches) and text density."""
+        area = max(width * height, 1.0)
+        dpi = (
+            self.DENSE_DPI
+            if chars / area >= self.DENSE_CHARS_PER_SQUARE_INCH
+            else self.SPARSE_DPI
+        )
+        longest_edge = max(width, height, 1.0)
+        return max(
+            self.MIN_DPI, min(dpi, int(self.MAX_IMAGE_EDGE / longest_edge))
+        )
+
+    def _text_layer_is_usable(self, page: dict) -> bool:
+        if self.config.vision_pdf_text_layer_min_chars <= 0:
+            return False
+        if page["has_images"]:
+            return False
+        characters = "".join(page["text"].split())
+        if len(characters) < self.config.vision_pdf_text_layer_min_chars:
+            return False
+        readable = sum(
+            ch.isalnum() or ch in string.punctuation for ch in characters
+        )
+        return readable / len(characters) >= self.MIN_READABLE_RATIO
+
+    def _render_page(self, pdf_path: str, page_num: int, dpi: int) -> bytes:
+        """Render a single page to JPEG bytes in memory."""
         try:
-            return await asyncio.to_thread(convert_from_path, **options)
+            images = convert_from_path(
+                pdf_path, dpi=dpi, first_page=page_num, last_page=page_num
+            )
         except PDFInfoNotInstalledError:
             raise PopperNotFoundError()
         except Exception as err:
             logger.error(
-                f"Error converting PDF to images: {err} type: {type(err)}"
+                f"Error converting PDF page {page_num} to an image: {err} type: {type(err)}"
             )
             raise PDFParsingError(f"Failed to process PDF: {str(err)}", err)
 
-    async def process_page(
-        self, image_path: str, page_num: int
-    ) -> dict[str, str]:
+        buffer = BytesIO()
+        images[0].convert("RGB").save(
+            buffer, format="JPEG", quality=self.JPEG_QUALITY
+        )
+        return buffer.getvalue()
+
+    def _cache_key(self, image_data: bytes) -> str:
+        # The rendered image is exactly what the vision model is shown, so
+        # fonts, nested forms and anything else that changes how the page
+        # looks changes the key
+        return hashlib.sha256(
+            "\n".join(
+                [
+                    "vision_pdf",
+                    self.config.vision_pdf_model,
+                    self.vision_prompt_text or "",
+                    hashlib.sha256(image_data).hexdigest(),
+                ]
+            ).encode()
+        ).hexdigest()
+
+    async def process_page(self, image_data: bytes, page_num: int) -> str:
         """Process a single PDF page using the vision model."""
 
         try:
-            # Read and encode image
-            async with aiofiles.open(image_path, "rb") as image_file:
-                image_data = await image_file.read()
-                image_base64 = base64.b64encode(image_data).decode("utf-8")
-
-            # Verify model supports vision
-            if not self.supports_vision(model=self.config.vision_pdf_model):
-                raise ValueError(
-                    f"Model {self.config.vision_pdf_model} does not support vision"
-                )
+            image_base64 = base64.b64encode(image_data).decode("utf-8")
 
             # Configure generation parameters
             generation_config = GenerationConfig(
@@ -129,7 +217,7 @@ class VLMPDFParser(AsyncParser[str | bytes]):
                 content = response.choices[0].message.content
                 if not content:
                     raise ValueError("No content in response")
-                return {"page": str(page_num), "content": content}
+                return content
             else:
                 raise ValueError("No response content")
 
@@ -139,88 +227,113 @@ class VLMPDFParser(AsyncParser[str | bytes]):
             )
             raise
 
+    async def _parse_page(
+        self, pdf_path: str, page: dict, semaphore: asyncio.Semaphore
+    ) -> str:
+        page_num = page["page_num"]
+        if self._text_layer_is_usable(page):
+            return page["text"]
+
+        cache_handler = getattr(
+            self.database_provider, "parse_cache_handler", None
+        )
+        async with semaphore:
+            image_data = await asyncio.to_thread(
+                self._render_page, pdf_path, page_num, page["dpi"]
+            )
+            cache_key = self._cache_key(image_data) if cache_handler else None
+            if cache_key:
+                try:
+                    cached = await cache_handler.get_cached(cache_key)
+                    if cached is not None:
+                        return cached
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to read the cached description of page {page_num}: {e}"
+                    )
+            content = await self.process_page(image_data, page_num)
+
+        if cache_key:
+            try:
+                await cache_handler.set_cached(cache_key, content)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to cache the description of page {page_num}: {e}"
+                )
+        return content
+
     async def ingest(
-        self, data: str | bytes, maintain_order: bool = False, **kwargs
-    ) -> AsyncGenerator[dict[str, str], None]:
+        self, data: str | bytes, **kwargs
+    ) -> AsyncGenerator[str, None]:
         """
-        Ingest PDF data and yield descriptions for each page using vision model.
+        Ingest PDF data and yield a description of each page, in page order.
 
         Args:
             data: PDF file path or bytes
-            maintain_order: If True, yields results in page order. If False, yields as completed.
             **kwargs: Additional arguments passed to the completion call
 
         Yields:
-            Dict containing page number and content for each processed page
+            The content of each page
         """
         if not self.vision_prompt_text:
             self.vision_prompt_text = await self.database_provider.prompts_handler.get_cached_prompt(  # type: ignore
                 prompt_name=self.config.vision_pdf_prompt_name
             )
 
-        temp_dir = None
-        try:
-            # Create temporary directory for image processing
-            # temp_dir = os.path.join(os.getcwd(), "temp_pdf_images")
-            # os.makedirs(temp_dir, exist_ok=True)
-            temp_dir = self._create_temp_dir()
+        # Verify model supports vision
+        if not self.supports_vision(model=self.config.vision_pdf_model):
+            raise ValueError(
+                f"Model {self.config.vision_pdf_model} does not support vision"
+            )
+
+        concurrency = max(1, self.config.vision_pdf_max_concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+        # Pages are analyzed and scheduled only this far ahead of the page
+        # being yielded, which bounds memory for very long documents
+        window = concurrency * 2
 
-            # Handle both file path and bytes input
+        temp_path = None
+        in_flight: deque[asyncio.Task] = deque()
+        try:
+            # Poppler renders from a file, so bytes are written out once
             if isinstance(data, bytes):
-                pdf_path = os.path.join(temp_dir, "temp.pdf")
-                async with aiofiles.open(pdf_path, "wb") as f:
+                with tempfile.NamedTemporaryFile(
+                    suffix=".pdf", delete=False
+                ) as temp_file:
+                    temp_path = temp_file.name
+                async with aiofiles.open(temp_path, "wb") as f:
                     await f.write(data)
+                pdf_path = temp_path
             else:
                 pdf_path = data
 
-            # Convert PDF to images
-            image_paths = await self.convert_pdf_to_images(pdf_path, temp_dir)
-            # Create tasks for all pages
-            tasks = {
-                asyncio.create_task(
-                    self.process_page(image_path, page_num)
-                ): page_num
-                for page_num, image_path in enumerate(image_paths, 1)
-            }
-
-            if maintain_order:
-                # Store results in order
-                pending = set(tasks.keys())
-                results = {}
-                next_page = 1
-
-                while pending:
-                    # Get next completed task
-                    done, pending = await asyncio.wait(
-                        pending, return_when=asyncio.FIRST_COMPLETED
-                    )
-
-                    # Process completed tasks
-                    for task in done:
-                        result = await task
-                        page_num = int(result["page"])
-                        results[page_num] = result
+            reader = await asyncio.to_thread(self.PdfReader, pdf_path)
+            num_pages = len(reader.pages)
+            next_page = 1
 
-                        # Yield results in order
-                        while next_page in results:
-                            yield results.pop(next_page)["content"]
-                            next_page += 1
-            else:
-                # Yield results as they complete
-                for coro in asyncio.as_completed(tasks.keys()):
-                    result = await coro
-                    yield result["content"]
+            while next_page <= num_pages or in_flight:
+                while next_page <= num_pages and len(in_flight) < window:
+                    page = await asyncio.to_thread(
+                        self._analyze_page, reader, next_page
+                    )
+                    in_flight.append(
+                        asyncio.create_task(
+                            self._parse_page(pdf_path, page, semaphore)
+                        )
+                    )
+                    next_page += 1
+                yield await in_flight.popleft()
 
         except Exception as e:
             logger.error(f"Error processing PDF: {str(e)}")
             raise
 
         finally:
-            # Cleanup temporary files
-            if temp_dir and os.path.exists(temp_dir):
-                for file in os.listdir(temp_dir):
-                    os.remove(os.path.join(temp_dir, file))
-                os.rmdir(temp_dir)
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
 
 
 class BasicPDFParser(AsyncParser[str | bytes]):
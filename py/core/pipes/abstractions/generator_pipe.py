@@ -2,7 +2,12 @@ from abc import abstractmethod
 from typing import Any, AsyncGenerator, Optional
 from uuid import UUID
 
-from core.base import AsyncState, CompletionProvider, DatabaseProvider
+from core.base import (
+    AsyncState,
+    CompletionProvider,
+    ContextBuilder,
+    DatabaseProvider,
+)
 from core.base.abstractions import GenerationConfig
 from core.base.pipes.base_pipe import AsyncPipe
 
@@ -29,6 +34,16 @@ class GeneratorPipe(AsyncPipe):
         self.llm_provider = llm_provider
         self.database_provider = database_provider
 
+    def _create_context_builder(
+        self, rag_generation_config: GenerationConfig
+    ) -> ContextBuilder:
+        return ContextBuilder(
+            token_counter=lambda text: self.llm_provider.count_tokens(
+                text, rag_generation_config.model
+            ),
+            max_tokens=self.llm_provider.config.context_token_budget,
+        )
+
     @abstractmethod
     async def _run_logic(
         self,
@@ -29,8 +29,18 @@ class SearchPipe(AsyncPipe[ChunkSearchResult]):
             **kwargs,
         )
 
+    async def embed_queries(
+        self, queries: list[str]
+    ) -> Optional[list[list[float]]]:
+        """
+        Embeds several queries at once for pipes that search by vector, so
+        that callers fanning out over sub-queries can share one provider
+        call. Returns None for pipes that do not use query embeddings.
+        """
+        return None
+
     @abstractmethod
-    async def search(
+    def search(
         self,
         query: str,
         search_settings: Any,
@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 from uuid import UUID
 
 from core.base import (
@@ -41,11 +41,18 @@ class VectorSearchPipe(SearchPipe):
     def config(self) -> SearchPipe.SearchConfig:
         return self._config
 
+    async def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        return await self.embedding_provider.async_get_embeddings(
+            queries,
+            purpose=EmbeddingPurpose.QUERY,
+        )
+
     async def search(  # type: ignore
         self,
         message: str,
         search_settings: SearchSettings,
         *args: Any,
+        query_vector: Optional[list[float]] = None,
         **kwargs: Any,
     ) -> AsyncGenerator[ChunkSearchResult, None]:
         if search_settings.chunk_settings.enabled == False:
@@ -56,10 +63,11 @@ class VectorSearchPipe(SearchPipe):
         )
         search_settings.limit = search_settings.limit or self.config.limit
         results = []
-        query_vector = await self.embedding_provider.async_get_embedding(
-            message,
-            purpose=EmbeddingPurpose.QUERY,
-        )
+        if query_vector is None:
+            query_vector = await self.embedding_provider.async_get_embedding(
+                message,
+                purpose=EmbeddingPurpose.QUERY,
+            )
 
         if (
             search_settings.use_fulltext_search
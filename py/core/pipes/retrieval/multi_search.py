@@ -1,4 +1,5 @@
-from copy import copy, deepcopy
+import asyncio
+from copy import copy
 from typing import Any, AsyncGenerator, Optional
 from uuid import UUID
 
@@ -8,6 +9,7 @@ from core.base.abstractions import (
     SearchSettings,
 )
 from core.base.pipes.base_pipe import AsyncPipe
+from core.base.utils import to_async_generator
 
 from ..abstractions.search_pipe import SearchPipe
 from .query_transform_pipe import QueryTransformPipe
@@ -71,79 +73,92 @@ class MultiSearchPipe(AsyncPipe):
             *args,
             **kwargs,
         )
+        queries = [query async for query in query_generator]
+        if not queries:
+            return
 
+        limit = search_settings.limit
+        search_settings = copy(search_settings)
         if self.config.use_rrf:
             search_settings.limit = (
                 self.config.expansion_factor * search_settings.limit
             )
-            results = []
-            async for search_result in await self.vector_search_pipe.run(
-                self.vector_search_pipe.Input(message=query_generator),
-                state,
-                search_settings=search_settings,
-                *args,
-                **kwargs,
-            ):
-                results.append(search_result)
-
-            # Collection results by their associated queries
-            grouped_results: dict[str, list[ChunkSearchResult]] = {}
-            for result in results:
-                query = result.metadata["associated_query"]
-                if query not in grouped_results:
-                    grouped_results[query] = []
-                grouped_results[query].append(result)
-
-            fused_results = self.reciprocal_rank_fusion(grouped_results)
-            for result in fused_results[: search_settings.limit]:
+
+        # Embed every sub-query in a single provider call, then run the
+        # sub-searches concurrently rather than one after another.
+        query_vectors = await self.vector_search_pipe.embed_queries(queries)
+
+        async def _search(
+            query: str, query_vector: Optional[list[float]]
+        ) -> list[ChunkSearchResult]:
+            # Run each sub-search through the pipe so that it is logged and
+            # recorded in the pipeline state like a direct search
+            return [
+                result
+                async for result in await self.vector_search_pipe.run(
+                    self.vector_search_pipe.Input(
+                        message=to_async_generator([query])
+                    ),
+                    state,
+                    search_settings=copy(search_settings),
+                    query_vector=query_vector,
+                    *args,
+                    **kwargs,
+                )
+            ]
+
+        results_per_query = await asyncio.gather(
+            *(
+                _search(query, query_vectors[i] if query_vectors else None)
+                for i, query in enumerate(queries)
+            )
+        )
+
+        if self.config.use_rrf:
+            fused_results = self.reciprocal_rank_fusion(
+                dict(zip(queries, results_per_query)),
+                limit=limit,
+            )
+            for result in fused_results:
                 yield result
         else:
-            async for search_result in await self.vector_search_pipe.run(
-                self.vector_search_pipe.Input(message=query_generator),
-                state,
-                search_settings=search_settings,
-                *args,
-                **kwargs,
-            ):
-                yield search_result
+            for query_results in results_per_query:
+                for search_result in query_results:
+                    yield search_result
 
     def reciprocal_rank_fusion(
-        self, all_results: dict[str, list[ChunkSearchResult]]
+        self,
+        all_results: dict[str, list[ChunkSearchResult]],
+        limit: Optional[int] = None,
     ) -> list[ChunkSearchResult]:
-        document_scores: dict[UUID, float] = {}
-        document_results: dict[UUID, ChunkSearchResult] = {}
-        document_queries: dict[UUID, set[str]] = {}
+        # Fuse over (score, result, queries) entries keyed by chunk id, only
+        # the results that survive the cut are rewritten.
+        fused: dict[UUID, tuple[float, ChunkSearchResult, list[str]]] = {}
         for query, results in all_results.items():
             for rank, result in enumerate(results, 1):
-                doc_id = result.chunk_id
-                if doc_id not in document_scores:
-                    document_scores[doc_id] = 0
-                    document_results[doc_id] = result
-                    set_: set[str] = set()
-                    document_queries[doc_id] = set_
-                document_scores[doc_id] += 1 / (rank + self.config.rrf_k)
-                document_queries[doc_id].add(query)  # type: ignore
-
-        # Sort documents by their RRF score
-        sorted_docs = sorted(
-            document_scores.items(), key=lambda x: x[1], reverse=True
-        )
+                score, first_result, queries = fused.get(
+                    result.id, (0.0, result, [])
+                )
+                if query not in queries:
+                    queries.append(query)
+                fused[result.id] = (
+                    score + 1 / (rank + self.config.rrf_k),
+                    first_result,
+                    queries,
+                )
+
+        ranked = sorted(fused.values(), key=lambda x: x[0], reverse=True)
+        if limit is not None:
+            ranked = ranked[:limit]
 
-        # Reconstruct ChunkSearchResults with new ranking, RRF score, and associated queries
         fused_results = []
-        for doc_id, rrf_score in sorted_docs:
-            result = deepcopy(document_results[doc_id])
-            result.score = (
-                rrf_score  # Replace the original score with the RRF score
-            )
-            result.metadata["associated_queries"] = list(
-                document_queries[doc_id]  # type: ignore
-            )  # Add list of associated queries
+        for rrf_score, result, queries in ranked:
+            # Replace the original score with the RRF score
+            result.score = rrf_score
+            result.metadata["associated_queries"] = queries
             result.metadata["is_rrf_score"] = True
-            if "associated_query" in result.metadata:
-                del result.metadata[
-                    "associated_query"
-                ]  # Remove the old single associated_query
+            # Remove the old single associated_query
+            result.metadata.pop("associated_query", None)
             fused_results.append(result)
 
         return fused_results
@@ -1,33 +1,47 @@
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Any, AsyncGenerator
+import time
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Optional
 from uuid import UUID
 
-from core.base import (
-    AsyncPipe,
-    AsyncState,
-    CompletionProvider,
-    DatabaseProvider,
-)
+from core.base import AsyncPipe, AsyncState, CompletionProvider
 from core.base.abstractions import GenerationConfig
 
+from ...database.postgres import PostgresDatabaseProvider
 from ..abstractions.generator_pipe import GeneratorPipe
 
 logger = logging.getLogger()
 
 
 class QueryTransformPipe(GeneratorPipe):
+    """
+    Rewrites a query into several sub-queries with an LLM.
+
+    Popular queries repeat, so transformations are cached per normalized
+    query, prompt templates, number of outputs and generation config. Since
+    the templates themselves are part of the key, updating a prompt makes
+    the entries built from the old version unreachable.
+    """
+
     class QueryTransformConfig(GeneratorPipe.PipeConfig):
         name: str = "default_query_transform"
         system_prompt: str = "default_system"
         task_prompt: str = "hyde"
+        cache_size: int = 1024
+        cache_ttl_seconds: Optional[float] = 3600
 
     class Input(GeneratorPipe.Input):
         message: AsyncGenerator[str, None]
 
+    database_provider: PostgresDatabaseProvider
+
     def __init__(
         self,
         llm_provider: CompletionProvider,
-        database_provider: DatabaseProvider,
+        database_provider: PostgresDatabaseProvider,
         config: QueryTransformConfig,
         *args,
         **kwargs,
@@ -41,27 +55,81 @@ class QueryTransformPipe(GeneratorPipe):
             **kwargs,
         )
         self._config: QueryTransformPipe.QueryTransformConfig = config
+        self._cache: OrderedDict[str, tuple[float, list[str]]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     @property
     def config(self) -> QueryTransformConfig:  # type: ignore
         return self._config
 
-    async def _run_logic(  # type: ignore
+    def cache_stats(self) -> dict[str, Any]:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "size": len(self._cache),
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    async def _cache_key(
         self,
-        input: AsyncPipe.Input,
-        state: AsyncState,
-        run_id: UUID,
+        query: str,
+        num_query_xf_outputs: int,
+        generation_config: GenerationConfig,
+    ) -> str:
+        prompts_handler = self.database_provider.prompts_handler
+        key = {
+            "query": " ".join(query.split()).casefold(),
+            "system_prompt": await prompts_handler.get_cached_prompt(
+                self.config.system_prompt
+            ),
+            "task_prompt": await prompts_handler.get_cached_prompt(
+                self.config.task_prompt
+            ),
+            "num_outputs": num_query_xf_outputs,
+            "generation_config": generation_config.to_dict(),
+        }
+        return hashlib.sha256(
+            json.dumps(key, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def _get_cached(self, key: str) -> Optional[list[str]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        created_at, outputs = entry
+        ttl = self.config.cache_ttl_seconds
+        if ttl is not None and time.monotonic() - created_at > ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return outputs
+
+    def _set_cached(self, key: str, outputs: list[str]) -> None:
+        if self.config.cache_size <= 0:
+            return
+        self._cache[key] = (time.monotonic(), outputs)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.config.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _transform(
+        self,
+        query: str,
+        num_query_xf_outputs: int,
         query_transform_generation_config: GenerationConfig,
-        num_query_xf_outputs: int = 3,
-        *args: Any,
-        **kwargs: Any,
-    ) -> AsyncGenerator[str, None]:
-        async for query in input.message:
-            logger.info(
-                f"Transforming query: {query} into {num_query_xf_outputs} outputs with {self.config.task_prompt}."
-            )
+    ) -> list[str]:
+        logger.info(
+            f"Transforming query: {query} into {num_query_xf_outputs} outputs with {self.config.task_prompt}."
+        )
 
-            query_transform_request = await self.database_provider.prompts_handler.get_message_payload(
+        query_transform_request = (
+            await self.database_provider.prompts_handler.get_message_payload(
                 system_prompt_name=self.config.system_prompt,
                 task_prompt_name=self.config.task_prompt,
                 task_inputs={
@@ -69,19 +137,75 @@ class QueryTransformPipe(GeneratorPipe):
                     "num_outputs": num_query_xf_outputs,
                 },
             )
+        )
+
+        response = await self.llm_provider.aget_completion(
+            messages=query_transform_request,
+            generation_config=query_transform_generation_config,
+        )
+        content = response.choices[0].message.content
+        if not content:
+            logger.error(f"Failed to transform query: {query}. Skipping.")
+            raise ValueError(f"Failed to transform query: {query}.")
+        outputs = content.split("\n")
+        return [output.strip() for output in outputs if output.strip() != ""]
+
+    async def _cached_transform(
+        self,
+        query: str,
+        num_query_xf_outputs: int,
+        query_transform_generation_config: GenerationConfig,
+    ) -> list[str]:
+        key = await self._cache_key(
+            query, num_query_xf_outputs, query_transform_generation_config
+        )
+        outputs = self._get_cached(key)
+        if outputs is not None:
+            self.cache_hits += 1
+            return list(outputs)
+
+        # Concurrent requests for the same query share one LLM call
+        if key in self._in_flight:
+            self.cache_hits += 1
+            return list(await asyncio.shield(self._in_flight[key]))
+
+        self.cache_misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            outputs = await self._transform(
+                query, num_query_xf_outputs, query_transform_generation_config
+            )
+            self._set_cached(key, outputs)
+            future.set_result(outputs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark it retrieved so an unawaited failure isn't logged
+            future.exception()
+            raise
+        finally:
+            del self._in_flight[key]
 
-            response = await self.llm_provider.aget_completion(
-                messages=query_transform_request,
-                generation_config=query_transform_generation_config,
+        logger.debug(f"Query transform cache: {self.cache_stats()}")
+        return list(outputs)
+
+    async def _run_logic(  # type: ignore
+        self,
+        input: AsyncPipe.Input,
+        state: AsyncState,
+        run_id: UUID,
+        query_transform_generation_config: GenerationConfig,
+        num_query_xf_outputs: int = 3,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str, None]:
+        async for query in input.message:
+            outputs = await self._cached_transform(
+                query, num_query_xf_outputs, query_transform_generation_config
             )
-            content = response.choices[0].message.content
-            if not content:
-                logger.error(f"Failed to transform query: {query}. Skipping.")
-                raise ValueError(f"Failed to transform query: {query}.")
-            outputs = content.split("\n")
-            outputs = [
-                output.strip() for output in outputs if output.strip() != ""
-            ]
             await state.update(
                 self.config.name, {"output": {"outputs": outputs}}
             )
@@ -1,3 +1,4 @@
+import json
 import logging
 from typing import Any, AsyncGenerator, Generator
 from uuid import UUID
@@ -7,7 +8,6 @@ from core.base import (
     CompletionProvider,
     DatabaseProvider,
     LLMChatCompletionChunk,
-    format_search_results_for_llm,
     format_search_results_for_stream,
 )
 from core.base.abstractions import GenerationConfig
@@ -22,6 +22,7 @@ class StreamingSearchRAGPipe(GeneratorPipe):
         "search"  # TODO - change this to vector_search in next major release
     )
     COMPLETION_STREAM_MARKER = "completion"
+    CONTEXT_STREAM_MARKER = "context"
 
     def __init__(
         self,
@@ -53,12 +54,18 @@ class StreamingSearchRAGPipe(GeneratorPipe):
         *args: Any,
         **kwargs: Any,
     ) -> AsyncGenerator[str, None]:
-        context = ""
+        context_builder = self._create_context_builder(rag_generation_config)
         async for query, search_results in input.message:
             result = format_search_results_for_stream(search_results)
             yield result
-            gen_context = format_search_results_for_llm(search_results)
-            context += gen_context
+            context_builder.add_results(query, search_results)
+        context_result = context_builder.build()
+        context = context_result.context
+        yield (
+            f"<{self.CONTEXT_STREAM_MARKER}>"
+            f"{json.dumps(context_result.as_dict())}"
+            f"</{self.CONTEXT_STREAM_MARKER}>"
+        )
 
         messages = (
             await self.database_provider.prompts_handler.get_message_payload(
@@ -68,13 +75,19 @@ class StreamingSearchRAGPipe(GeneratorPipe):
             )
         )
         yield f"<{self.COMPLETION_STREAM_MARKER}>"
-        response = ""
-        for chunk in self.llm_provider.get_completion_stream(
+        # Chunks are only pulled from the provider as the client consumes
+        # them, and closing this generator on disconnect closes the upstream
+        # completion stream as well.
+        stream = self.llm_provider.aget_completion_stream(
             messages=messages, generation_config=rag_generation_config
-        ):
-            chunk_txt = StreamingSearchRAGPipe._process_chunk(chunk)
-            response += chunk_txt
-            yield chunk_txt
+        )
+        try:
+            async for chunk in stream:
+                chunk_txt = StreamingSearchRAGPipe._process_chunk(chunk)
+                if chunk_txt:
+                    yield chunk_txt
+        finally:
+            await stream.aclose()
 
         yield f"</{self.COMPLETION_STREAM_MARKER}>"
 
@@ -91,4 +104,6 @@ class StreamingSearchRAGPipe(GeneratorPipe):
 
     @staticmethod
     def _process_chunk(chunk: LLMChatCompletionChunk) -> str:
+        if not chunk.choices:
+            return ""
         return chunk.choices[0].delta.content or ""
@@ -1,9 +1,13 @@
 from .litellm import LiteLLMEmbeddingProvider
 from .ollama import OllamaEmbeddingProvider
 from .openai import OpenAIEmbeddingProvider
+from .rerank import HuggingFaceRerankClient, LocalRerankClient, RerankClient
 
 __all__ = [
     "LiteLLMEmbeddingProvider",
     "OpenAIEmbeddingProvider",
     "OllamaEmbeddingProvider",
+    "RerankClient",
+    "HuggingFaceRerankClient",
+    "LocalRerankClient",
 ]
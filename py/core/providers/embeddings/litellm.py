@@ -1,11 +1,8 @@
 import logging
 import os
-from copy import copy
-from typing import Any
+from typing import Any, Optional
 
 import litellm
-import requests
-from aiohttp import ClientError, ClientSession
 from litellm import AuthenticationError, aembedding, embedding
 
 from core.base import (
@@ -16,6 +13,8 @@ from core.base import (
     R2RException,
 )
 
+from .rerank import HuggingFaceRerankClient, LocalRerankClient, RerankClient
+
 logger = logging.getLogger()
 
 
@@ -41,21 +40,22 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
                 "LiteLLMEmbeddingProvider must be initialized with provider `litellm`."
             )
 
-        self.rerank_url = None
+        self.rerank_client: Optional[RerankClient] = None
         if config.rerank_model:
-
-            if "huggingface" not in config.rerank_model:
+            if config.rerank_model.startswith("local"):
+                self.rerank_client = LocalRerankClient(config)
+            elif "huggingface" in config.rerank_model:
+                url = os.getenv("HUGGINGFACE_API_BASE") or config.rerank_url
+                if not url:
+                    raise ValueError(
+                        "LiteLLMEmbeddingProvider requires a valid reranking API url to be set via `embedding.rerank_url` in the r2r.toml, or via the environment variable `HUGGINGFACE_API_BASE`."
+                    )
+                self.rerank_client = HuggingFaceRerankClient(config, url)
+            else:
                 raise ValueError(
-                    "LiteLLMEmbeddingProvider only supports re-ranking via the HuggingFace text-embeddings-inference API"
+                    "LiteLLMEmbeddingProvider only supports re-ranking via the HuggingFace text-embeddings-inference API or the `local` stand-in reranker"
                 )
 
-            url = os.getenv("HUGGINGFACE_API_BASE") or config.rerank_url
-            if not url:
-                raise ValueError(
-                    "LiteLLMEmbeddingProvider requires a valid reranking API url to be set via `embedding.rerank_url` in the r2r.toml, or via the environment variable `HUGGINGFACE_API_BASE`."
-                )
-            self.rerank_url = url
-
         self.base_model = config.base_model
         if "amazon" in self.base_model:
             logger.warn("Amazon embedding model detected, dropping params")
@@ -197,47 +197,9 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
         stage: EmbeddingProvider.PipeStage = EmbeddingProvider.PipeStage.RERANK,
         limit: int = 10,
     ):
-        if self.config.rerank_model is not None:
-            if not self.rerank_url:
-                raise ValueError(
-                    "Error, `rerank_url` was expected to be set inside LiteLLMEmbeddingProvider"
-                )
-
-            texts = [result.text for result in results]
-
-            payload = {
-                "query": query,
-                "texts": texts,
-                "model-id": self.config.rerank_model.split("huggingface/")[1],
-            }
-
-            headers = {"Content-Type": "application/json"}
-
-            try:
-                response = requests.post(
-                    self.rerank_url, json=payload, headers=headers
-                )
-                response.raise_for_status()
-                reranked_results = response.json()
-
-                # Copy reranked results into new array
-                scored_results = []
-                for rank_info in reranked_results:
-                    original_result = results[rank_info["index"]]
-                    copied_result = copy(original_result)
-                    # Inject the reranking score into the result object
-                    copied_result.score = rank_info["score"]
-                    scored_results.append(copied_result)
-
-                # Return only the ChunkSearchResult objects, limited to specified count
-                return scored_results[:limit]
-
-            except requests.RequestException as e:
-                logger.error(f"Error during reranking: {str(e)}")
-                # Fall back to returning the original results if reranking fails
-                return results[:limit]
-        else:
+        if self.rerank_client is None:
             return results[:limit]
+        return self.rerank_client.rerank(query, results, limit)
 
     async def arerank(
         self,
@@ -258,45 +220,10 @@ class LiteLLMEmbeddingProvider(EmbeddingProvider):
         Returns:
             List of reranked ChunkSearchResult objects, limited to specified count
         """
-        if self.config.rerank_model is not None:
-            if not self.rerank_url:
-                raise ValueError(
-                    "Error, `rerank_url` was expected to be set inside LiteLLMEmbeddingProvider"
-                )
-
-            texts = [result.text for result in results]
-
-            payload = {
-                "query": query,
-                "texts": texts,
-                "model-id": self.config.rerank_model.split("huggingface/")[1],
-            }
-
-            headers = {"Content-Type": "application/json"}
-
-            try:
-                async with ClientSession() as session:
-                    async with session.post(
-                        self.rerank_url, json=payload, headers=headers
-                    ) as response:
-                        response.raise_for_status()
-                        reranked_results = await response.json()
-
-                        # Copy reranked results into new array
-                        scored_results = []
-                        for rank_info in reranked_results:
-                            original_result = results[rank_info["index"]]
-                            copied_result = copy(original_result)
-                            # Inject the reranking score into the result object
-                            copied_result.score = rank_info["score"]
-                            scored_results.append(copied_result)
-
-                        # Return only the ChunkSearchResult objects, limited to specified count
-                        return scored_results[:limit]
-
-            except (ClientError, Exception) as e:
-                logger.error(f"Error during async reranking: {str(e)}")
-                # Fall back to returning the original results if reranking fails
-                return results[:limit]
-        else:
+        if self.rerank_client is None:
             return results[:limit]
+        return await self.rerank_client.arerank(query, results, limit)
+
+    async def close(self) -> None:
+        if self.rerank_client is not None:
+            await self.rerank_client.close()
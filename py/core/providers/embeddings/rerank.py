@@ -0,0 +1,266 @@
+import asyncio
+import logging
+import re
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import copy
+from typing import Optional
+
+import requests
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from requests.adapters import HTTPAdapter
+
+from core.base import ChunkSearchResult, EmbeddingConfig
+
+logger = logging.getLogger()
+
+
+class RerankClient(ABC):
+    """
+    Base class for reranking clients.
+
+    Candidate lists are split into batches of `rerank_batch_size` that are
+    scored concurrently, at most `rerank_concurrency_limit` at a time.
+    Scores are cached per (query, chunk id) so repeated candidates are only
+    scored once, and when scoring does not finish within `rerank_timeout`
+    the original ordering is returned.
+    """
+
+    def __init__(self, config: EmbeddingConfig):
+        self.config = config
+        self.batch_size = max(1, config.rerank_batch_size)
+        self.timeout = config.rerank_timeout
+        self.semaphore = asyncio.Semaphore(
+            max(1, config.rerank_concurrency_limit)
+        )
+        self._cache: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._cache_size = config.rerank_cache_size
+
+    @abstractmethod
+    async def _ascore(self, query: str, texts: list[str]) -> list[float]:
+        pass
+
+    @abstractmethod
+    def _score(self, query: str, texts: list[str]) -> list[float]:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def _get_cached(self, query: str, result: ChunkSearchResult):
+        key = (query, str(result.id))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        return None
+
+    def _set_cached(
+        self, query: str, result: ChunkSearchResult, score: float
+    ) -> None:
+        if self._cache_size <= 0:
+            return
+        key = (query, str(result.id))
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def _batches(self, indices: list[int]) -> list[list[int]]:
+        return [
+            indices[i : i + self.batch_size]
+            for i in range(0, len(indices), self.batch_size)
+        ]
+
+    @staticmethod
+    def _apply_scores(
+        results: list[ChunkSearchResult],
+        scores: dict[int, float],
+        limit: int,
+    ) -> list[ChunkSearchResult]:
+        scored_results = []
+        for index, score in sorted(
+            scores.items(), key=lambda x: x[1], reverse=True
+        ):
+            copied_result = copy(results[index])
+            # Inject the reranking score into the result object
+            copied_result.score = score
+            scored_results.append(copied_result)
+        return scored_results[:limit]
+
+    async def arerank(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        limit: int = 10,
+    ) -> list[ChunkSearchResult]:
+        scores: dict[int, float] = {}
+        pending: list[int] = []
+        for index, result in enumerate(results):
+            cached = self._get_cached(query, result)
+            if cached is None:
+                pending.append(index)
+            else:
+                scores[index] = cached
+
+        async def _score_batch(batch: list[int]) -> None:
+            async with self.semaphore:
+                batch_scores = await self._ascore(
+                    query, [results[index].text for index in batch]
+                )
+            for index, score in zip(batch, batch_scores):
+                scores[index] = score
+                self._set_cached(query, results[index], score)
+
+        if pending:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        *(
+                            _score_batch(batch)
+                            for batch in self._batches(pending)
+                        )
+                    ),
+                    timeout=self.timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Reranking timed out after {self.timeout} seconds, returning original ordering."
+                )
+                return results[:limit]
+            except Exception as e:
+                logger.error(f"Error during async reranking: {str(e)}")
+                # Fall back to returning the original results if reranking fails
+                return results[:limit]
+
+        return self._apply_scores(results, scores, limit)
+
+    def rerank(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        limit: int = 10,
+    ) -> list[ChunkSearchResult]:
+        scores: dict[int, float] = {}
+        pending: list[int] = []
+        for index, result in enumerate(results):
+            cached = self._get_cached(query, result)
+            if cached is None:
+                pending.append(index)
+            else:
+                scores[index] = cached
+
+        try:
+            for batch in self._batches(pending):
+                batch_scores = self._score(
+                    query, [results[index].text for index in batch]
+                )
+                for index, score in zip(batch, batch_scores):
+                    scores[index] = score
+                    self._set_cached(query, results[index], score)
+        except Exception as e:
+            logger.error(f"Error during reranking: {str(e)}")
+            # Fall back to returning the original results if reranking fails
+            return results[:limit]
+
+        return self._apply_scores(results, scores, limit)
+
+
+class HuggingFaceRerankClient(RerankClient):
+    """
+    Reranks against a HuggingFace text-embeddings-inference `/rerank`
+    endpoint over a persistent, pooled HTTP connection.
+    """
+
+    def __init__(self, config: EmbeddingConfig, rerank_url: str):
+        super().__init__(config)
+        if not config.rerank_model:
+            raise ValueError(
+                "HuggingFaceRerankClient requires `rerank_model` to be set."
+            )
+        self.rerank_url = rerank_url
+        self.model_id = config.rerank_model.split("huggingface/")[1]
+        self._session: Optional[ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sync_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(1, config.rerank_concurrency_limit),
+        )
+        self._sync_session.mount("http://", adapter)
+        self._sync_session.mount("https://", adapter)
+
+    def _get_session(self) -> ClientSession:
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            self._session = ClientSession(
+                connector=TCPConnector(
+                    limit=max(1, self.config.rerank_concurrency_limit),
+                    keepalive_timeout=60,
+                ),
+                timeout=ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+        return self._session
+
+    def _payload(self, query: str, texts: list[str]) -> dict:
+        return {"query": query, "texts": texts, "model-id": self.model_id}
+
+    @staticmethod
+    def _parse_scores(response_json: list[dict], size: int) -> list[float]:
+        scores = [float("-inf")] * size
+        for rank_info in response_json:
+            scores[rank_info["index"]] = rank_info["score"]
+        return scores
+
+    async def _ascore(self, query: str, texts: list[str]) -> list[float]:
+        async with self._get_session().post(
+            self.rerank_url,
+            json=self._payload(query, texts),
+            headers={"Content-Type": "application/json"},
+        ) as response:
+            response.raise_for_status()
+            return self._parse_scores(await response.json(), len(texts))
+
+    def _score(self, query: str, texts: list[str]) -> list[float]:
+        response = self._sync_session.post(
+            self.rerank_url,
+            json=self._payload(query, texts),
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return self._parse_scores(response.json(), len(texts))
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._sync_session.close()
+
+
+class LocalRerankClient(RerankClient):
+    """
+    A deterministic, dependency-free stand-in reranker for tests and local
+    benchmarks, enabled with `rerank_model = "local"`. Candidates are scored
+    by the fraction of query terms they contain.
+    """
+
+    _TOKEN_PATTERN = re.compile(r"\w+")
+
+    def _terms(self, text: str) -> set[str]:
+        return set(self._TOKEN_PATTERN.findall(text.lower()))
+
+    def _score(self, query: str, texts: list[str]) -> list[float]:
+        query_terms = self._terms(query)
+        if not query_terms:
+            return [0.0] * len(texts)
+        return [
+            len(query_terms & self._terms(text)) / len(query_terms)
+            for text in texts
+        ]
+
+    async def _ascore(self, query: str, texts: list[str]) -> list[float]:
+        return self._score(query, texts)
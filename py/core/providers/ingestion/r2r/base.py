@@ -5,7 +5,6 @@ from typing import Any, AsyncGenerator, Optional
 
 from core import parsers
 from core.base import (
-    AsyncParser,
     ChunkingStrategy,
     Document,
     DocumentChunk,
@@ -104,30 +103,21 @@ class R2RIngestionProvider(IngestionProvider):
         self.llm_provider: (
             LiteLLMCompletionProvider | OpenAICompletionProvider
         ) = llm_provider
-        self.parsers: dict[DocumentType, AsyncParser] = {}
         self.text_splitter = self._build_text_splitter()
-        self._initialize_parsers()
+        self._register_parsers()
 
         logger.info(
             f"R2RIngestionProvider initialized with config: {self.config}"
         )
 
-    def _initialize_parsers(self):
+    def _register_parsers(self):
         for doc_type, parser in self.DEFAULT_PARSERS.items():
             # will choose the first parser in the list
             if doc_type not in self.config.excluded_parsers:
-                self.parsers[doc_type] = parser(
-                    config=self.config,
-                    database_provider=self.database_provider,
-                    llm_provider=self.llm_provider,
-                )
+                self.parser_classes[doc_type] = parser
         for doc_type, doc_parser_name in self.config.extra_parsers.items():
-            self.parsers[
-                f"{doc_parser_name}_{str(doc_type)}"
-            ] = R2RIngestionProvider.EXTRA_PARSERS[doc_type][doc_parser_name](
-                config=self.config,
-                database_provider=self.database_provider,
-                llm_provider=self.llm_provider,
+            self.parser_classes[f"{doc_parser_name}_{str(doc_type)}"] = (
+                R2RIngestionProvider.EXTRA_PARSERS[doc_type][doc_parser_name]
             )
 
     def _build_text_splitter(
@@ -218,7 +208,7 @@ class R2RIngestionProvider(IngestionProvider):
         document: Document,
         ingestion_config_override: dict,
     ) -> AsyncGenerator[DocumentChunk, None]:
-        if document.document_type not in self.parsers:
+        if document.document_type not in self.parser_classes:
             raise R2RDocumentProcessingError(
                 document_id=document.id,
                 error_message=f"Parser for {document.document_type} not found in `R2RIngestionProvider`.",
@@ -241,14 +231,14 @@ class R2RIngestionProvider(IngestionProvider):
                     raise ValueError(
                         "Only Zerox PDF parser override is available."
                     )
-                async for text in self.parsers[
+                async for text in self.get_parser(
                     f"zerox_{DocumentType.PDF.value}"
-                ].ingest(file_content, **ingestion_config_override):
+                ).ingest(file_content, **ingestion_config_override):
                     contents += text + "\n"
             else:
-                async for text in self.parsers[document.document_type].ingest(
-                    file_content, **ingestion_config_override
-                ):
+                async for text in self.get_parser(
+                    document.document_type
+                ).ingest(file_content, **ingestion_config_override):
                     contents += text + "\n"
 
             iteration = 0
@@ -272,4 +262,6 @@ class R2RIngestionProvider(IngestionProvider):
             )
 
     def get_parser_for_document_type(self, doc_type: DocumentType) -> Any:
-        return self.parsers.get(doc_type)
+        if doc_type not in self.parser_classes:
+            return None
+        return self.get_parser(doc_type)
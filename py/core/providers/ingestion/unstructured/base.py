@@ -1,6 +1,6 @@
 # TODO - cleanup type issues in this file that relate to `bytes`
 import asyncio
-import base64
+import json
 import logging
 import os
 import time
@@ -9,12 +9,9 @@ from io import BytesIO
 from typing import Any, AsyncGenerator, Optional
 
 import httpx
-from unstructured_client import UnstructuredClient
-from unstructured_client.models import operations, shared
 
 from core import parsers
 from core.base import (
-    AsyncParser,
     ChunkingStrategy,
     Document,
     DocumentChunk,
@@ -61,6 +58,7 @@ class UnstructuredIngestionConfig(IngestionConfig):
     skip_infer_table_types: Optional[list[str]] = None
     split_pdf_concurrency_level: Optional[int] = None
     split_pdf_page: Optional[bool] = None
+    split_pdf_pages_per_request: Optional[int] = None
     starting_page_number: Optional[int] = None
     strategy: Optional[str] = None
     chunking_strategy: Optional[ChunkingStrategy] = None
@@ -105,6 +103,12 @@ class UnstructuredIngestionProvider(IngestionProvider):
         DocumentType.XLSX: {"advanced": parsers.XLSXParserAdvanced},  # type: ignore
     }
 
+    # Large PDFs are partitioned as page ranges of this many pages, with up
+    # to this many ranges of a document in flight at once
+    DEFAULT_PAGES_PER_REQUEST = 10
+    DEFAULT_SPLIT_CONCURRENCY = 5
+    PARTITION_TIMEOUT = 3600
+
     IMAGE_TYPES = {
         DocumentType.GIF,
         DocumentType.HEIC,
@@ -140,13 +144,6 @@ class UnstructuredIngestionProvider(IngestionProvider):
                 "https://api.unstructuredapp.io/general/v0/general",
             )
 
-            self.client = UnstructuredClient(
-                api_key_auth=self.unstructured_api_auth,
-                server_url=self.unstructured_api_url,
-            )
-            self.shared = shared
-            self.operations = operations
-
         else:
             try:
                 self.local_unstructured_url = os.environ[
@@ -157,34 +154,25 @@ class UnstructuredIngestionProvider(IngestionProvider):
                     "UNSTRUCTURED_SERVICE_URL environment variable is not set"
                 ) from e
 
-            self.client = httpx.AsyncClient()
+        self.client = httpx.AsyncClient()
 
-        self.parsers: dict[DocumentType, AsyncParser] = {}
-        self._initialize_parsers()
+        self._register_parsers()
 
-    def _initialize_parsers(self):
+    def _register_parsers(self):
         for doc_type, parsers in self.R2R_FALLBACK_PARSERS.items():
             for parser in parsers:
                 if (
                     doc_type not in self.config.excluded_parsers
-                    and doc_type not in self.parsers
+                    and doc_type not in self.parser_classes
                 ):
                     # will choose the first parser in the list
-                    self.parsers[doc_type] = parser(
-                        config=self.config,
-                        database_provider=self.database_provider,
-                        llm_provider=self.llm_provider,
-                    )
+                    self.parser_classes[doc_type] = parser
         # TODO - Reduce code duplication between Unstructured & R2R
         for doc_type, doc_parser_name in self.config.extra_parsers.items():
-            self.parsers[
-                f"{doc_parser_name}_{str(doc_type)}"
-            ] = UnstructuredIngestionProvider.EXTRA_PARSERS[doc_type][
-                doc_parser_name
-            ](
-                config=self.config,
-                database_provider=self.database_provider,
-                llm_provider=self.llm_provider,
+            self.parser_classes[f"{doc_parser_name}_{str(doc_type)}"] = (
+                UnstructuredIngestionProvider.EXTRA_PARSERS[doc_type][
+                    doc_parser_name
+                ]
             )
 
     async def parse_fallback(
@@ -194,7 +182,7 @@ class UnstructuredIngestionProvider(IngestionProvider):
         parser_name: str,
     ) -> AsyncGenerator[FallbackElement, None]:
         context = ""
-        async for text in self.parsers[parser_name].ingest(file_content, **ingestion_config):  # type: ignore
+        async for text in self.get_parser(parser_name).ingest(file_content, **ingestion_config):  # type: ignore
             context += text + "\n\n"
         logging.info(f"Fallback ingestion with config = {ingestion_config}")
 
@@ -214,6 +202,140 @@ class UnstructuredIngestionProvider(IngestionProvider):
             )
             await asyncio.sleep(0)
 
+    async def _partition(
+        self,
+        file_content: bytes,
+        filename: str,
+        is_pdf: bool,
+        ingestion_config: dict,
+    ) -> list[dict]:
+        """
+        Partition a file with unstructured, splitting large PDFs into page
+        ranges that are partitioned concurrently and merged back in order.
+        """
+        split_pdf_page = ingestion_config.pop("split_pdf_page", None)
+        concurrency = max(
+            1,
+            ingestion_config.pop("split_pdf_concurrency_level", None)
+            or self.DEFAULT_SPLIT_CONCURRENCY,
+        )
+        pages_per_request = max(
+            1,
+            ingestion_config.pop("split_pdf_pages_per_request", None)
+            or self.DEFAULT_PAGES_PER_REQUEST,
+        )
+        starting_page_number = (
+            ingestion_config.get("starting_page_number") or 1
+        )
+
+        parts = [(file_content, 0)]
+        if is_pdf and split_pdf_page is not False:
+            parts = await asyncio.to_thread(
+                self._split_pdf, file_content, pages_per_request
+            )
+            if len(parts) > 1:
+                logger.info(
+                    f"Partitioning {filename} as {len(parts)} page ranges of up to {pages_per_request} pages."
+                )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def partition_part(content: bytes, page_offset: int):
+            part_config = ingestion_config
+            if len(parts) > 1:
+                part_config = {
+                    **ingestion_config,
+                    "starting_page_number": starting_page_number + page_offset,
+                }
+            async with semaphore:
+                if self.config.provider == "unstructured_api":
+                    return await self._partition_api(
+                        content, filename, part_config
+                    )
+                return await self._partition_local(
+                    content, filename, part_config
+                )
+
+        results = await asyncio.gather(
+            *(partition_part(content, offset) for content, offset in parts)
+        )
+        return [element for result in results for element in result]
+
+    @staticmethod
+    def _split_pdf(
+        file_content: bytes, pages_per_request: int
+    ) -> list[tuple[bytes, int]]:
+        """Split a PDF into documents of at most `pages_per_request` pages."""
+        try:
+            from pypdf import PdfReader, PdfWriter
+
+            reader = PdfReader(BytesIO(file_content))
+            num_pages = len(reader.pages)
+            if num_pages <= pages_per_request:
+                return [(file_content, 0)]
+
+            parts = []
+            for start in range(0, num_pages, pages_per_request):
+                writer = PdfWriter()
+                for page_num in range(
+                    start, min(start + pages_per_request, num_pages)
+                ):
+                    writer.add_page(reader.pages[page_num])
+                buffer = BytesIO()
+                writer.write(buffer)
+                parts.append((buffer.getvalue(), start))
+            return parts
+        except Exception as e:
+            logger.warning(
+                f"Could not split PDF into page ranges, partitioning it whole: {e}"
+            )
+            return [(file_content, 0)]
+
+    async def _partition_api(
+        self, file_content: bytes, filename: str, ingestion_config: dict
+    ) -> list[dict]:
+        logger.info(f"Sending a request to {self.unstructured_api_url}")
+        data: dict[str, Any] = {}
+        for key, value in ingestion_config.items():
+            if isinstance(value, bool):
+                data[key] = str(value).lower()
+            elif isinstance(value, dict):
+                data[key] = json.dumps(value)
+            else:
+                data[key] = value
+
+        response = await self.client.post(
+            self.unstructured_api_url,
+            headers={"unstructured-api-key": self.unstructured_api_auth},
+            files={"files": (filename, file_content)},
+            data=data,
+            timeout=self.PARTITION_TIMEOUT,
+        )
+        if response.status_code != 200:
+            logger.error(f"Error partitioning file: {response.text}")
+            raise ValueError(f"Error partitioning file: {response.text}")
+        return response.json()
+
+    async def _partition_local(
+        self, file_content: bytes, filename: str, ingestion_config: dict
+    ) -> list[dict]:
+        logger.info(
+            f"Sending a request to {self.local_unstructured_url}/partition_file"
+        )
+        response = await self.client.post(
+            f"{self.local_unstructured_url}/partition_file",
+            files={"file": (filename, file_content)},
+            data={
+                "ingestion_config": json.dumps(ingestion_config),
+                "filename": filename,
+            },
+            timeout=self.PARTITION_TIMEOUT,
+        )
+        if response.status_code != 200:
+            logger.error(f"Error partitioning file: {response.text}")
+            raise ValueError(f"Error partitioning file: {response.text}")
+        return response.json().get("elements", [])
+
     async def parse(
         self,
         file_content: bytes,
@@ -235,7 +357,7 @@ class UnstructuredIngestionProvider(IngestionProvider):
         parser_overrides = ingestion_config_override.get(
             "parser_overrides", {}
         )
-        elements = []
+        elements: list[FallbackElement | dict] = []
 
         # TODO - Cleanup this approach to be less hardcoded
         # TODO - Remove code duplication between Unstructured & R2R
@@ -243,79 +365,39 @@ class UnstructuredIngestionProvider(IngestionProvider):
             logger.info(
                 f"Using parser_override for {document.document_type} with input value {parser_overrides[document.document_type.value]}"
             )
-            async for element in self.parse_fallback(
+            async for fallback_element in self.parse_fallback(
                 file_content,
                 ingestion_config=ingestion_config,
                 parser_name=f"zerox_{DocumentType.PDF.value}",
             ):
-                elements.append(element)
+                elements.append(fallback_element)
 
         elif document.document_type in self.R2R_FALLBACK_PARSERS.keys():
             logger.info(
                 f"Parsing {document.document_type}: {document.id} with fallback parser"
             )
-            async for element in self.parse_fallback(
+            async for fallback_element in self.parse_fallback(
                 file_content,
                 ingestion_config=ingestion_config,
                 parser_name=document.document_type,
             ):
-                elements.append(element)
+                elements.append(fallback_element)
         else:
             logger.info(
                 f"Parsing {document.document_type}: {document.id} with unstructured"
             )
-            if isinstance(file_content, bytes):
-                file_content = BytesIO(file_content)  # type: ignore
+            if not isinstance(file_content, bytes):
+                file_content = file_content.read()  # type: ignore
 
             # TODO - Include check on excluded parsers here.
-            if self.config.provider == "unstructured_api":
-                logger.info(f"Using API to parse document {document.id}")
-                files = self.shared.Files(
-                    content=file_content.read(),  # type: ignore
-                    file_name=document.metadata.get("title", "unknown_file"),
-                )
-
-                ingestion_config.pop("app", None)
-                ingestion_config.pop("extra_parsers", None)
-
-                req = self.operations.PartitionRequest(
-                    self.shared.PartitionParameters(
-                        files=files,
-                        **ingestion_config,
-                    )
-                )
-                elements = self.client.general.partition(req)  # type: ignore
-                elements = list(elements.elements)  # type: ignore
-
-            else:
-                logger.info(
-                    f"Using local unstructured fastapi server to parse document {document.id}"
-                )
-                # Base64 encode the file content
-                encoded_content = base64.b64encode(file_content.read()).decode(  # type: ignore
-                    "utf-8"
-                )
-
-                logger.info(
-                    f"Sending a request to {self.local_unstructured_url}/partition"
-                )
-
-                response = await self.client.post(
-                    f"{self.local_unstructured_url}/partition",
-                    json={
-                        "file_content": encoded_content,  # Use encoded string
-                        "ingestion_config": ingestion_config,
-                        "filename": document.metadata.get("title", None),
-                    },
-                    timeout=3600,  # Adjust timeout as needed
-                )
-
-                if response.status_code != 200:
-                    logger.error(f"Error partitioning file: {response.text}")
-                    raise ValueError(
-                        f"Error partitioning file: {response.text}"
-                    )
-                elements = response.json().get("elements", [])
+            ingestion_config.pop("app", None)
+            ingestion_config.pop("extra_parsers", None)
+            elements = await self._partition(
+                file_content,
+                filename=document.metadata.get("title", "unknown_file"),
+                is_pdf=document.document_type == DocumentType.PDF,
+                ingestion_config=ingestion_config,
+            )
 
         iteration = 0  # if there are no chunks
         for iteration, element in enumerate(elements):
@@ -1,16 +1,73 @@
-from typing import Any
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from uuid import UUID
 
 from core.base import OrchestrationConfig, OrchestrationProvider, Workflow
 
+if TYPE_CHECKING:
+    from core.database import PostgresDatabaseProvider
+
+logger = logging.getLogger()
+
 
 class SimpleOrchestrationProvider(OrchestrationProvider):
-    def __init__(self, config: OrchestrationConfig):
+    """
+    Runs workflows in the R2R process itself.
+
+    By default a workflow runs inside the request that starts it. With
+    `job_queue` enabled, `run_workflow` instead stores the job in Postgres
+    and returns at once, and background workers run queued jobs under the
+    configured per-workflow and per-user concurrency limits, retrying
+    failures and picking up jobs left behind by a crashed or restarted
+    worker.
+    """
+
+    # How often jobs abandoned on their last attempt are failed and finished
+    # jobs are cleaned up
+    SWEEP_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        config: OrchestrationConfig,
+        database_provider: Optional["PostgresDatabaseProvider"] = None,
+    ):
         super().__init__(config)
         self.config = config
+        self.database_provider = database_provider
         self.messages: dict[str, str] = {}
+        self.ingestion_workflows: dict[str, Callable] = {}
+        self.kg_workflows: dict[str, Callable] = {}
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._worker_tasks: list[asyncio.Task] = []
+        self._job_available = asyncio.Event()
 
     async def start_worker(self):
-        pass
+        if not self.config.job_queue or self._worker_tasks:
+            return
+        if self.database_provider is None:
+            raise ValueError(
+                "The simple orchestration job queue requires a database provider."
+            )
+
+        for i in range(max(1, self.config.job_queue_workers)):
+            self._worker_tasks.append(
+                asyncio.create_task(self._work(f"{self.worker_id}-{i}"))
+            )
+        self._worker_tasks.append(asyncio.create_task(self._sweep()))
+        logger.info(
+            f"Started {self.config.job_queue_workers} job queue workers."
+        )
+
+    async def stop_worker(self):
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks.clear()
 
     def get_worker(self, name: str, max_runs: int) -> Any:
         pass
@@ -45,13 +102,132 @@ class SimpleOrchestrationProvider(OrchestrationProvider):
     async def run_workflow(
         self, workflow_name: str, parameters: dict, options: dict
     ) -> dict[str, str]:
-        if workflow_name in self.ingestion_workflows:
-            await self.ingestion_workflows[workflow_name](
-                parameters.get("request")
-            )
+        workflow = self._get_workflow(workflow_name)
+        if not self.config.job_queue:
+            await workflow(parameters.get("request"))
             return {"message": self.messages[workflow_name]}
+
+        job_id = await self.database_provider.jobs_handler.enqueue(  # type: ignore
+            workflow_name,
+            parameters,
+            user_id=self._get_user_id(parameters),
+            max_attempts=self.config.job_max_attempts,
+        )
+        self._job_available.set()
+        return {
+            "task_id": str(job_id),
+            "message": self.messages[workflow_name],
+        }
+
+    def _get_workflow(self, workflow_name: str) -> Callable:
+        if workflow_name in self.ingestion_workflows:
+            return self.ingestion_workflows[workflow_name]
         elif workflow_name in self.kg_workflows:
-            await self.kg_workflows[workflow_name](parameters.get("request"))
-            return {"message": self.messages[workflow_name]}
+            return self.kg_workflows[workflow_name]
         else:
             raise ValueError(f"Workflow '{workflow_name}' not found.")
+
+    @staticmethod
+    def _get_user_id(parameters: dict) -> Optional[UUID]:
+        user = (parameters.get("request") or {}).get("user")
+        try:
+            if isinstance(user, str):
+                user = json.loads(user)
+            return UUID(str(user["id"])) if user else None
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _workflow_limits(self) -> dict[str, int]:
+        limits = {
+            name: self.config.ingestion_concurrency_limit
+            for name in self.ingestion_workflows
+        }
+        limits.update(
+            {
+                name: self.config.kg_concurrency_limit
+                for name in self.kg_workflows
+            }
+        )
+        limits.update(self.config.job_concurrency_limits)
+        return limits
+
+    async def _work(self, worker_id: str) -> None:
+        jobs_handler = self.database_provider.jobs_handler  # type: ignore
+        while True:
+            try:
+                job = await jobs_handler.claim(
+                    worker_id,
+                    visibility_timeout=self.config.job_visibility_timeout,
+                    workflow_limits=self._workflow_limits(),
+                    user_limit=self.config.job_user_concurrency_limit,
+                )
+            except Exception as e:
+                logger.error(f"Failed to claim a job: {e}")
+                job = None
+
+            if job is None:
+                self._job_available.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._job_available.wait(),
+                        timeout=self.config.job_poll_interval,
+                    )
+                continue
+
+            try:
+                await self._run_job(job, worker_id)
+            except Exception as e:
+                # The job keeps its lease and is retried once that runs out
+                logger.error(f"Failed to record the outcome of a job: {e}")
+
+    async def _run_job(self, job: dict, worker_id: str) -> None:
+        jobs_handler = self.database_provider.jobs_handler  # type: ignore
+        job_id = job["id"]
+        logger.info(
+            f"Running job {job_id} ({job['workflow']}), attempt {job['attempts']} of {job['max_attempts']}."
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, worker_id))
+        try:
+            workflow = self._get_workflow(job["workflow"])
+            await workflow(job["payload"].get("request"))
+        except asyncio.CancelledError:
+            # Shutting down, let the next worker start this job over
+            await asyncio.shield(jobs_handler.release(job_id, worker_id))
+            raise
+        except Exception as e:
+            retry_delay = self.config.job_retry_backoff * 2 ** (
+                job["attempts"] - 1
+            )
+            logger.error(
+                f"Job {job_id} ({job['workflow']}) failed on attempt {job['attempts']}: {e}"
+            )
+            await jobs_handler.fail(job_id, worker_id, str(e), retry_delay)
+        else:
+            await jobs_handler.complete(job_id, worker_id)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job_id: UUID, worker_id: str) -> None:
+        jobs_handler = self.database_provider.jobs_handler  # type: ignore
+        interval = self.config.job_visibility_timeout / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await jobs_handler.extend_lease(
+                    job_id, worker_id, self.config.job_visibility_timeout
+                ):
+                    logger.warning(f"Lost the lease on job {job_id}.")
+                    return
+            except Exception as e:
+                logger.error(
+                    f"Failed to extend the lease on job {job_id}: {e}"
+                )
+
+    async def _sweep(self) -> None:
+        jobs_handler = self.database_provider.jobs_handler  # type: ignore
+        while True:
+            try:
+                await jobs_handler.expire_abandoned()
+            except Exception as e:
+                logger.error(f"Failed to clean up the job queue: {e}")
+            await asyncio.sleep(self.SWEEP_INTERVAL)
@@ -18,6 +18,8 @@ from shared.utils.splitter.text import (
     TextSplitter,
 )
 
+from .log_tailer import LogTailer
+
 __all__ = [
     "format_search_results_for_stream",
     "format_search_results_for_llm",
@@ -35,4 +37,6 @@ __all__ = [
     # Text splitter
     "RecursiveCharacterTextSplitter",
     "TextSplitter",
+    # Logs
+    "LogTailer",
 ]
@@ -0,0 +1,179 @@
+import asyncio
+import contextlib
+import ctypes
+import ctypes.util
+import logging
+import os
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+import aiofiles
+
+logger = logging.getLogger()
+
+# inotify(7) flags, see <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+
+class _InotifyWatch:
+    """Wakes an asyncio event whenever a directory changes (Linux only)."""
+
+    def __init__(self, directory: Path, changed: asyncio.Event):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, "inotify_add_watch failed")
+        self.changed = changed
+        self.loop = asyncio.get_running_loop()
+        self.loop.add_reader(self.fd, self._on_readable)
+
+    def _on_readable(self) -> None:
+        # The events themselves are not needed, only the wake-up.
+        with contextlib.suppress(BlockingIOError):
+            while os.read(self.fd, 4096):
+                pass
+        self.changed.set()
+
+    def close(self) -> None:
+        self.loop.remove_reader(self.fd)
+        os.close(self.fd)
+
+
+class LogTailer:
+    """
+    Follows a log file and fans new lines out to every subscriber.
+
+    A single reader per process tails the file, waking on inotify events
+    where available and falling back to polling the file size otherwise.
+    Each subscriber gets a bounded queue; when a client falls behind, its
+    oldest undelivered batch is dropped rather than stalling the others.
+    New subscribers receive the most recent `backlog_lines` lines first.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        backlog_lines: int = 1_000,
+        backlog_bytes: int = 256 * 1024,
+        queue_size: int = 256,
+        poll_interval: float = 0.5,
+    ):
+        self.path = path
+        self.backlog: deque[str] = deque(maxlen=backlog_lines)
+        self.backlog_bytes = backlog_bytes
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.subscribers: set[asyncio.Queue[str]] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._position: Optional[int] = None
+        self._inode: Optional[int] = None
+        self._partial = ""
+
+    def subscribe(self) -> tuple[str, asyncio.Queue[str]]:
+        """Return the recent backlog and a queue of subsequent log text."""
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return "".join(self.backlog), queue
+
+    def unsubscribe(self, queue: asyncio.Queue[str]) -> None:
+        self.subscribers.discard(queue)
+        if not self.subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            # Nobody saw what was written since, so the next subscriber
+            # starts again from the backlog near the end of the file.
+            self.backlog.clear()
+            self._position = None
+            self._inode = None
+            self._partial = ""
+
+    def _publish(self, text: str) -> None:
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(text)
+
+    async def _read_available(self) -> None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return
+
+        if self._position is None:
+            # First read: start close enough to the end to fill the backlog.
+            # It starts one byte early so that when the cut falls on a line
+            # boundary, the line skipped below is empty, not a whole one.
+            self._position = max(0, stat.st_size - self.backlog_bytes - 1)
+            skip_partial_line = self._position > 0
+        elif stat.st_ino != self._inode or stat.st_size < self._position:
+            # The file was rotated or truncated, start over from its top.
+            self._position = 0
+            self._partial = ""
+            skip_partial_line = False
+        else:
+            skip_partial_line = False
+        self._inode = stat.st_ino
+
+        if stat.st_size == self._position:
+            return
+
+        async with aiofiles.open(self.path, mode="rb") as f:
+            await f.seek(self._position)
+            data = await f.read(stat.st_size - self._position)
+        self._position += len(data)
+
+        text = self._partial + data.decode("utf-8", errors="replace")
+        lines = text.split("\n")
+        self._partial = lines.pop()
+        if skip_partial_line and lines:
+            lines.pop(0)
+        if not lines:
+            return
+
+        lines = [f"{line}\n" for line in lines]
+        self.backlog.extend(lines)
+        self._publish("".join(lines))
+
+    async def _run(self) -> None:
+        changed = asyncio.Event()
+        watch = None
+        if sys.platform.startswith("linux"):
+            try:
+                watch = _InotifyWatch(self.path.parent, changed)
+            except (OSError, AttributeError, TypeError) as e:
+                logger.debug(f"inotify unavailable, polling logs: {e}")
+
+        try:
+            while True:
+                changed.clear()
+                try:
+                    await self._read_available()
+                except Exception as e:
+                    # Logging writes to the file being watched, so back off
+                    # instead of waking straight up again.
+                    logger.error(f"Error reading logs: {str(e)}")
+                    await asyncio.sleep(self.poll_interval)
+
+                if watch is None:
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                # Still re-check now and then in case an event was missed.
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(changed.wait(), timeout=5)
+        finally:
+            if watch is not None:
+                watch.close()
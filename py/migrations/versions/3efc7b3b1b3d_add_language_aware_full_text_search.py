@@ -0,0 +1,62 @@
+"""Add language-aware, indexed full-text search to chunks
+
+Revision ID: 3efc7b3b1b3d
+Revises: c45a9cf6a8a4
+Create Date: 2026-10-18 21:45:13.000000
+
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3efc7b3b1b3d"
+down_revision: Union[str, None] = "c45a9cf6a8a4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+project_name = os.getenv("R2R_PROJECT_NAME")
+if not project_name:
+    raise ValueError(
+        "Environment variable `R2R_PROJECT_NAME` must be provided migrate, it should be set equal to the value of `project_name` in your `r2r.toml`."
+    )
+
+
+def upgrade() -> None:
+    # The generated `fts` column is rebuilt from the per-chunk language, and
+    # the expression index that full-text queries could never use is replaced
+    # with an index on the column itself.
+    op.execute(
+        f"""
+        ALTER TABLE {project_name}.chunks
+            ADD COLUMN IF NOT EXISTS fts_language regconfig NOT NULL DEFAULT 'english'::regconfig;
+
+        ALTER TABLE {project_name}.chunks DROP COLUMN IF EXISTS fts;
+        ALTER TABLE {project_name}.chunks
+            ADD COLUMN fts tsvector GENERATED ALWAYS AS (to_tsvector(fts_language, text)) STORED;
+
+        DROP INDEX IF EXISTS {project_name}.idx_vectors_text;
+        CREATE INDEX IF NOT EXISTS idx_vectors_fts ON {project_name}.chunks USING GIN (fts);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"""
+        DROP INDEX IF EXISTS {project_name}.idx_vectors_fts;
+        DROP INDEX IF EXISTS {project_name}.idx_vectors_fts_rum;
+
+        ALTER TABLE {project_name}.chunks DROP COLUMN IF EXISTS fts;
+        ALTER TABLE {project_name}.chunks
+            ADD COLUMN fts tsvector GENERATED ALWAYS AS (to_tsvector('english', text)) STORED;
+        ALTER TABLE {project_name}.chunks DROP COLUMN IF EXISTS fts_language;
+
+        CREATE INDEX IF NOT EXISTS idx_vectors_text ON {project_name}.chunks USING GIN (to_tsvector('english', text));
+
+        DROP TABLE IF EXISTS {project_name}.chunks_fts_terms;
+        DROP TABLE IF EXISTS {project_name}.chunks_fts_corpus;
+        """
+    )
@@ -0,0 +1,66 @@
+"""Precompute per-user document statistics
+
+Revision ID: 5b7e0f3c2a91
+Revises: 8f2a6c1d9e4b
+Create Date: 2024-12-17 15:06:52.903114
+
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7e0f3c2a91"
+down_revision: Union[str, None] = "8f2a6c1d9e4b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+project_name = os.getenv("R2R_PROJECT_NAME")
+if not project_name:
+    raise ValueError(
+        "Environment variable `R2R_PROJECT_NAME` must be provided migrate, it should be set equal to the value of `project_name` in your `r2r.toml`."
+    )
+
+
+def upgrade() -> None:
+    # Triggers created at startup keep these columns current from here on.
+    op.execute(
+        f"""
+        ALTER TABLE {project_name}.users
+            ADD COLUMN IF NOT EXISTS document_count BIGINT NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS total_size_in_bytes BIGINT NOT NULL DEFAULT 0;
+
+        UPDATE {project_name}.users u
+        SET document_count = s.document_count,
+            total_size_in_bytes = s.total_size_in_bytes
+        FROM (
+            SELECT owner_id, COUNT(*) AS document_count,
+                COALESCE(SUM(size_in_bytes), 0) AS total_size_in_bytes
+            FROM {project_name}.documents
+            GROUP BY owner_id
+        ) s
+        WHERE u.id = s.owner_id;
+
+        CREATE INDEX IF NOT EXISTS idx_documents_owner_id_{project_name}
+        ON {project_name}.documents (owner_id);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"""
+        DROP TRIGGER IF EXISTS user_document_stats_insert ON {project_name}.documents;
+        DROP TRIGGER IF EXISTS user_document_stats_update ON {project_name}.documents;
+        DROP TRIGGER IF EXISTS user_document_stats_delete ON {project_name}.documents;
+        DROP FUNCTION IF EXISTS {project_name}.update_user_document_stats();
+
+        DROP INDEX IF EXISTS {project_name}.idx_documents_owner_id_{project_name};
+
+        ALTER TABLE {project_name}.users
+            DROP COLUMN IF EXISTS document_count,
+            DROP COLUMN IF EXISTS total_size_in_bytes;
+        """
+    )
@@ -0,0 +1,63 @@
+"""Maintain collection membership counts and index user membership
+
+Revision ID: 8f2a6c1d9e4b
+Revises: 3efc7b3b1b3d
+Create Date: 2024-12-17 09:41:07.518233
+
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8f2a6c1d9e4b"
+down_revision: Union[str, None] = "3efc7b3b1b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+project_name = os.getenv("R2R_PROJECT_NAME")
+if not project_name:
+    raise ValueError(
+        "Environment variable `R2R_PROJECT_NAME` must be provided migrate, it should be set equal to the value of `project_name` in your `r2r.toml`."
+    )
+
+
+def upgrade() -> None:
+    # The counters are kept current by triggers created at startup. Counts
+    # written before then only tracked additions, so they are recomputed once.
+    op.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_users_collection_ids
+        ON {project_name}.users USING GIN (collection_ids);
+
+        UPDATE {project_name}.collections c
+        SET user_count = (
+                SELECT COUNT(*) FROM {project_name}.users u
+                WHERE u.collection_ids @> ARRAY[c.id]
+            ),
+            document_count = (
+                SELECT COUNT(*) FROM {project_name}.documents d
+                WHERE d.collection_ids @> ARRAY[c.id]
+            );
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"""
+        DROP TRIGGER IF EXISTS collection_user_count_insert ON {project_name}.users;
+        DROP TRIGGER IF EXISTS collection_user_count_update ON {project_name}.users;
+        DROP TRIGGER IF EXISTS collection_user_count_delete ON {project_name}.users;
+        DROP FUNCTION IF EXISTS {project_name}.update_collection_user_count();
+
+        DROP TRIGGER IF EXISTS collection_document_count_insert ON {project_name}.documents;
+        DROP TRIGGER IF EXISTS collection_document_count_update ON {project_name}.documents;
+        DROP TRIGGER IF EXISTS collection_document_count_delete ON {project_name}.documents;
+        DROP FUNCTION IF EXISTS {project_name}.update_collection_document_count();
+
+        DROP INDEX IF EXISTS {project_name}.idx_users_collection_ids;
+        """
+    )
@@ -0,0 +1,49 @@
+"""Add rolling summaries and an ordered message index to conversations
+
+Revision ID: 9c3d5e7a1f20
+Revises: 5b7e0f3c2a91
+Create Date: 2024-12-19 09:41:07.552318
+
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9c3d5e7a1f20"
+down_revision: Union[str, None] = "5b7e0f3c2a91"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+project_name = os.getenv("R2R_PROJECT_NAME")
+if not project_name:
+    raise ValueError(
+        "Environment variable `R2R_PROJECT_NAME` must be provided migrate, it should be set equal to the value of `project_name` in your `r2r.toml`."
+    )
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        ALTER TABLE {project_name}.conversations
+            ADD COLUMN IF NOT EXISTS summary TEXT,
+            ADD COLUMN IF NOT EXISTS summary_through UUID;
+
+        CREATE INDEX IF NOT EXISTS idx_messages_conversation_created_at
+            ON {project_name}.messages (conversation_id, created_at, id);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"""
+        DROP INDEX IF EXISTS {project_name}.idx_messages_conversation_created_at;
+
+        ALTER TABLE {project_name}.conversations
+            DROP COLUMN IF EXISTS summary,
+            DROP COLUMN IF EXISTS summary_through;
+        """
+    )
@@ -0,0 +1,43 @@
+"""Add a GIN index on chunk metadata for containment filters
+
+Revision ID: d4e8a2b6c1f3
+Revises: 9c3d5e7a1f20
+Create Date: 2024-12-19 15:02:44.318904
+
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e8a2b6c1f3"
+down_revision: Union[str, None] = "9c3d5e7a1f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+project_name = os.getenv("R2R_PROJECT_NAME")
+if not project_name:
+    raise ValueError(
+        "Environment variable `R2R_PROJECT_NAME` must be provided migrate, it should be set equal to the value of `project_name` in your `r2r.toml`."
+    )
+
+
+def upgrade() -> None:
+    # Expression indexes for keys listed in `metadata_indexes` are created on
+    # startup, since they depend on the configuration.
+    op.execute(
+        f"""
+        CREATE INDEX IF NOT EXISTS idx_vectors_metadata
+            ON {project_name}.chunks USING GIN (metadata jsonb_path_ops);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"""
+        DROP INDEX IF EXISTS {project_name}.idx_vectors_metadata;
+        """
+    )
@@ -0,0 +1,41 @@
+"""Add a content hash column to chunks
+
+Revision ID: e7b1c9d3f5a2
+Revises: d4e8a2b6c1f3
+Create Date: 2024-12-20 09:41:12.530187
+
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b1c9d3f5a2"
+down_revision: Union[str, None] = "d4e8a2b6c1f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+project_name = os.getenv("R2R_PROJECT_NAME")
+if not project_name:
+    raise ValueError(
+        "Environment variable `R2R_PROJECT_NAME` must be provided migrate, it should be set equal to the value of `project_name` in your `r2r.toml`."
+    )
+
+
+def upgrade() -> None:
+    # Updated files are re-ingested by matching chunk text against this hash
+    op.execute(
+        f"""
+        ALTER TABLE {project_name}.chunks
+        ADD COLUMN IF NOT EXISTS content_hash TEXT
+        GENERATED ALWAYS AS (md5(text)) STORED;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"ALTER TABLE {project_name}.chunks DROP COLUMN IF EXISTS content_hash;"
+    )
@@ -0,0 +1,46 @@
+"""Add a content hash column to documents
+
+Revision ID: f2a6d8c4b0e1
+Revises: e7b1c9d3f5a2
+Create Date: 2024-12-20 16:27:05.114902
+
+"""
+
+import os
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a6d8c4b0e1"
+down_revision: Union[str, None] = "e7b1c9d3f5a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+project_name = os.getenv("R2R_PROJECT_NAME")
+if not project_name:
+    raise ValueError(
+        "Environment variable `R2R_PROJECT_NAME` must be provided migrate, it should be set equal to the value of `project_name` in your `r2r.toml`."
+    )
+
+
+def upgrade() -> None:
+    op.execute(
+        f"""
+        ALTER TABLE {project_name}.documents
+        ADD COLUMN IF NOT EXISTS content_hash TEXT NULL;
+
+        CREATE INDEX IF NOT EXISTS idx_documents_content_hash_{project_name}
+        ON {project_name}.documents (content_hash)
+        WHERE content_hash IS NOT NULL;
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        f"""
+        DROP INDEX IF EXISTS {project_name}.idx_documents_content_hash_{project_name};
+        ALTER TABLE {project_name}.documents DROP COLUMN IF EXISTS content_hash;
+        """
+    )
@@ -1,6 +1,8 @@
+import asyncio
 import json
+from contextlib import asynccontextmanager
 from io import BytesIO
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, AsyncIterator, Optional
 
 import httpx
 
@@ -40,17 +42,44 @@ class R2RAsyncClient(
 ):
     """
     Asynchronous client for interacting with the R2R API.
+
+    Requests that fail to connect, or that the server turns away with a
+    429 or 503, are retried up to `max_retries` times with exponential
+    backoff, honouring any `Retry-After` header. A 502 or 504 may come
+    after the request was processed, so only idempotent requests are
+    retried for those. Connections
+    are pooled and reused across requests; pass `http2=True` to multiplex
+    requests over HTTP/2, which needs the `h2` package
+    (`pip install httpx[http2]`).
     """
 
+    RETRY_STATUS_CODES = {429, 502, 503, 504}
+    # Sent before the server processed the request, so always safe to retry
+    REJECTED_STATUS_CODES = {429, 503}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
     def __init__(
         self,
         base_url: str = "http://localhost:7272",
         prefix: str = "/v2",
         custom_client=None,
         timeout: float = 300.0,
+        http2: bool = False,
+        max_connections: int = 100,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
     ):
         super().__init__(base_url, prefix, timeout)
-        self.client = custom_client or httpx.AsyncClient(timeout=timeout)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.client = custom_client or httpx.AsyncClient(
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
         self.chunks = ChunksSDK(self)
         self.collections = CollectionsSDK(self)
         self.conversations = ConversationsSDK(self)
@@ -69,7 +98,7 @@ class R2RAsyncClient(
         request_args = self._prepare_request_args(endpoint, **kwargs)
 
         try:
-            response = await self.client.request(method, url, **request_args)
+            response = await self._send(method, url, request_args)
             await self._handle_response(response)
             # return response.json() if response.content else None
             # In async_client.py, inside _make_request:
@@ -88,18 +117,110 @@ class R2RAsyncClient(
     async def _make_streaming_request(
         self, method: str, endpoint: str, version: str = "v2", **kwargs
     ) -> AsyncGenerator[Any, None]:
+        async with self._stream_request(
+            method, endpoint, version, **kwargs
+        ) as response:
+            async for line in response.aiter_lines():
+                if line.strip():  # Ignore empty lines
+                    try:
+                        yield json.loads(line)
+                    except:  #  json.JSONDecodeError:
+                        yield line
+
+    @asynccontextmanager
+    async def _stream_request(
+        self, method: str, endpoint: str, version: str = "v2", **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a request and yield the response without reading its body."""
         url = self._get_full_url(endpoint, version)
         request_args = self._prepare_request_args(endpoint, **kwargs)
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream(method, url, **request_args) as response:
-                await self._handle_response(response)
-                async for line in response.aiter_lines():
-                    if line.strip():  # Ignore empty lines
-                        try:
-                            yield json.loads(line)
-                        except:  #  json.JSONDecodeError:
-                            yield line
+        try:
+            response = await self._send(method, url, request_args, stream=True)
+        except httpx.RequestError as e:
+            raise R2RException(
+                status_code=500,
+                message=f"Request failed: {str(e)}",
+            ) from e
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+            await self._handle_response(response)
+            yield response
+        finally:
+            await response.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        request_args: dict,
+        stream: bool = False,
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            self._rewind_files(request_args)
+            try:
+                request = self.client.build_request(
+                    method, url, **request_args
+                )
+                response = await self.client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries or not self._can_retry(
+                    method, e
+                ):
+                    raise
+                delay = self.retry_backoff * 2**attempt
+            else:
+                if (
+                    not self._can_retry_status(method, response.status_code)
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                delay = self._get_retry_after(response) or (
+                    self.retry_backoff * 2**attempt
+                )
+                await response.aclose()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _can_retry(self, method: str, error: httpx.TransportError) -> bool:
+        # The server never saw a request that failed to connect, so it is
+        # safe to send again; otherwise only when repeating it is harmless.
+        if isinstance(
+            error,
+            (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout),
+        ):
+            return True
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def _can_retry_status(self, method: str, status_code: int) -> bool:
+        if status_code in self.REJECTED_STATUS_CODES:
+            return True
+        return (
+            status_code in self.RETRY_STATUS_CODES
+            and method.upper() in self.IDEMPOTENT_METHODS
+        )
+
+    @staticmethod
+    def _get_retry_after(response: httpx.Response) -> Optional[float]:
+        try:
+            return float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _rewind_files(request_args: dict) -> None:
+        # A retried upload has to send its files from the start again
+        files = request_args.get("files") or []
+        if isinstance(files, dict):
+            files = files.items()
+        for _, file_value in files:
+            file_obj = (
+                file_value[1] if isinstance(file_value, tuple) else file_value
+            )
+            if hasattr(file_obj, "seek"):
+                file_obj.seek(0)
 
     async def _handle_response(self, response):
         if response.status_code >= 400:
@@ -2,7 +2,7 @@ import asyncio
 import contextlib
 import functools
 import inspect
-from typing import Any, Callable, Coroutine, TypeVar
+from typing import Any, AsyncGenerator, Callable, Coroutine, Generator, TypeVar
 
 from .async_client import R2RAsyncClient
 from .v2 import (
@@ -99,6 +99,8 @@ class R2RClient(R2RAsyncClient):
                 if inspect.iscoroutinefunction(attr):
                     wrapped = self._make_sync_method(attr)
                     setattr(sdk_obj, name, wrapped)
+                elif inspect.isasyncgenfunction(attr):
+                    setattr(sdk_obj, name, self._make_sync_generator(attr))
 
     # def _make_sync_method(self, async_method):
     def _make_sync_method(
@@ -111,6 +113,27 @@ class R2RClient(R2RAsyncClient):
 
         return wrapped
 
+    def _make_sync_generator(
+        self, async_gen_method: Callable[..., AsyncGenerator[T, None]]
+    ) -> Callable[..., Generator[T, None, None]]:
+
+        @functools.wraps(async_gen_method)
+        def wrapped(*args, **kwargs):
+            async_gen = async_gen_method(*args, **kwargs)
+            try:
+                while True:
+                    try:
+                        yield self._loop.run_until_complete(
+                            async_gen.__anext__()
+                        )
+                    except StopAsyncIteration:
+                        return
+            finally:
+                # Release the connection if the caller stops early
+                self._loop.run_until_complete(async_gen.aclose())
+
+        return wrapped
+
     def __del__(self):
         if hasattr(self, "_loop") and self._loop is not None:
             with contextlib.suppress(Exception):
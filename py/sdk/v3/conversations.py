@@ -61,19 +61,30 @@ class ConversationsSDK:
     async def retrieve(
         self,
         id: str | UUID,
+        after: Optional[str | UUID] = None,
+        limit: Optional[int] = None,
     ) -> WrappedConversationMessagesResponse:
         """
         Get detailed information about a specific conversation.
 
         Args:
             id (Union[str, UUID]): The ID of the conversation to retrieve
+            after (Optional[Union[str, UUID]]): Only return messages after this message
+            limit (Optional[int]): The maximum number of messages to return
 
         Returns:
             dict: Detailed conversation information
         """
+        params: dict = {}
+        if after:
+            params["after"] = str(after)
+        if limit is not None:
+            params["limit"] = limit
+
         return await self.client._make_request(
             "GET",
             f"conversations/{str(id)}",
+            params=params,
             version="v3",
         )
 
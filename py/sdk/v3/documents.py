@@ -1,10 +1,16 @@
+import asyncio
 import json
+import os
 from io import BytesIO
-from typing import Any, Optional
+from typing import Any, AsyncGenerator, Callable, Optional
 from uuid import UUID
 
+from shared.abstractions import R2RException
 from shared.api.models.base import WrappedBooleanResponse
-from shared.api.models.ingestion.responses import WrappedIngestionResponse
+from shared.api.models.ingestion.responses import (
+    WrappedBulkIngestionResponse,
+    WrappedIngestionResponse,
+)
 from shared.api.models.management.responses import (
     WrappedChunksResponse,
     WrappedCollectionsResponse,
@@ -15,6 +21,15 @@ from shared.api.models.management.responses import (
 from ..models import IngestionMode, SearchMode, SearchSettings
 
 
+def _get_total_size(response) -> Optional[int]:
+    content_range = response.headers.get("Content-Range")
+    if content_range and "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        return int(total) if total.isdigit() else None
+    content_length = response.headers.get("Content-Length")
+    return int(content_length) if content_length else None
+
+
 class DocumentsSDK:
     """
     SDK for interacting with documents in the v3 API.
@@ -117,6 +132,84 @@ class DocumentsSDK:
                 version="v3",
             )
 
+    async def create_bulk(
+        self,
+        file_paths: Optional[list[str]] = None,
+        archive_path: Optional[str] = None,
+        ingestion_mode: Optional[str] = None,
+        collection_ids: Optional[list[str | UUID]] = None,
+        metadata: Optional[dict] = None,
+        ingestion_config: Optional[dict] = None,
+        run_with_orchestration: Optional[bool] = True,
+    ) -> WrappedBulkIngestionResponse:
+        """
+        Create many documents in one request, ingested by a single batched
+        workflow.
+
+        Args:
+            file_paths (Optional[list[str]]): The files to upload
+            archive_path (Optional[str]): A zip or tar archive of files to upload
+            collection_ids (Optional[list[Union[str, UUID]]]): Collection IDs to associate with every document. If none are provided, the documents will be assigned to the user's default collection.
+            metadata (Optional[dict]): Optional metadata shared by every document
+            ingestion_config (Optional[dict]): Optional ingestion configuration to use
+            run_with_orchestration (Optional[bool]): Whether to run with orchestration
+        """
+        if not file_paths and not archive_path:
+            raise ValueError(
+                "Either `file_paths` or `archive_path` must be provided"
+            )
+
+        data = {}
+        if metadata:
+            data["metadata"] = json.dumps(metadata)
+        if ingestion_config:
+            data["ingestion_config"] = json.dumps(
+                {**ingestion_config, "app": {}}
+            )
+        if collection_ids:
+            collection_ids = [str(collection_id) for collection_id in collection_ids]  # type: ignore
+            data["collection_ids"] = json.dumps(collection_ids)
+        if run_with_orchestration is not None:
+            data["run_with_orchestration"] = str(run_with_orchestration)
+        if ingestion_mode is not None:
+            data["ingestion_mode"] = ingestion_mode
+
+        file_instances = []
+        files = []
+        try:
+            for file_path in file_paths or []:
+                file_instance = open(file_path, "rb")
+                file_instances.append(file_instance)
+                files.append(
+                    (
+                        "files",
+                        (file_path, file_instance, "application/octet-stream"),
+                    )
+                )
+            if archive_path:
+                file_instance = open(archive_path, "rb")
+                file_instances.append(file_instance)
+                files.append(
+                    (
+                        "archive",
+                        (
+                            archive_path,
+                            file_instance,
+                            "application/octet-stream",
+                        ),
+                    )
+                )
+            return await self.client._make_request(
+                "POST",
+                "documents/bulk",
+                data=data,
+                files=files,
+                version="v3",
+            )
+        finally:
+            for file_instance in file_instances:
+                file_instance.close()
+
     async def retrieve(
         self,
         id: str | UUID,
@@ -151,6 +244,190 @@ class DocumentsSDK:
             raise ValueError("Expected BytesIO response")
         return response
 
+    async def stream_download(
+        self,
+        id: str | UUID,
+        offset: int = 0,
+        chunk_size: int = 1024 * 1024,
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Download a document's file piece by piece, without holding it in
+        memory.
+
+        Args:
+            id (Union[str, UUID]): ID of the document to download
+            offset (int): Byte offset to start from
+            chunk_size (int): Size of the pieces to yield, in bytes
+        """
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        async with self.client._stream_request(
+            "GET",
+            f"documents/{str(id)}/download",
+            version="v3",
+            headers=headers,
+        ) as response:
+            async for data in response.aiter_bytes(chunk_size):
+                yield data
+
+    async def download_to_file(
+        self,
+        id: str | UUID,
+        path: str,
+        resume: bool = False,
+        progress_callback: Optional[
+            Callable[[int, Optional[int]], Any]
+        ] = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> int:
+        """
+        Download a document's file straight to disk.
+
+        While a download is in progress, the file's `ETag` is kept next to
+        it in `<path>.etag`. With `resume`, a partial download is continued
+        only if the file on the server still has that `ETag`; otherwise it
+        starts over.
+
+        Args:
+            id (Union[str, UUID]): ID of the document to download
+            path (str): Where to write the file
+            resume (bool): Continue a partial download found at `path` rather than starting over
+            progress_callback (Optional[Callable[[int, Optional[int]], Any]]): Called with the bytes written so far and the total size, if known, after each piece
+            chunk_size (int): Size of the pieces to write, in bytes
+
+        Returns:
+            int: The size of the downloaded file, in bytes
+
+        Raises:
+            R2RException: If the server rejects the range or the download ends short of the file's size
+        """
+        etag_path = f"{path}.etag"
+        offset = 0
+        headers = {}
+        if resume and os.path.exists(path) and os.path.exists(etag_path):
+            with open(etag_path) as f:
+                etag = f.read().strip()
+            offset = os.path.getsize(path)
+            if offset and etag:
+                headers = {"Range": f"bytes={offset}-", "If-Range": etag}
+
+        async with self.client._stream_request(
+            "GET",
+            f"documents/{str(id)}/download",
+            version="v3",
+            headers=headers,
+        ) as response:
+            if response.status_code != 206:
+                # The file changed since the partial download, or no range
+                # was asked for
+                offset = 0
+            elif not response.headers.get("Content-Range", "").startswith(
+                f"bytes {offset}-"
+            ):
+                raise R2RException(
+                    status_code=416,
+                    message=f"Server did not resume document {id} from byte {offset}.",
+                )
+            total = _get_total_size(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                with open(etag_path, "w") as f:
+                    f.write(etag)
+            written = offset
+            with open(path, "ab" if offset else "wb") as f:
+                async for data in response.aiter_bytes(chunk_size):
+                    f.write(data)
+                    written += len(data)
+                    if progress_callback:
+                        progress_callback(written, total)
+
+        if total is not None and written != total:
+            raise R2RException(
+                status_code=500,
+                message=f"Download of document {id} ended after {written} of {total} bytes.",
+            )
+        if os.path.exists(etag_path):
+            os.remove(etag_path)
+        return written
+
+    async def create_many(
+        self,
+        file_paths: list[str],
+        max_concurrency: int = 8,
+        progress_callback: Optional[Callable[[int, int, dict], Any]] = None,
+        checkpoint_path: Optional[str] = None,
+        **create_kwargs: Any,
+    ) -> list[dict]:
+        """
+        Upload many files as separate documents, a bounded number at a time.
+
+        A file that fails does not stop the others. With a `checkpoint_path`,
+        every uploaded file is recorded there, and files already recorded
+        are skipped, so an interrupted run can simply be started again.
+
+        Args:
+            file_paths (list[str]): The files to upload
+            max_concurrency (int): How many uploads to run at once
+            progress_callback (Optional[Callable[[int, int, dict], Any]]): Called with the number of files done, the total, and the result for the file that just finished
+            checkpoint_path (Optional[str]): A file recording finished uploads, to resume from
+            **create_kwargs: Further arguments to `create`, such as `metadata` or `collection_ids`
+
+        Returns:
+            list[dict]: For each file, in order, its `file_path` and the `document_id` it was uploaded as, or the `error` it failed with
+        """
+        completed: dict[str, dict] = {}
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        completed[record["file_path"]] = record
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        checkpoint_lock = asyncio.Lock()
+        done = 0
+
+        async def upload(file_path: str) -> dict:
+            nonlocal done
+            if file_path in completed:
+                result = {**completed[file_path], "error": None}
+            else:
+                async with semaphore:
+                    try:
+                        response = await self.create(
+                            file_path=file_path, **create_kwargs
+                        )
+                        result = {
+                            "file_path": file_path,
+                            "document_id": response["results"]["document_id"],
+                            "error": None,
+                        }
+                    except Exception as e:
+                        result = {
+                            "file_path": file_path,
+                            "document_id": None,
+                            "error": str(e),
+                        }
+                if checkpoint_path and result["error"] is None:
+                    async with checkpoint_lock:
+                        with open(checkpoint_path, "a") as f:
+                            f.write(
+                                json.dumps(
+                                    {
+                                        "file_path": file_path,
+                                        "document_id": result["document_id"],
+                                    }
+                                )
+                                + "\n"
+                            )
+            done += 1
+            if progress_callback:
+                progress_callback(done, len(file_paths), result)
+            return result
+
+        return await asyncio.gather(
+            *(upload(file_path) for file_path in file_paths)
+        )
+
     async def delete(
         self,
         id: str | UUID,
@@ -88,31 +88,41 @@ class IndicesSDK:
             version="v3",
         )
 
-    # async def update_index(
-    #     self,
-    #     id: Union[str, UUID],
-    #     config: dict,  # Union[dict, IndexConfig],
-    #     run_with_orchestration: Optional[bool] = True,
-    # ) -> dict:
-    #     """
-    #     Update an existing index's configuration.
-
-    #     Args:
-    #         id (Union[str, UUID]): The ID of the index to update.
-    #         config (Union[dict, IndexConfig]): The new configuration for the index.
-    #         run_with_orchestration (Optional[bool]): Whether to run the update as an orchestrated task.
-
-    #     Returns:
-    #         WrappedUpdateIndexResponse: The response containing the updated index details.
-    #     """
-    #     if not isinstance(config, dict):
-    #         config = config.model_dump()
-
-    #     data = {
-    #         "config": config,
-    #         "run_with_orchestration": run_with_orchestration,
-    #     }
-    #     return await self.client._make_request("POST", f"indices/{id}", json=data)  # type: ignore
+    async def update(
+        self,
+        index_name: str,
+        config: dict,
+        table_name: str = "chunks",
+        run_with_orchestration: Optional[bool] = True,
+    ) -> WrappedGenericMessageResponse:
+        """
+        Rebuild an existing vector index with a new configuration.
+
+        The replacement index is built alongside the existing one and swapped
+        in once it is ready, so searches are not interrupted.
+
+        Args:
+            index_name (str): The name of the index to update.
+            config (Union[dict, IndexConfig]): The new configuration for the index.
+            table_name (str): The name of the table where the index is stored.
+            run_with_orchestration (Optional[bool]): Whether to run the update as an orchestrated task.
+
+        Returns:
+            WrappedGenericMessageResponse: The response confirming the update was queued.
+        """
+        if not isinstance(config, dict):
+            config = config.model_dump(exclude_unset=True)
+
+        data = {
+            "config": config,
+            "run_with_orchestration": run_with_orchestration,
+        }
+        return await self.client._make_request(
+            "POST",
+            f"indices/{table_name}/{index_name}",
+            json=data,
+            version="v3",
+        )
 
     async def delete(
         self,
@@ -1,6 +1,6 @@
 from __future__ import annotations  # for Python 3.10+
 
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
 from typing_extensions import deprecated
@@ -279,6 +279,7 @@ class UsersSDK:
         ids: Optional[list[str | UUID]] = None,
         offset: Optional[int] = 0,
         limit: Optional[int] = 100,
+        after_email: Optional[str] = None,
     ) -> WrappedUsersResponse:
         """
         List users with pagination and filtering options.
@@ -286,16 +287,19 @@ class UsersSDK:
         Args:
             offset (int, optional): Specifies the number of objects to skip. Defaults to 0.
             limit (int, optional): Specifies a limit on the number of objects to return, ranging between 1 and 100. Defaults to 100.
+            after_email (str, optional): Return users whose email sorts after this one, for keyset pagination.
 
         Returns:
             dict: List of users and pagination information
         """
-        params = {
+        params: dict[str, Any] = {
             "offset": offset,
             "limit": limit,
         }
         if ids:
-            params["ids"] = [str(user_id) for user_id in ids]  # type: ignore
+            params["ids"] = [str(user_id) for user_id in ids]
+        if after_email:
+            params["after_email"] = after_email
 
         return await self.client._make_request(
             "GET",
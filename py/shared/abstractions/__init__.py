@@ -58,6 +58,7 @@ from .user import Token, TokenData, User
 from .vector import (
     IndexArgsHNSW,
     IndexArgsIVFFlat,
+    IndexBuildSettings,
     IndexMeasure,
     IndexMethod,
     StorageResult,
@@ -142,6 +143,7 @@ __all__ = [
     "IndexMeasure",
     "IndexArgsIVFFlat",
     "IndexArgsHNSW",
+    "IndexBuildSettings",
     "VectorTableName",
     "VectorQuantizationType",
     "StorageResult",
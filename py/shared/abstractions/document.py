@@ -20,6 +20,14 @@ class DocumentType(str, Enum):
     # Audio
     MP3 = "mp3"
 
+    # Code and configuration
+    CFG = "cfg"
+    IN = "in"
+    MK = "mk"
+    PY = "py"
+    SH = "sh"
+    USH = "ush"
+
     # CSV
     CSV = "csv"
 
@@ -20,14 +20,17 @@ LLMChatCompletionChunk = ChatCompletionChunk
 class RAGCompletion:
     completion: LLMChatCompletion
     search_results: "AggregateSearchResult"
+    metadata: dict[str, Any]
 
     def __init__(
         self,
         completion: LLMChatCompletion,
         search_results: "AggregateSearchResult",
+        metadata: Optional[dict[str, Any]] = None,
     ):
         self.completion = completion
         self.search_results = search_results
+        self.metadata = metadata or {}
 
 
 class GenerationConfig(R2RSerializable):
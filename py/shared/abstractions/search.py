@@ -366,6 +366,10 @@ class SearchSettings(R2RSerializable):
         default="vanilla",
         description="Search strategy to use (e.g., 'vanilla', 'query_fusion', 'hyde')",
     )
+    search_language: Optional[str] = Field(
+        default=None,
+        description="Text search configuration used to parse full-text queries, e.g. `english`, `german` or `simple`. Only chunks indexed with the same configuration are matched. Defaults to the server's `text_search_language`.",
+    )
     hybrid_settings: HybridSearchSettings = Field(
         default_factory=HybridSearchSettings,
         description="Settings for hybrid search (only used if `use_semantic_search` and `use_fulltext_search` are both true)",
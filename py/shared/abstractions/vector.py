@@ -109,6 +109,21 @@ class IndexArgsHNSW(R2RSerializable):
     ef_construction: Optional[int] = 64
 
 
+class IndexBuildSettings(R2RSerializable):
+    """
+    Session settings applied only while an index is being built.
+
+    Attributes:
+        maintenance_work_mem (str): Memory available to the build, e.g.
+            `"2GB"`. HNSW builds are much faster when the graph fits.
+        max_parallel_maintenance_workers (int): Parallel workers the build
+            may use, in addition to the leader process.
+    """
+
+    maintenance_work_mem: Optional[str] = None
+    max_parallel_maintenance_workers: Optional[int] = None
+
+
 class VectorTableName(str, Enum):
     """
     This enum represents the different tables where we store vectors.
@@ -242,3 +257,4 @@ class IndexConfig(BaseModel):
     index_name: Optional[str] = Field(default=None)
     index_column: Optional[str] = Field(default=None)
     concurrently: Optional[bool] = Field(default=True)
+    build_settings: Optional[IndexBuildSettings] = Field(default=None)
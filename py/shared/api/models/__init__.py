@@ -11,7 +11,9 @@ from shared.api.models.base import (
     WrappedGenericMessageResponse,
 )
 from shared.api.models.ingestion.responses import (
+    BulkIngestionResponse,
     IngestionResponse,
+    WrappedBulkIngestionResponse,
     WrappedIngestionResponse,
     WrappedMetadataUpdateResponse,
     WrappedUpdateResponse,
@@ -68,6 +70,8 @@ __all__ = [
     # Ingestion Responses
     "IngestionResponse",
     "WrappedIngestionResponse",
+    "BulkIngestionResponse",
+    "WrappedBulkIngestionResponse",
     "WrappedUpdateResponse",
     "WrappedMetadataUpdateResponse",
     # TODO: Need to review anything above this
@@ -56,12 +56,63 @@ class UpdateResponse(BaseModel):
         }
 
 
+class BulkIngestionDocumentResult(BaseModel):
+    document_id: UUID = Field(
+        ...,
+        description="The ID of the document.",
+    )
+    filename: str = Field(
+        ...,
+        description="The name of the file the document was created from.",
+    )
+    status: str = Field(
+        ...,
+        description="The ingestion status of the document.",
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Why the document failed to ingest, if it did.",
+    )
+
+
+class BulkIngestionResponse(BaseModel):
+    message: str = Field(
+        ...,
+        description="A message describing the result of the ingestion request.",
+    )
+    task_id: Optional[UUID] = Field(
+        None,
+        description="The task ID of the ingestion request.",
+    )
+    documents: list[BulkIngestionDocumentResult] = Field(
+        ...,
+        description="The documents in the request and their status.",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Ingest files batch task queued successfully.",
+                "task_id": "c68dc72e-fc23-5452-8f49-d7bd46088a96",
+                "documents": [
+                    {
+                        "document_id": "9fbe403b-c11c-5aae-8ade-ef22980c3ad1",
+                        "filename": "essays/pg_essay_1.html",
+                        "status": "pending",
+                        "error": None,
+                    }
+                ],
+            }
+        }
+
+
 # TODO: This can probably be cleaner
 class ListVectorIndicesResponse(BaseModel):
     indices: list[dict[str, Any]]
 
 
 WrappedIngestionResponse = R2RResults[IngestionResponse]
+WrappedBulkIngestionResponse = R2RResults[BulkIngestionResponse]
 WrappedMetadataUpdateResponse = R2RResults[IngestionResponse]
 WrappedUpdateResponse = R2RResults[UpdateResponse]
 
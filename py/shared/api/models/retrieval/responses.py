@@ -39,6 +39,10 @@ class RAGResponse(BaseModel):
         ...,
         description="The search results used for the RAG process",
     )
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        description="How the context was assembled, including the search results dropped to fit the context budget",
+    )
 
     class Config:
         json_schema_extra = {
@@ -74,6 +78,10 @@ class AgentResponse(BaseModel):
     conversation_id: str = Field(
         ..., description="The conversation ID for the RAG agent response"
     )
+    metadata: dict[str, Any] = Field(
+        default_factory=dict,
+        description="How the context of each search was assembled, including the search results dropped to fit the context budget",
+    )
 
     class Config:
         json_schema_extra = {
@@ -16,11 +16,20 @@ from .base_utils import (
     to_async_generator,
     validate_uuid,
 )
+from .context_builder import (
+    ContextBuilder,
+    ContextBuildResult,
+    estimate_tokens,
+)
 from .splitter.text import RecursiveCharacterTextSplitter, TextSplitter
 
 __all__ = [
     "format_search_results_for_stream",
     "format_search_results_for_llm",
+    # Context assembly
+    "ContextBuilder",
+    "ContextBuildResult",
+    "estimate_tokens",
     # ID generation
     "generate_id",
     "generate_document_id",
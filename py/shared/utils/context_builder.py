@@ -0,0 +1,303 @@
+"""Token-budgeted assembly of search results into an LLM context."""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from ..abstractions.search import (
+    AggregateSearchResult,
+    GraphSearchResult,
+    KGCommunityResult,
+    KGEntityResult,
+    KGRelationshipResult,
+)
+
+logger = logging.getLogger()
+
+# Minimum number of characters two chunks must share before the shared
+# prefix of the lower ranked chunk is trimmed away.
+MIN_OVERLAP_CHARS = 32
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate used when no tokenizer is available."""
+    return max(1, len(text) // 4) if text else 0
+
+
+@dataclass
+class ContextItem:
+    """A single search result that is a candidate for the context."""
+
+    source_id: int
+    key: str
+    kind: str
+    text: str
+    document_id: Optional[str] = None
+    fused_score: float = 0.0
+    tokens: int = 0
+
+
+@dataclass
+class ContextBuildResult:
+    """The assembled context plus an account of what did not fit."""
+
+    context: str
+    total_tokens: int
+    token_budget: Optional[int]
+    included: list[int] = field(default_factory=list)
+    dropped: list[dict[str, Any]] = field(default_factory=list)
+    deduplicated: list[dict[str, Any]] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total_tokens": self.total_tokens,
+            "token_budget": self.token_budget,
+            "included": self.included,
+            "dropped": self.dropped,
+            "deduplicated": self.deduplicated,
+        }
+
+
+class ContextBuilder:
+    """
+    Collects search results from one or more queries and renders them into
+    a prompt context that fits within a token budget.
+
+    Results are fused across queries with reciprocal rank fusion, duplicate
+    and overlapping chunks are collapsed, and the highest ranked results are
+    admitted until the budget is exhausted. Admitted results keep the
+    `[n]` numbering of their original position so that citations in the
+    completion still line up with the returned search results.
+
+    The "rag" style renders results as `[n]: text` for the RAG prompt; the
+    "agent" style renders them as `Source [n]:` blocks, including graph
+    result metadata, matching `format_search_results_for_llm`.
+    """
+
+    STYLES = ("rag", "agent")
+
+    def __init__(
+        self,
+        token_counter: Optional[Callable[[str], int]] = None,
+        max_tokens: Optional[int] = None,
+        rrf_k: int = 60,
+        style: str = "rag",
+    ):
+        if style not in self.STYLES:
+            raise ValueError(f"Unsupported context style: {style}")
+        self.token_counter = token_counter or estimate_tokens
+        self.max_tokens = max_tokens
+        self.rrf_k = rrf_k
+        self.style = style
+        self._items: dict[str, ContextItem] = {}
+        self._queries: list[str] = []
+        self._next_source_id = 1
+
+    def add_results(self, query: str, results: AggregateSearchResult) -> None:
+        self._queries.append(query)
+
+        for rank, chunk in enumerate(results.chunk_search_results or []):
+            self._add_item(
+                key=f"chunk:{chunk.id}",
+                kind="chunk",
+                text=chunk.text,
+                rank=rank,
+                document_id=str(chunk.document_id),
+            )
+
+        for rank, kg_result in enumerate(results.graph_search_results or []):
+            content = kg_result.content
+            if isinstance(content, KGEntityResult):
+                key = f"entity:{content.name}"
+            elif isinstance(content, KGRelationshipResult):
+                key = f"relationship:{content.subject}:{content.predicate}:{content.object}"
+            elif isinstance(content, KGCommunityResult):
+                key = f"community:{content.name}"
+            else:
+                key = f"global:{content.name}"  # type: ignore
+            self._add_item(
+                key=key,
+                kind="graph",
+                text=self._graph_text(kg_result),
+                rank=rank,
+            )
+
+        for rank, web_result in enumerate(results.web_search_results or []):
+            text = f"Title: {web_result.title}\nLink: {web_result.link}\nSnippet: {web_result.snippet}"
+            if web_result.date:
+                text += f"\nDate: {web_result.date}"
+            self._add_item(
+                key=f"web:{web_result.link}",
+                kind="web",
+                text=text,
+                rank=rank,
+            )
+
+    def _graph_text(self, kg_result: GraphSearchResult) -> str:
+        content = kg_result.content
+        if self.style == "rag":
+            if isinstance(content, KGEntityResult):
+                return f"Entity Name - {content.name}\n\nDescription - {content.description}"
+            elif isinstance(content, KGRelationshipResult):
+                return f"Relationship - {content.subject} - {content.predicate} - {content.object}"
+            elif isinstance(content, KGCommunityResult):
+                return f"Community Name - {content.name}\n\nDescription - {content.summary}"
+            return f"Name - {content.name}\n\nDescription - {content.description}"  # type: ignore
+
+        lines: list[str] = []
+        if isinstance(content, KGCommunityResult):
+            lines += [f"Name: {content.name}", f"Summary: {content.summary}"]
+        elif isinstance(content, KGEntityResult):
+            lines += [
+                f"Name: {content.name}",
+                f"Description: {content.description}",
+            ]
+        elif isinstance(content, KGRelationshipResult):
+            lines.append(
+                f"Relationship: {content.subject} - {content.predicate} - {content.object}"
+            )
+        if kg_result.metadata:
+            lines.append("Metadata:")
+            lines += [
+                f"- {key}: {value}"
+                for key, value in kg_result.metadata.items()
+            ]
+        return "\n".join(lines)
+
+    def _add_item(
+        self,
+        key: str,
+        kind: str,
+        text: str,
+        rank: int,
+        document_id: Optional[str] = None,
+    ) -> None:
+        score = 1.0 / (self.rrf_k + rank + 1)
+        if item := self._items.get(key):
+            item.fused_score += score
+            return
+        self._items[key] = ContextItem(
+            source_id=self._next_source_id,
+            key=key,
+            kind=kind,
+            text=text,
+            document_id=document_id,
+            fused_score=score,
+        )
+        self._next_source_id += 1
+
+    def build(self) -> ContextBuildResult:
+        ranked = sorted(
+            self._items.values(),
+            key=lambda item: (-item.fused_score, item.source_id),
+        )
+
+        selected: list[ContextItem] = []
+        dropped: list[dict[str, Any]] = []
+        deduplicated: list[dict[str, Any]] = []
+        used_tokens = self.token_counter(self._render_queries())
+
+        for item in ranked:
+            text = self._remove_overlap(item, selected)
+            if text is None:
+                deduplicated.append(
+                    {"source": item.source_id, "key": item.key}
+                )
+                continue
+            item.text = text
+            item.tokens = self.token_counter(self._render_item(item))
+            if (
+                self.max_tokens is not None
+                and used_tokens + item.tokens > self.max_tokens
+            ):
+                dropped.append(
+                    {
+                        "source": item.source_id,
+                        "key": item.key,
+                        "tokens": item.tokens,
+                    }
+                )
+                continue
+            used_tokens += item.tokens
+            selected.append(item)
+
+        selected.sort(key=lambda item: item.source_id)
+        context = self._render(selected)
+
+        if dropped:
+            logger.info(
+                f"Context budget of {self.max_tokens} tokens reached, "
+                f"dropped {len(dropped)} of {len(ranked)} search results."
+            )
+
+        return ContextBuildResult(
+            context=context,
+            total_tokens=used_tokens,
+            token_budget=self.max_tokens,
+            included=[item.source_id for item in selected],
+            dropped=dropped,
+            deduplicated=deduplicated,
+        )
+
+    @staticmethod
+    def _remove_overlap(
+        item: ContextItem, selected: list[ContextItem]
+    ) -> Optional[str]:
+        """
+        Returns the text of `item` with any prefix already covered by a
+        selected chunk of the same document removed, or None when the item
+        is entirely covered.
+        """
+        normalized = " ".join(item.text.split())
+        text = item.text
+        for other in selected:
+            if other.kind != item.kind:
+                continue
+            other_normalized = " ".join(other.text.split())
+            if normalized in other_normalized:
+                return None
+            if item.kind != "chunk" or other.document_id != item.document_id:
+                continue
+
+            # Adjacent chunks overlap by `chunk_overlap` characters, drop the
+            # part of the candidate that the selected chunk already contains.
+            probe = text[:MIN_OVERLAP_CHARS]
+            if len(probe) < MIN_OVERLAP_CHARS:
+                continue
+            position = other.text.rfind(probe)
+            if position == -1:
+                continue
+            overlap = len(other.text) - position
+            if text[:overlap] == other.text[position:]:
+                text = text[overlap:].lstrip()
+                if not text:
+                    return None
+        return text
+
+    def _render(self, items: list[ContextItem]) -> str:
+        context = self._render_queries()
+        sections = {
+            "chunk": "Vector Search Results:\n",
+            "graph": (
+                "Knowledge Graph Results:\n"
+                if self.style == "rag"
+                else "KG Search Results:\n"
+            ),
+            "web": "Web Search Results:\n",
+        }
+        for kind, title in sections.items():
+            kind_items = [item for item in items if item.kind == kind]
+            if not kind_items:
+                continue
+            context += title
+            context += "".join(self._render_item(item) for item in kind_items)
+        return context if self.style == "rag" else context.rstrip("\n")
+
+    def _render_queries(self) -> str:
+        unique_queries = [q for q in dict.fromkeys(self._queries) if q]
+        return "".join(f"Query:\n{query}\n\n" for query in unique_queries)
+
+    def _render_item(self, item: ContextItem) -> str:
+        if self.style == "agent":
+            return f"Source [{item.source_id}]:\n{item.text}\n"
+        return f"[{item.source_id}]: {item.text}\n\n"
@@ -0,0 +1,785 @@
+"""
+Benchmarks R2R's hot paths directly against a local Postgres with pgvector.
+
+Unlike `loadTester.py`, no server or hosted providers are needed: embeddings
+come from a deterministic feature-hashing stand-in and completions from a
+stand-in LLM with configurable latency, so runs are reproducible and the
+numbers isolate R2R and Postgres from network and provider variance.
+
+Every corpus size is benchmarked in its own schema, which is dropped
+afterwards unless `--keep-data` is given. Run from the `py` directory:
+
+    R2R_POSTGRES_USER=postgres R2R_POSTGRES_PASSWORD=postgres \\
+    R2R_POSTGRES_HOST=localhost R2R_POSTGRES_PORT=5432 \\
+    R2R_POSTGRES_DBNAME=postgres \\
+    python -m tests.scaling.benchmark --sizes 100,1000 --output results.json
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import platform
+import random
+import re
+import statistics
+import subprocess
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional
+
+from openai.types.chat import ChatCompletion, ChatCompletionMessage
+from openai.types.chat.chat_completion import Choice
+
+from core.base import (
+    AppConfig,
+    AsyncPipe,
+    ChunkSearchResult,
+    CompletionConfig,
+    CompletionProvider,
+    DatabaseConfig,
+    DocumentChunk,
+    DocumentResponse,
+    DocumentType,
+    EmbeddingConfig,
+    EmbeddingProvider,
+    EmbeddingPurpose,
+    GenerationConfig,
+    IngestionStatus,
+    RecursiveCharacterTextSplitter,
+    Relationship,
+    SearchSettings,
+    Vector,
+    VectorEntry,
+    VectorType,
+)
+from core.database.postgres import PostgresDatabaseProvider
+from core.pipes.kg.extraction import KGExtractionPipe
+from core.providers.crypto import BCryptConfig, BCryptProvider
+from core.providers.ingestion import R2RIngestionConfig, R2RIngestionProvider
+
+logger = logging.getLogger()
+
+# Defaults
+SIZES = [100, 1_000]
+DIMENSION = 512
+CHUNK_SIZE = 1_024
+CHUNK_OVERLAP = 128
+SENTENCES_PER_DOCUMENT = 60
+EMBEDDING_BATCH_SIZE = 128
+UPSERT_BATCH_SIZE = 512
+INGESTION_CONCURRENCY = 16
+NUM_QUERIES = 50
+SEARCH_LIMIT = 10
+GRAPH_DOCUMENTS = 25
+LLM_LATENCY_SECONDS = 0.05
+EMBEDDING_LATENCY_SECONDS = 0.0
+SEED = 7272
+
+ENTITIES = [
+    "Aristotle",
+    "Plato",
+    "Socrates",
+    "Confucius",
+    "Kant",
+    "Nietzsche",
+    "Descartes",
+    "Hume",
+    "Hegel",
+    "Aquinas",
+    "Spinoza",
+    "Leibniz",
+    "Locke",
+    "Rousseau",
+    "Kierkegaard",
+    "Wittgenstein",
+]
+TOPICS = [
+    "ethics",
+    "metaphysics",
+    "epistemology",
+    "logic",
+    "aesthetics",
+    "politics",
+    "language",
+    "mind",
+    "virtue",
+    "causality",
+    "freedom",
+    "knowledge",
+]
+VERBS = [
+    "criticized",
+    "influenced",
+    "debated",
+    "extended",
+    "rejected",
+    "reinterpreted",
+]
+
+
+class StandInEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic embeddings built by hashing terms into signed buckets, so
+    texts that share vocabulary land close together and semantic search
+    results are meaningful without a model.
+    """
+
+    _TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self, config: EmbeddingConfig, latency: float = 0.0):
+        super().__init__(config)
+        self.dimension = config.base_dimension
+        self.latency = latency
+
+    @lru_cache(maxsize=65_536)
+    def _bucket(self, term: str) -> tuple[int, float]:
+        digest = hashlib.blake2b(term.encode(), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dimension, 1.0 if value >> 63 else -1.0
+
+    def embed(self, text: str) -> list[float]:
+        vector = [0.0] * self.dimension
+        for term in self._TOKEN_PATTERN.findall(text.lower()):
+            index, sign = self._bucket(term)
+            vector[index] += sign
+        norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+        return [value / norm for value in vector]
+
+    async def _execute_task(self, task: dict[str, Any]):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._execute_task_sync(task)
+
+    def _execute_task_sync(self, task: dict[str, Any]):
+        if "texts" in task:
+            return [self.embed(text) for text in task["texts"]]
+        return self.embed(task["text"])
+
+    def rerank(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        stage: EmbeddingProvider.PipeStage = EmbeddingProvider.PipeStage.RERANK,
+        limit: int = 10,
+    ):
+        return results[:limit]
+
+    async def arerank(
+        self,
+        query: str,
+        results: list[ChunkSearchResult],
+        stage: EmbeddingProvider.PipeStage = EmbeddingProvider.PipeStage.RERANK,
+        limit: int = 10,
+    ):
+        return results[:limit]
+
+
+class StandInCompletionProvider(CompletionProvider):
+    """
+    A stand-in LLM that waits `latency` seconds and then answers in the
+    knowledge graph extraction format, linking the known entities that
+    appear in the prompt in order of appearance.
+    """
+
+    def __init__(
+        self,
+        config: CompletionConfig,
+        entities: list[str],
+        latency: float = 0.0,
+    ):
+        super().__init__(config)
+        self.latency = latency
+        self.entity_pattern = re.compile(
+            r"\b(" + "|".join(map(re.escape, entities)) + r")\b"
+        )
+        self.calls = 0
+
+    def _respond(self, task: dict[str, Any]) -> ChatCompletion:
+        self.calls += 1
+        prompt = task["messages"][-1]["content"]
+        names = list(dict.fromkeys(self.entity_pattern.findall(prompt)))
+        lines = [
+            f'("entity"$$$${name}$$$$PERSON$$$${name} is a philosopher.)'
+            for name in names
+        ]
+        lines.extend(
+            f'("relationship"$$$${subject}$$$${object}$$$$DISCUSSED$$$$'
+            f"{subject} discussed {object}.$$$$5)"
+            for subject, object in zip(names, names[1:])
+        )
+        return ChatCompletion(
+            id=f"stand-in-{self.calls}",
+            object="chat.completion",
+            created=int(time.time()),
+            model=task["generation_config"].model or "stand-in",
+            choices=[
+                Choice(
+                    index=0,
+                    finish_reason="stop",
+                    message=ChatCompletionMessage(
+                        role="assistant", content="\n".join(lines)
+                    ),
+                )
+            ],
+        )
+
+    async def _execute_task(self, task: dict[str, Any]):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(task)
+
+    def _execute_task_sync(self, task: dict[str, Any]):
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(task)
+
+
+@dataclass
+class StageResult:
+    corpus_size: int
+    stage: str
+    operations: int
+    duration_seconds: float
+    throughput_per_second: float
+    latency_ms: dict[str, float] = field(default_factory=dict)
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+def summarize_latencies(latencies: list[float]) -> dict[str, float]:
+    if not latencies:
+        return {}
+    millis = sorted(latency * 1000 for latency in latencies)
+    percentiles = (
+        statistics.quantiles(millis, n=100, method="inclusive")
+        if len(millis) > 1
+        else [millis[0]] * 99
+    )
+    return {
+        "mean": round(statistics.fmean(millis), 3),
+        "p50": round(percentiles[49], 3),
+        "p95": round(percentiles[94], 3),
+        "p99": round(percentiles[98], 3),
+        "max": round(millis[-1], 3),
+    }
+
+
+def stage_result(
+    corpus_size: int,
+    stage: str,
+    operations: int,
+    duration: float,
+    latencies: Optional[list[float]] = None,
+    **details: Any,
+) -> StageResult:
+    return StageResult(
+        corpus_size=corpus_size,
+        stage=stage,
+        operations=operations,
+        duration_seconds=round(duration, 4),
+        throughput_per_second=(
+            round(operations / duration, 3) if duration else 0.0
+        ),
+        latency_ms=summarize_latencies(latencies or []),
+        details=details,
+    )
+
+
+def generate_corpus(
+    size: int, sentences: int, seed: int
+) -> list[tuple[uuid.UUID, str]]:
+    """Generates `size` reproducible documents about philosophers."""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(size):
+        document_id = uuid.UUID(int=rng.getrandbits(128), version=4)
+        text = " ".join(
+            f"{rng.choice(ENTITIES)} {rng.choice(VERBS)} "
+            f"{rng.choice(ENTITIES)} on {rng.choice(TOPICS)} and "
+            f"{rng.choice(TOPICS)}."
+            for _ in range(sentences)
+        )
+        documents.append((document_id, text))
+    return documents
+
+
+def generate_queries(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed + 1)
+    return [
+        f"{rng.choice(ENTITIES)} {rng.choice(TOPICS)}" for _ in range(count)
+    ]
+
+
+class Benchmark:
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.embedding_provider = StandInEmbeddingProvider(
+            EmbeddingConfig(
+                provider="litellm",
+                base_model="stand-in",
+                base_dimension=args.dimension,
+                app=AppConfig(),
+            ),
+            latency=args.embedding_latency,
+        )
+        self.llm_provider = StandInCompletionProvider(
+            CompletionConfig(provider="litellm", app=AppConfig()),
+            entities=ENTITIES,
+            latency=args.llm_latency,
+        )
+        self.splitter = RecursiveCharacterTextSplitter(
+            chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap
+        )
+        self.owner_id = uuid.UUID(int=args.seed, version=4)
+        self.collection_id = uuid.UUID(int=args.seed + 1, version=4)
+        self.current_size = 0
+
+    async def _create_database_provider(
+        self, size: int
+    ) -> PostgresDatabaseProvider:
+        config = DatabaseConfig(
+            app=AppConfig(project_name=f"{self.args.project_prefix}_{size}")
+        )
+        provider = PostgresDatabaseProvider(
+            config,
+            dimension=self.args.dimension,
+            crypto_provider=BCryptProvider(BCryptConfig(app=AppConfig())),
+        )
+        await provider.initialize()
+        return provider
+
+    async def bench_startup(
+        self, size: int
+    ) -> tuple[PostgresDatabaseProvider, list[StageResult]]:
+        """
+        Times provider startup against a new schema, then again against the
+        schema it left behind, which should skip the table setup.
+        """
+        start = time.perf_counter()
+        database = await self._create_database_provider(size)
+        cold_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm_database = await self._create_database_provider(size)
+        warm_duration = time.perf_counter() - start
+        await warm_database.close()
+
+        start = time.perf_counter()
+        R2RIngestionProvider(
+            R2RIngestionConfig(provider="r2r", app=AppConfig()),
+            database,
+            self.llm_provider,  # type: ignore
+        )
+        ingestion_provider_duration = time.perf_counter() - start
+
+        return database, [
+            stage_result(self.current_size, "startup_cold", 1, cold_duration),
+            stage_result(
+                self.current_size,
+                "startup_warm",
+                1,
+                warm_duration,
+                ingestion_provider_ms=round(
+                    ingestion_provider_duration * 1000, 3
+                ),
+            ),
+        ]
+
+    def _document_entries(
+        self, document_id: uuid.UUID, chunks: list[str], vectors
+    ) -> list[VectorEntry]:
+        return [
+            VectorEntry(
+                id=uuid.uuid5(document_id, str(chunk_order)),
+                document_id=document_id,
+                owner_id=self.owner_id,
+                collection_ids=[self.collection_id],
+                vector=Vector(
+                    data=vector,
+                    type=VectorType.FIXED,
+                    length=self.args.dimension,
+                ),
+                text=chunk,
+                metadata={"chunk_order": chunk_order},
+            )
+            for chunk_order, (chunk, vector) in enumerate(zip(chunks, vectors))
+        ]
+
+    async def bench_ingestion(
+        self,
+        database: PostgresDatabaseProvider,
+        corpus: list[tuple[uuid.UUID, str]],
+    ) -> tuple[StageResult, list[VectorEntry]]:
+        """Split, embed and store every document, bounded by concurrency."""
+        semaphore = asyncio.Semaphore(self.args.ingestion_concurrency)
+        latencies: list[float] = []
+        entries: list[VectorEntry] = []
+
+        async def ingest(document_id: uuid.UUID, text: str) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                chunks = self.splitter.split_text(text)
+                vectors: list[list[float]] = []
+                for i in range(0, len(chunks), self.args.embedding_batch_size):
+                    vectors.extend(
+                        await self.embedding_provider.async_get_embeddings(
+                            chunks[i : i + self.args.embedding_batch_size],
+                            purpose=EmbeddingPurpose.INDEX,
+                        )
+                    )
+                document_entries = self._document_entries(
+                    document_id, chunks, vectors
+                )
+                await database.chunks_handler.upsert_entries(document_entries)
+                await database.documents_handler.upsert_documents_overview(
+                    DocumentResponse(
+                        id=document_id,
+                        collection_ids=[self.collection_id],
+                        owner_id=self.owner_id,
+                        document_type=DocumentType.TXT,
+                        metadata={},
+                        title=f"{document_id}.txt",
+                        version="v0",
+                        size_in_bytes=len(text),
+                        ingestion_status=IngestionStatus.SUCCESS,
+                    )
+                )
+                entries.extend(document_entries)
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(ingest(document_id, text) for document_id, text in corpus)
+        )
+        duration = time.perf_counter() - start
+        return (
+            stage_result(
+                len(corpus),
+                "ingestion",
+                len(corpus),
+                duration,
+                latencies,
+                chunks=len(entries),
+                chunks_per_second=round(len(entries) / duration, 3),
+            ),
+            entries,
+        )
+
+    async def bench_chunk_upsert(
+        self, database: PostgresDatabaseProvider, entries: list[VectorEntry]
+    ) -> StageResult:
+        """Re-upserts every stored chunk, exercising the conflict path."""
+        batch_size = self.args.upsert_batch_size
+        latencies = []
+        start = time.perf_counter()
+        for i in range(0, len(entries), batch_size):
+            batch_start = time.perf_counter()
+            await database.chunks_handler.upsert_entries(
+                entries[i : i + batch_size]
+            )
+            latencies.append(time.perf_counter() - batch_start)
+        duration = time.perf_counter() - start
+        return stage_result(
+            self.current_size,
+            "chunk_upsert",
+            len(entries),
+            duration,
+            latencies,
+            batch_size=batch_size,
+        )
+
+    async def bench_search(
+        self, database: PostgresDatabaseProvider, queries: list[str]
+    ) -> list[StageResult]:
+        settings = SearchSettings(limit=self.args.search_limit)
+        vectors = await self.embedding_provider.async_get_embeddings(
+            queries, purpose=EmbeddingPurpose.QUERY
+        )
+        chunks_handler = database.chunks_handler
+        modes = {
+            "semantic_search": lambda query, vector: (
+                chunks_handler.semantic_search(vector, settings)
+            ),
+            "full_text_search": lambda query, vector: (
+                chunks_handler.full_text_search(query, settings)
+            ),
+            "hybrid_search": lambda query, vector: (
+                chunks_handler.hybrid_search(query, vector, settings)
+            ),
+        }
+
+        results = []
+        for stage, search in modes.items():
+            latencies = []
+            hits = 0
+            start = time.perf_counter()
+            for query, vector in zip(queries, vectors):
+                query_start = time.perf_counter()
+                hits += len(await search(query, vector))
+                latencies.append(time.perf_counter() - query_start)
+            duration = time.perf_counter() - start
+            results.append(
+                stage_result(
+                    self.current_size,
+                    stage,
+                    len(queries),
+                    duration,
+                    latencies,
+                    mean_hits=round(hits / len(queries), 3),
+                )
+            )
+        return results
+
+    async def bench_graph_extraction(
+        self,
+        database: PostgresDatabaseProvider,
+        entries: list[VectorEntry],
+    ) -> tuple[StageResult, list[Relationship]]:
+        """Runs entity and relationship extraction with the stand-in LLM."""
+        documents: dict[uuid.UUID, list[DocumentChunk]] = {}
+        for entry in entries:
+            if (
+                entry.document_id not in documents
+                and len(documents) >= self.args.graph_documents
+            ):
+                continue
+            documents.setdefault(entry.document_id, []).append(
+                DocumentChunk(
+                    id=entry.id,
+                    document_id=entry.document_id,
+                    owner_id=entry.owner_id,
+                    collection_ids=entry.collection_ids,
+                    data=entry.text,
+                    metadata=entry.metadata,
+                )
+            )
+
+        pipe = KGExtractionPipe(
+            database_provider=database,
+            llm_provider=self.llm_provider,
+            config=AsyncPipe.PipeConfig(name="benchmark_kg_extraction_pipe"),
+        )
+        settings = database.config.graph_creation_settings
+        generation_config = GenerationConfig(model="stand-in")
+        latencies = []
+
+        async def extract(chunks: list[DocumentChunk]):
+            start = time.perf_counter()
+            extraction = await pipe.extract_kg(
+                extractions=chunks,
+                generation_config=generation_config,
+                max_knowledge_relationships=settings.max_knowledge_relationships,
+                entity_types=settings.entity_types,
+                relation_types=settings.relation_types,
+            )
+            latencies.append(time.perf_counter() - start)
+            return extraction
+
+        merge_count = max(1, settings.fragment_merge_count)
+        groups = [
+            chunks[i : i + merge_count]
+            for chunks in documents.values()
+            for i in range(0, len(chunks), merge_count)
+        ]
+        start = time.perf_counter()
+        extractions = await asyncio.gather(*map(extract, groups))
+        duration = time.perf_counter() - start
+
+        relationships = [
+            relationship
+            for extraction in extractions
+            for relationship in extraction.relationships
+        ]
+        return (
+            stage_result(
+                self.current_size,
+                "graph_extraction",
+                len(groups),
+                duration,
+                latencies,
+                documents=len(documents),
+                entities=sum(len(e.entities) for e in extractions),
+                relationships=len(relationships),
+                llm_latency_seconds=self.args.llm_latency,
+            ),
+            relationships,
+        )
+
+    async def bench_clustering(
+        self,
+        database: PostgresDatabaseProvider,
+        relationships: list[Relationship],
+    ) -> StageResult:
+        """Runs local Leiden clustering over the extracted relationships."""
+        graphs_handler = database.graphs_handler
+        leiden_params = database.config.graph_enrichment_settings.leiden_params
+        start = time.perf_counter()
+        try:
+            relationship_ids_cache = (
+                await graphs_handler._get_relationship_ids_cache(relationships)
+            )
+            num_communities, _ = (
+                await graphs_handler._cluster_and_add_community_info(
+                    relationships=relationships,
+                    relationship_ids_cache=relationship_ids_cache,
+                    leiden_params=dict(leiden_params),
+                    clustering_mode="local",
+                )
+            )
+        except ImportError as e:
+            logger.warning(f"Skipping clustering benchmark: {e}")
+            return stage_result(
+                self.current_size,
+                "clustering",
+                0,
+                0.0,
+                skipped=str(e),
+            )
+        duration = time.perf_counter() - start
+        return stage_result(
+            self.current_size,
+            "clustering",
+            len(relationships),
+            duration,
+            communities=num_communities,
+        )
+
+    async def run_size(self, size: int) -> list[StageResult]:
+        self.current_size = size
+        corpus = generate_corpus(
+            size, self.args.sentences_per_document, self.args.seed
+        )
+        queries = generate_queries(self.args.num_queries, self.args.seed)
+        database, results = await self.bench_startup(size)
+        try:
+            ingestion, entries = await self.bench_ingestion(database, corpus)
+            results.append(ingestion)
+            results.append(await self.bench_chunk_upsert(database, entries))
+            results.extend(await self.bench_search(database, queries))
+            if self.args.graph_documents > 0:
+                extraction, relationships = await self.bench_graph_extraction(
+                    database, entries
+                )
+                results.append(extraction)
+                results.append(
+                    await self.bench_clustering(database, relationships)
+                )
+            return results
+        finally:
+            if not self.args.keep_data:
+                await database.connection_manager.execute_query(
+                    f'DROP SCHEMA IF EXISTS "{database.project_name}" CASCADE;'
+                )
+            await database.close()
+
+    async def run(self) -> dict[str, Any]:
+        results: list[StageResult] = []
+        for size in self.args.sizes:
+            print(f"Benchmarking corpus of {size} documents...")
+            size_results = await self.run_size(size)
+            for result in size_results:
+                print(
+                    f"  {result.stage:<18} {result.operations:>8} ops "
+                    f"{result.duration_seconds:>10.3f}s "
+                    f"{result.throughput_per_second:>10.2f}/s "
+                    f"p95={result.latency_ms.get('p95', 0.0):.2f}ms"
+                )
+            results.extend(size_results)
+        return {
+            "metadata": self.metadata(),
+            "results": [asdict(result) for result in results],
+        }
+
+    def metadata(self) -> dict[str, Any]:
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": commit,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parameters": vars(self.args),
+        }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=SIZES,
+        help="Comma separated corpus sizes, in documents",
+    )
+    parser.add_argument("--output", help="Write JSON results to this path")
+    parser.add_argument("--dimension", type=int, default=DIMENSION)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--chunk-overlap", type=int, default=CHUNK_OVERLAP)
+    parser.add_argument(
+        "--sentences-per-document", type=int, default=SENTENCES_PER_DOCUMENT
+    )
+    parser.add_argument(
+        "--embedding-batch-size", type=int, default=EMBEDDING_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--upsert-batch-size", type=int, default=UPSERT_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--ingestion-concurrency", type=int, default=INGESTION_CONCURRENCY
+    )
+    parser.add_argument("--num-queries", type=int, default=NUM_QUERIES)
+    parser.add_argument("--search-limit", type=int, default=SEARCH_LIMIT)
+    parser.add_argument(
+        "--graph-documents",
+        type=int,
+        default=GRAPH_DOCUMENTS,
+        help="Documents to run graph extraction on, 0 to skip graph stages",
+    )
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=LLM_LATENCY_SECONDS,
+        help="Seconds the stand-in LLM waits before each completion",
+    )
+    parser.add_argument(
+        "--embedding-latency",
+        type=float,
+        default=EMBEDDING_LATENCY_SECONDS,
+        help="Seconds the stand-in embedder waits before each request",
+    )
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--project-prefix", default="r2r_benchmark")
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Keep the benchmark schemas instead of dropping them",
+    )
+    return parser.parse_args()
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args()
+    report = asyncio.run(Benchmark(args).run())
+    serialized = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(serialized)
+        print(f"Results written to {args.output}")
+    else:
+        print(serialized)
+
+
+if __name__ == "__main__":
+    main()
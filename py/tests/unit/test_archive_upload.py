@@ -0,0 +1,47 @@
+import io
+import zipfile
+
+import pytest
+
+from core.base import R2RException
+from core.main.api.v3.documents_router import DocumentsRouter
+
+
+def make_zip(files: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def read(content: bytes, max_entries=10, max_total_size=1024):
+    return DocumentsRouter._read_archive(
+        "docs.zip",
+        content,
+        max_entries=max_entries,
+        max_total_size=max_total_size,
+    )
+
+
+def test_files_are_read_and_hidden_ones_skipped():
+    content = make_zip({"a.txt": b"alpha", ".hidden/b.txt": b"beta"})
+
+    assert read(content) == [("a.txt", b"alpha")]
+
+
+def test_too_many_files_are_rejected():
+    content = make_zip({f"{i}.txt": b"x" for i in range(3)})
+
+    with pytest.raises(R2RException) as e:
+        read(content, max_entries=2)
+    assert e.value.status_code == 400
+
+
+def test_a_highly_compressed_archive_is_rejected_before_extraction():
+    # Deflates to about 1KB, but expands far beyond the limit
+    content = make_zip({"bomb.txt": b"\0" * 1024 * 1024})
+
+    with pytest.raises(R2RException) as e:
+        read(content, max_total_size=64 * 1024)
+    assert e.value.status_code == 413
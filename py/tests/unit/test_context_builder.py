@@ -0,0 +1,120 @@
+import json
+import uuid
+
+from shared.abstractions.search import (
+    AggregateSearchResult,
+    ChunkSearchResult,
+    GraphSearchResult,
+    KGEntityResult,
+)
+from shared.utils.context_builder import ContextBuilder
+
+DOCUMENT_ID = uuid.uuid4()
+
+
+def make_chunk(text: str, document_id: uuid.UUID = DOCUMENT_ID):
+    return ChunkSearchResult(
+        id=uuid.uuid4(),
+        document_id=document_id,
+        owner_id=None,
+        collection_ids=[],
+        score=1.0,
+        text=text,
+        metadata={},
+    )
+
+
+def word_count(text: str) -> int:
+    return len(text.split())
+
+
+def test_rrf_prefers_results_ranked_by_several_queries():
+    first, second, third = (
+        make_chunk(f"chunk {name}", uuid.uuid4())
+        for name in ("first", "second", "third")
+    )
+    builder = ContextBuilder(token_counter=word_count, max_tokens=3)
+    builder.add_results(
+        "", AggregateSearchResult(chunk_search_results=[first, second])
+    )
+    builder.add_results(
+        "", AggregateSearchResult(chunk_search_results=[third, second])
+    )
+
+    result = builder.build()
+
+    # `second` is ranked by both queries, so it outscores the results that
+    # only one query returned first and is the one that fits the budget
+    assert result.included == [2]
+    assert "[2]: chunk second" in result.context
+    assert {item["source"] for item in result.dropped} == {1, 3}
+
+
+def test_overlapping_chunks_of_a_document_are_trimmed():
+    shared_text = "the overlap between these two adjacent chunks is long"
+    earlier = make_chunk(f"Beginning of the document. {shared_text}")
+    later = make_chunk(f"{shared_text} and the end of the document.")
+    contained = make_chunk("Beginning of the document.")
+    builder = ContextBuilder(token_counter=word_count)
+    builder.add_results(
+        "",
+        AggregateSearchResult(
+            chunk_search_results=[earlier, later, contained]
+        ),
+    )
+
+    result = builder.build()
+
+    assert result.included == [1, 2]
+    assert "[2]: and the end of the document." in result.context
+    assert result.deduplicated == [
+        {"source": 3, "key": f"chunk:{contained.id}"}
+    ]
+
+
+def test_results_beyond_the_budget_are_dropped():
+    chunks = [
+        make_chunk(f"result number {i} " * 5, uuid.uuid4()) for i in range(5)
+    ]
+    builder = ContextBuilder(token_counter=word_count, max_tokens=40)
+    builder.add_results("", AggregateSearchResult(chunk_search_results=chunks))
+
+    result = builder.build()
+
+    assert result.included == [1, 2]
+    assert [item["source"] for item in result.dropped] == [3, 4, 5]
+    assert result.total_tokens <= 40
+    assert "[3]:" not in result.context
+
+    # The report is returned with RAG and agent responses, and streamed
+    report = json.loads(json.dumps(result.as_dict()))
+    assert report["token_budget"] == 40
+    assert report["included"] == [1, 2]
+    assert [item["source"] for item in report["dropped"]] == [3, 4, 5]
+
+
+def test_agent_style_matches_the_search_result_formatter():
+    entity = GraphSearchResult(
+        content=KGEntityResult(name="Aristotle", description="Philosopher"),
+        metadata={"document": "ethics"},
+    )
+    builder = ContextBuilder(style="agent")
+    builder.add_results(
+        "",
+        AggregateSearchResult(
+            chunk_search_results=[make_chunk("Some text")],
+            graph_search_results=[entity],
+        ),
+    )
+
+    assert builder.build().context == (
+        "Vector Search Results:\n"
+        "Source [1]:\n"
+        "Some text\n"
+        "KG Search Results:\n"
+        "Source [2]:\n"
+        "Name: Aristotle\n"
+        "Description: Philosopher\n"
+        "Metadata:\n"
+        "- document: ethics"
+    )
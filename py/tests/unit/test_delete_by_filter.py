@@ -0,0 +1,138 @@
+import uuid
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from core.base import VectorQuantizationType
+from core.database.chunks import PostgresChunksHandler
+from core.main.services.management_service import ManagementService
+
+DOCUMENT_ID = uuid.uuid4()
+
+
+def test_document_level_filters_are_translated():
+    filters = {
+        "$and": [
+            {"document_id": {"$eq": str(DOCUMENT_ID)}},
+            {"$or": [{"owner_id": {"$eq": "u"}}, {"collection_ids": {}}]},
+        ]
+    }
+
+    assert PostgresChunksHandler._to_document_filters(filters) == {
+        "$and": [
+            {"id": {"$eq": str(DOCUMENT_ID)}},
+            {"$or": [{"owner_id": {"$eq": "u"}}, {"collection_ids": {}}]},
+        ]
+    }
+
+
+def test_chunk_level_filters_are_not_translated():
+    for filters in (
+        {"id": {"$eq": str(uuid.uuid4())}},
+        {"metadata.topic": {"$eq": "physics"}},
+        {"$and": [{"owner_id": {"$eq": "u"}}, {"topic": "physics"}]},
+    ):
+        assert PostgresChunksHandler._to_document_filters(filters) is None
+
+
+def make_chunks_handler(conn) -> PostgresChunksHandler:
+    @asynccontextmanager
+    async def get_connection():
+        yield conn
+
+    connection_manager = MagicMock()
+    connection_manager.pool.get_connection = get_connection
+    return PostgresChunksHandler(
+        project_name="test",
+        connection_manager=connection_manager,
+        dimension=4,
+        quantization_type=VectorQuantizationType.FP32,
+    )
+
+
+def make_connection(remaining: bool):
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    conn = MagicMock()
+    conn.transaction = transaction
+    conn.fetch = AsyncMock(
+        return_value=[{"document_id": DOCUMENT_ID, "count": 2}]
+    )
+    conn.fetchval = AsyncMock(return_value=remaining)
+    return conn
+
+
+async def test_chunk_level_deletes_keep_the_documents():
+    handler = make_chunks_handler(make_connection(remaining=False))
+    handler._purge_empty_documents = AsyncMock()  # type: ignore
+
+    result = await handler.delete_by_filter({"metadata.topic": "physics"})
+
+    handler._purge_empty_documents.assert_not_awaited()
+    assert result == {
+        "chunks_deleted": 2,
+        "document_ids": [],
+        "has_more": False,
+    }
+
+
+async def test_locked_matches_count_as_remaining():
+    # The delete skipped locked rows, but they still match
+    handler = make_chunks_handler(make_connection(remaining=True))
+
+    result = await handler.delete_by_filter(
+        {"metadata.topic": "physics"}, batch_size=100
+    )
+
+    assert result["has_more"] is True
+
+
+def make_management_service(results) -> ManagementService:
+    service = ManagementService.__new__(ManagementService)
+    service.DELETE_LOCKED_INTERVAL = 0
+    service.providers = SimpleNamespace(
+        database=SimpleNamespace(
+            chunks_handler=SimpleNamespace(
+                delete_by_filter=AsyncMock(side_effect=results)
+            )
+        )
+    )
+    return service
+
+
+async def test_remaining_batches_are_deleted_until_none_match():
+    service = make_management_service(
+        [
+            {"chunks_deleted": 10, "document_ids": [], "has_more": True},
+            # Everything left is locked, so nothing is deleted this time
+            {"chunks_deleted": 0, "document_ids": [], "has_more": True},
+            {
+                "chunks_deleted": 3,
+                "document_ids": [DOCUMENT_ID],
+                "has_more": False,
+            },
+        ]
+    )
+
+    await service._delete_remaining({"owner_id": {"$eq": "u"}})
+
+    assert (
+        service.providers.database.chunks_handler.delete_by_filter.await_count
+        == 3
+    )
+
+
+async def test_deletion_stops_when_matches_stay_locked():
+    service = make_management_service(
+        [{"chunks_deleted": 0, "document_ids": [], "has_more": True}] * 100
+    )
+    service.DELETE_LOCKED_ATTEMPTS = 2
+
+    await service._delete_remaining({"owner_id": {"$eq": "u"}})
+
+    assert (
+        service.providers.database.chunks_handler.delete_by_filter.await_count
+        == 3
+    )
@@ -0,0 +1,121 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from core.base import DocumentResponse, DocumentType
+from core.main.services.ingestion_service import IngestionService
+
+SOURCE_ID = uuid.uuid4()
+
+
+def make_document(title: str, document_type=DocumentType.PDF):
+    return DocumentResponse(
+        id=uuid.uuid4(),
+        collection_ids=[],
+        owner_id=uuid.uuid4(),
+        document_type=document_type,
+        metadata={},
+        title=title,
+        version="v0",
+        size_in_bytes=10,
+    )
+
+
+def make_service() -> IngestionService:
+    service = IngestionService.__new__(IngestionService)
+    service.config = SimpleNamespace(
+        ingestion=SimpleNamespace(
+            deduplicate_files=True,
+            skip_document_summary=False,
+            chunks_for_document_summary=2,
+            document_summary_system_prompt="default_system",
+            document_summary_task_prompt="default_summary",
+            document_summary_model="openai/gpt-4o-mini",
+        )
+    )
+    documents_handler = MagicMock()
+    documents_handler.set_content_hash = AsyncMock()
+    documents_handler.get_document_by_content_hash = AsyncMock(
+        return_value={
+            "id": SOURCE_ID,
+            "title": "report.pdf",
+            "metadata": {},
+            "summary": "source summary",
+            "summary_embedding": [1.0],
+        }
+    )
+    chunks_handler = MagicMock()
+    chunks_handler.copy_document_chunks = AsyncMock(return_value=3)
+    chunks_handler.list_document_chunks = AsyncMock(
+        return_value={"results": [{"text": "first"}, {"text": "second"}]}
+    )
+    prompts_handler = MagicMock()
+    prompts_handler.get_message_payload = AsyncMock(return_value=[])
+    llm = MagicMock()
+    llm.aget_completion = AsyncMock(
+        return_value=SimpleNamespace(
+            choices=[
+                SimpleNamespace(message=SimpleNamespace(content="new summary"))
+            ]
+        )
+    )
+    embedding = MagicMock()
+    embedding.config = SimpleNamespace(base_model="model", base_dimension=4)
+    embedding.async_get_embedding = AsyncMock(return_value=[2.0])
+    ingestion = MagicMock()
+    ingestion.config.model_dump = MagicMock(return_value={"chunk_size": 1})
+    service.providers = SimpleNamespace(
+        database=SimpleNamespace(
+            documents_handler=documents_handler,
+            chunks_handler=chunks_handler,
+            prompts_handler=prompts_handler,
+        ),
+        llm=llm,
+        embedding=embedding,
+        ingestion=ingestion,
+    )
+    service.update_document_status = AsyncMock()  # type: ignore
+    return service
+
+
+async def test_duplicate_with_the_same_title_reuses_the_summary():
+    service = make_service()
+    document = make_document("report.pdf")
+
+    assert await service.ingest_duplicate_file(
+        document, {"content_hash": "abc"}, {}
+    )
+
+    assert document.summary == "source summary"
+    assert document.summary_embedding == [1.0]
+    # Documents of every user are candidates
+    lookup = (
+        service.providers.database.documents_handler.get_document_by_content_hash
+    )
+    lookup.assert_awaited_once_with(
+        lookup.await_args.args[0], exclude_id=document.id
+    )
+
+
+async def test_duplicate_with_another_title_summarizes_the_copied_chunks():
+    service = make_service()
+    document = make_document("renamed.pdf")
+
+    assert await service.ingest_duplicate_file(
+        document, {"content_hash": "abc"}, {}
+    )
+
+    assert document.summary == "new summary"
+    assert document.summary_embedding == [2.0]
+    task_inputs = service.providers.database.prompts_handler.get_message_payload.await_args.kwargs[
+        "task_inputs"
+    ]
+    assert task_inputs["document"].endswith("Document Text:\nfirstsecond")
+
+
+def test_content_hash_depends_on_the_document_type():
+    service = make_service()
+
+    assert service._get_content_hash(
+        "abc", DocumentType.PDF, {}
+    ) != service._get_content_hash("abc", DocumentType.TXT, {})
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from core.base.providers.embedding import EmbeddingMicroBatcher
+
+
+class FakeProvider:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.calls: list[list[str]] = []
+
+    async def execute(self, task: dict) -> list[list[float]]:
+        self.calls.append(task["texts"])
+        if self.error is not None:
+            raise self.error
+        if "bad" in task["texts"]:
+            raise ValueError(
+                "Input is too long for the model's context length"
+            )
+        return [[float(len(text))] for text in task["texts"]]
+
+
+def make_batcher(provider: FakeProvider) -> EmbeddingMicroBatcher:
+    return EmbeddingMicroBatcher(provider.execute, batch_size=8, window=0.01)
+
+
+async def embed_all(batcher: EmbeddingMicroBatcher, *requests: list[str]):
+    return await asyncio.gather(
+        *(batcher.embed(texts, "base", "index") for texts in requests),
+        return_exceptions=True,
+    )
+
+
+async def test_concurrent_requests_share_a_call():
+    provider = FakeProvider()
+
+    results = await embed_all(make_batcher(provider), ["a"], ["bb", "ccc"])
+
+    assert provider.calls == [["a", "bb", "ccc"]]
+    assert results == [[[1.0]], [[2.0], [3.0]]]
+
+
+async def test_an_input_error_only_fails_its_caller():
+    provider = FakeProvider()
+
+    good, bad = await embed_all(make_batcher(provider), ["a"], ["bad"])
+
+    assert provider.calls == [["a", "bad"], ["a"], ["bad"]]
+    assert good == [[1.0]]
+    assert isinstance(bad, ValueError)
+
+
+async def test_other_errors_fail_every_caller_without_retrying():
+    error = RuntimeError("Service unavailable")
+    provider = FakeProvider(error)
+
+    results = await embed_all(make_batcher(provider), ["a"], ["b"])
+
+    assert provider.calls == [["a", "b"]]
+    assert results == [error, error]
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("This model's maximum context length is 8192 tokens", True),
+        ("Rate limit reached", False),
+        ("Invalid API key", False),
+    ],
+)
+def test_input_errors_are_recognized(message, expected):
+    error = RuntimeError(message)
+
+    assert EmbeddingMicroBatcher._is_input_error(error) is expected
@@ -0,0 +1,49 @@
+import asyncio
+
+from core.utils.log_tailer import LogTailer
+
+
+async def next_text(queue: asyncio.Queue[str]) -> str:
+    return await asyncio.wait_for(queue.get(), timeout=5)
+
+
+async def unsubscribe(tailer: LogTailer, queue: asyncio.Queue[str]) -> None:
+    task = tailer._task
+    tailer.unsubscribe(queue)
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_subscribers_receive_new_lines(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("old line\n")
+    tailer = LogTailer(path, poll_interval=0.01)
+
+    _, queue = tailer.subscribe()
+    assert await next_text(queue) == "old line\n"
+
+    with path.open("a") as f:
+        f.write("new line\npartial")
+    assert await next_text(queue) == "new line\n"
+
+    await unsubscribe(tailer, queue)
+
+
+async def test_resubscribing_starts_from_the_end_of_the_file(tmp_path):
+    path = tmp_path / "app.log"
+    path.write_text("first\n")
+    tailer = LogTailer(path, backlog_bytes=8, poll_interval=0.01)
+
+    _, queue = tailer.subscribe()
+    assert await next_text(queue) == "first\n"
+    await unsubscribe(tailer, queue)
+
+    # Written while nobody is subscribed, far more than the backlog
+    with path.open("a") as f:
+        f.write("".join(f"line {i}\n" for i in range(100)))
+
+    _, queue = tailer.subscribe()
+    # Only the last complete line within `backlog_bytes` is replayed
+    assert await next_text(queue) == "line 99\n"
+    assert list(tailer.backlog) == ["line 99\n"]
+
+    await unsubscribe(tailer, queue)
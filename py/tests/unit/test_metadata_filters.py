@@ -0,0 +1,77 @@
+import json
+from unittest.mock import MagicMock
+
+from core.base import VectorQuantizationType
+from core.database.chunks import PostgresChunksHandler
+
+
+def make_handler() -> PostgresChunksHandler:
+    return PostgresChunksHandler(
+        project_name="test",
+        connection_manager=MagicMock(),
+        dimension=4,
+        quantization_type=VectorQuantizationType.FP32,
+        metadata_indexes={"published": "timestamp"},
+    )
+
+
+def plan(filters: dict) -> tuple[str, list]:
+    parameters: list = []
+    sql = make_handler()._build_filters(filters, parameters)
+    return sql, parameters
+
+
+def test_equality_uses_containment():
+    sql, parameters = plan({"metadata.topic": "physics"})
+
+    assert sql == "metadata @> $1::jsonb"
+    assert json.loads(parameters[0]) == {"topic": "physics"}
+
+
+def test_in_matches_numbers_and_their_text():
+    sql, parameters = plan({"year": {"$in": ["2020", 2021, "draft"]}})
+
+    assert sql.count("metadata @> ") == len(parameters) == 5
+    assert [json.loads(p)["year"] for p in parameters] == [
+        "2020",
+        2020,
+        2021,
+        "2021",
+        "draft",
+    ]
+
+
+def test_in_beyond_the_containment_limit_compares_text():
+    values = list(
+        range(PostgresChunksHandler.METADATA_IN_CONTAINMENT_LIMIT + 1)
+    )
+
+    sql, parameters = plan({"page": {"$in": values}})
+
+    assert sql == "(metadata->>'page')::text = ANY($1::text[])"
+    assert parameters == [[str(value) for value in values]]
+
+
+def test_range_on_an_indexed_key_uses_the_index_expression():
+    sql, parameters = plan({"published": {"$gte": "2024-01-01T00:00:00Z"}})
+
+    assert sql == (
+        "test.metadata_timestamp(metadata->'published') >= $1::text::timestamptz"
+    )
+    assert parameters == ["2024-01-01T00:00:00Z"]
+
+
+def test_range_on_another_key_casts_the_value():
+    sql, _ = plan({"score": {"$lt": 3}})
+
+    assert sql == "(metadata->'score')::float < ($1::jsonb)::float"
+
+
+def test_metadata_index_names_do_not_collide():
+    names = {
+        PostgresChunksHandler._get_metadata_index_name(key, "number")
+        for key in ("a-b", "a_b", "A_B")
+    }
+
+    assert len(names) == 3
+    assert all(len(name) <= 63 for name in names)
@@ -0,0 +1,82 @@
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from core.base import Message
+from core.base.agent import AgentConfig
+from core.main.services.retrieval_service import RetrievalService
+from shared.api.models.management.responses import MessageResponse
+
+
+def make_message(content: str) -> MessageResponse:
+    return MessageResponse(
+        id=uuid.uuid4(),
+        message=Message(role="user", content=content),
+    )
+
+
+def make_service(conversations_handler) -> RetrievalService:
+    service = RetrievalService.__new__(RetrievalService)
+    service._history_summary_tasks = {}
+    service.config = SimpleNamespace(
+        agent=AgentConfig(
+            history_token_budget=16,
+            summarize_history=True,
+        )
+    )
+    llm = MagicMock()
+    llm.count_tokens = lambda text, model: len(text.split())
+    llm.aget_completion = AsyncMock(
+        return_value=SimpleNamespace(
+            choices=[
+                SimpleNamespace(message=SimpleNamespace(content="new summary"))
+            ]
+        )
+    )
+    prompts_handler = MagicMock()
+    prompts_handler.get_message_payload = AsyncMock(return_value=[])
+    service.providers = SimpleNamespace(
+        llm=llm,
+        database=SimpleNamespace(
+            conversations_handler=conversations_handler,
+            prompts_handler=prompts_handler,
+        ),
+    )
+    return service
+
+
+async def test_over_budget_history_is_summarized():
+    conversation_id = uuid.uuid4()
+    older = [make_message("first"), make_message("second")]
+    recent = [make_message("third"), make_message("fourth")]
+
+    conversations_handler = MagicMock()
+    conversations_handler.get_recent_messages = AsyncMock(
+        return_value=(recent, True)
+    )
+    conversations_handler.get_conversation_summary = AsyncMock(
+        return_value=("old summary", None)
+    )
+    conversations_handler.get_conversation = AsyncMock(return_value=older)
+    conversations_handler.update_conversation_summary = AsyncMock()
+    service = make_service(conversations_handler)
+
+    messages, ids = await service._load_conversation_history(conversation_id)
+
+    assert messages[0].role == "system"
+    assert "old summary" in messages[0].content
+    assert [m.content for m in messages[1:]] == ["third", "fourth"]
+    assert ids == [m.id for m in recent]
+
+    await asyncio.gather(*service._history_summary_tasks.values())
+
+    conversations_handler.get_conversation.assert_awaited_once_with(
+        conversation_id,
+        after=None,
+        before=recent[0].id,
+        limit=64,
+    )
+    conversations_handler.update_conversation_summary.assert_awaited_once_with(
+        conversation_id, "new summary", older[-1].id
+    )
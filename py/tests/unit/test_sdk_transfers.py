@@ -0,0 +1,113 @@
+import httpx
+import pytest
+
+from sdk.async_client import R2RAsyncClient
+from shared.abstractions import R2RException
+
+CONTENT = b"0123456789"
+ETAG = '"v1"'
+
+
+def make_client(handler) -> R2RAsyncClient:
+    return R2RAsyncClient(
+        custom_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ),
+        retry_backoff=0,
+    )
+
+
+def serve_file(request: httpx.Request) -> httpx.Response:
+    range_header = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if range_header and if_range == ETAG:
+        start = int(range_header.split("=")[1].rstrip("-"))
+        return httpx.Response(
+            206,
+            content=CONTENT[start:],
+            headers={
+                "ETag": ETAG,
+                "Content-Range": f"bytes {start}-{len(CONTENT) - 1}/{len(CONTENT)}",
+            },
+        )
+    return httpx.Response(200, content=CONTENT, headers={"ETag": ETAG})
+
+
+@pytest.mark.parametrize(
+    "method, status, attempts",
+    [
+        ("POST", 503, 4),
+        ("POST", 502, 1),
+        ("POST", 504, 1),
+        ("GET", 502, 4),
+    ],
+)
+async def test_gateway_errors_are_only_retried_when_idempotent(
+    method, status, attempts
+):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(status)
+
+    client = make_client(handler)
+
+    response = await client._send(method, "http://test/v3/x", {})
+
+    assert response.status_code == status
+    assert len(calls) == attempts
+
+
+async def test_resume_continues_an_unchanged_file(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(CONTENT[:4])
+    (tmp_path / "file.bin.etag").write_text(ETAG)
+    client = make_client(serve_file)
+
+    size = await client.documents.download_to_file(
+        "id", str(path), resume=True
+    )
+
+    assert size == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    assert not (tmp_path / "file.bin.etag").exists()
+
+
+async def test_resume_restarts_when_the_file_changed(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(b"stale")
+    (tmp_path / "file.bin.etag").write_text('"v0"')
+    client = make_client(serve_file)
+
+    await client.documents.download_to_file("id", str(path), resume=True)
+
+    assert path.read_bytes() == CONTENT
+
+
+async def test_downloads_start_over_unless_resuming(tmp_path):
+    path = tmp_path / "file.bin"
+    path.write_bytes(CONTENT[:4])
+    (tmp_path / "file.bin.etag").write_text(ETAG)
+    client = make_client(serve_file)
+
+    await client.documents.download_to_file("id", str(path))
+
+    assert path.read_bytes() == CONTENT
+
+
+async def test_a_short_download_is_an_error(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=CONTENT[:4],
+            headers={"ETag": ETAG, "Content-Range": "bytes 0-9/10"},
+        )
+
+    client = make_client(handler)
+
+    with pytest.raises(R2RException):
+        await client.documents.download_to_file(
+            "id", str(tmp_path / "file.bin")
+        )
+    assert (tmp_path / "file.bin.etag").exists()
@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from core.base import IndexArgsHNSW, IndexMethod, VectorTableName
+from core.database.chunks import PostgresChunksHandler
+
+
+def make_handler(options) -> PostgresChunksHandler:
+    handler = PostgresChunksHandler.__new__(PostgresChunksHandler)
+    handler.project_name = "test"
+    handler.connection_manager = MagicMock()
+    handler.connection_manager.fetchrow_query = AsyncMock(
+        side_effect=[
+            {
+                "method": "hnsw",
+                "column_name": "vec",
+                "ops": "vector_cosine_ops",
+                "options": options,
+            },
+            {"indisvalid": True},
+        ]
+    )
+    handler._execute_index_statement = AsyncMock()  # type: ignore
+    handler._swap_index = AsyncMock()  # type: ignore
+    return handler
+
+
+def build_statement(handler: PostgresChunksHandler) -> str:
+    return next(
+        call.args[0]
+        for call in handler._execute_index_statement.call_args_list  # type: ignore
+        if "CREATE INDEX" in call.args[0]
+    )
+
+
+async def test_rebuild_keeps_the_current_build_parameters():
+    handler = make_handler(["m=32", "ef_construction=200"])
+
+    await handler.rebuild_index("idx", VectorTableName.CHUNKS)
+
+    assert "WITH (m=32, ef_construction=200)" in build_statement(handler)
+
+
+async def test_rebuild_uses_the_build_parameters_given():
+    handler = make_handler(["m=32", "ef_construction=200"])
+
+    await handler.rebuild_index(
+        "idx",
+        VectorTableName.CHUNKS,
+        index_method=IndexMethod.hnsw,
+        index_arguments=IndexArgsHNSW(m=8, ef_construction=40),
+    )
+
+    assert "WITH (m=8, ef_construction=40)" in build_statement(handler)
+
+
+async def test_rebuild_of_an_index_without_options_keeps_none():
+    handler = make_handler(None)
+
+    await handler.rebuild_index("idx", VectorTableName.CHUNKS)
+
+    assert "WITH" not in build_statement(handler)
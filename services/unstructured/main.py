@@ -1,12 +1,13 @@
 import asyncio
 import base64
 import concurrent.futures
+import json
 import logging
 import os
 from io import BytesIO
 from typing import Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from pydantic import BaseModel
 from unstructured.partition.auto import partition
 
@@ -32,7 +33,13 @@ executor = concurrent.futures.ThreadPoolExecutor(
 
 def run_partition(file_content: str, filename: str, ingestion_config: dict) -> list[dict]:
     file_content_bytes = base64.b64decode(file_content)
-    file_io = BytesIO(file_content_bytes)
+    return run_partition_bytes(file_content_bytes, filename, ingestion_config)
+
+
+def run_partition_bytes(
+    file_content: bytes, filename: Optional[str], ingestion_config: dict
+) -> list[dict]:
+    file_io = BytesIO(file_content)
     elements = partition(file=file_io, file_filename=filename, **ingestion_config)
     return [element.to_dict() for element in elements]
 
@@ -59,3 +66,30 @@ async def partition_endpoint(request: PartitionRequestModel):
     except Exception as e:
         logger.error(f"Error partitioning file: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/partition_file", response_model=PartitionResponseModel)
+async def partition_file_endpoint(
+    file: UploadFile = File(...),
+    ingestion_config: str = Form("{}"),
+    filename: Optional[str] = Form(None),
+):
+    """Partition a file uploaded as multipart form data."""
+    try:
+        file_content = await file.read()
+        logger.info(
+            f"Partitioning request received for {filename or file.filename} ({len(file_content)} bytes)"
+        )
+        loop = asyncio.get_event_loop()
+        elements = await loop.run_in_executor(
+            executor,
+            run_partition_bytes,
+            file_content,
+            filename or file.filename,
+            json.loads(ingestion_config),
+        )
+        logger.info("Partitioning completed")
+        return PartitionResponseModel(elements=elements)
+    except Exception as e:
+        logger.error(f"Error partitioning file: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))